@@ -0,0 +1,86 @@
+import os
+
+import matplotlib.pyplot as plt
+
+from vigapp.graphics.utilities import (
+    distribute_x,
+    exportar_cortes_a_dxf,
+    layer_positions_bottom,
+    layer_positions_top,
+)
+from vigapp.models.constants import DIAM_CM
+from vigapp.models.shear_design import shear_design
+
+
+def _sections(schedule):
+    """Return three DXF section dicts per beam of ``schedule``."""
+    d_top, d_bot = DIAM_CM['3/4"'], DIAM_CM['5/8"']
+    layers_top = {1: [(d_top, '3/4"')] * 3}
+    layers_bot = {1: [(d_bot, '5/8"')] * 3}
+    out = []
+    for i in range(schedule["n"]):
+        b, h, r = schedule["b"][i], schedule["h"][i], schedule["r"][i]
+        y_top = layer_positions_top(layers_top, r, 0.95, h)[1]
+        y_bot = layer_positions_bottom(layers_bot, r, 0.95)[1]
+        bars = [
+            {"x": x, "y": y_top, "diam": d_top, "label": '3/4"', "face": "neg"}
+            for x in distribute_x([d_top] * 3, b, r, 0.95)
+        ] + [
+            {"x": x, "y": y_bot, "diam": d_bot, "label": '5/8"', "face": "pos"}
+            for x in distribute_x([d_bot] * 3, b, r, 0.95)
+        ]
+        for name in ("M1", "M2", "M3"):
+            out.append(
+                {"b": b, "h": h, "r": r, "estribo_diam": 0.95, "bars": bars, "nombre": name}
+            )
+    return out
+
+
+def test_exportar_cortes_a_dxf(benchmark, small_schedule, tmp_path):
+    secciones = _sections(small_schedule)
+    path = str(tmp_path / "cortes.dxf")
+    benchmark(exportar_cortes_a_dxf, secciones, path)
+    assert os.path.getsize(path) > 0
+
+
+def test_generate_shear_pdf(benchmark, tmp_path):
+    from vigapp.pdf_engine.shear_report import generate_shear_pdf
+
+    result = shear_design(
+        Vu=18.0, Ln=5.0, d=44.0, b=30.0, h=50.0, fc=210.0, fy=4200.0,
+        stirrup_diam='3/8"', phi_long=1.59,
+    )
+    fig, ax = plt.subplots(figsize=(8, 3))
+    ax.plot([0, 5], [18, -18])
+    fig_path = str(tmp_path / "shear_plot.png")
+    fig.savefig(fig_path)
+    plt.close(fig)
+    data = {"b (cm)": 30, "h (cm)": 50, "d (cm)": 44, "Vu (T)": 18.0}
+    out = str(tmp_path / "reporte_cortante.pdf")
+    benchmark(generate_shear_pdf, data, result, fig_path, out)
+
+
+def test_generar_reporte_html(benchmark, design_window, tmp_path, monkeypatch):
+    import reporte_flexion_html
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(reporte_flexion_html.subprocess, "run", lambda *a, **k: None)
+    monkeypatch.setattr(reporte_flexion_html.webbrowser, "open", lambda *a, **k: None)
+
+    _, data = design_window._build_memoria()
+    datos = {k: v for k, v in data.get("data_section", [])}
+    calc_sections = data.get("calc_sections", [])
+    resultados = {
+        key: {"general": sec[1][0].strip("$") if sec[1] else ""}
+        for key, sec in zip(["peralte", "b1", "pbal", "pmax", "as_min", "as_max"], calc_sections)
+    }
+    args = (
+        datos,
+        resultados,
+        data.get("verif_table", []),
+        data.get("images", []),
+        data.get("section_img"),
+        calc_sections[6:],
+    )
+    benchmark(reporte_flexion_html.generar_reporte_html, *args)
+    assert os.path.isfile(os.path.join("html_report", "reporte_flexion.html"))
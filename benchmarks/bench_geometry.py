@@ -0,0 +1,41 @@
+from vigapp.graphics.utilities import (
+    distribute_x,
+    layer_positions_bottom,
+    layer_positions_top,
+)
+from vigapp.models.constants import DIAM_CM
+
+LAYERS = {
+    1: [(DIAM_CM['3/4"'], '3/4"')] * 2 + [(DIAM_CM['5/8"'], '5/8"')] * 2,
+    2: [(DIAM_CM['5/8"'], '5/8"')] * 2,
+}
+
+
+def test_distribute_x(benchmark, schedule):
+    s = schedule
+    diams = [d for d, _ in LAYERS[1]]
+
+    def run():
+        return [distribute_x(diams, s["b"][i], s["r"][i], 0.95) for i in range(s["n"])]
+
+    benchmark(run)
+
+
+def test_layer_positions(benchmark, schedule):
+    s = schedule
+
+    def run():
+        return [
+            (
+                layer_positions_bottom(LAYERS, s["r"][i], 0.95),
+                layer_positions_top(LAYERS, s["r"][i], 0.95, s["h"][i]),
+            )
+            for i in range(s["n"])
+        ]
+
+    benchmark(run)
+
+
+def test_calc_effective_depth(benchmark, design_window):
+    d = benchmark(design_window.calc_effective_depth)
+    assert 0 < d < 50
@@ -0,0 +1,42 @@
+import matplotlib.pyplot as plt
+import pytest
+
+from vigapp.ui.design import plot_design, plot_required
+
+
+@pytest.fixture
+def axes():
+    fig, ax = plt.subplots()
+    yield ax
+    plt.close(fig)
+
+
+def test_plot_required(benchmark, axes):
+    def run():
+        plot_required(axes, [12.0, 6.0, 14.0], [6.0, 9.0, 7.0])
+        axes.figure.canvas.draw()
+
+    benchmark(run)
+
+
+def test_plot_design(benchmark, axes):
+    areas = [12.0, 6.0, 14.0, 6.0, 9.0, 7.0]
+    statuses = ["OK", "OK", "NO OK", "OK", "OK", "OK"]
+
+    def run():
+        plot_design(axes, areas, statuses)
+        axes.figure.canvas.draw()
+
+    benchmark(run)
+
+
+def test_design_redraw(benchmark, design_window):
+    benchmark(design_window._redraw)
+
+
+def test_view3d_draw_views(benchmark, design_window):
+    from vigapp.ui.view3d_window import View3DWindow
+
+    view = View3DWindow(design_window, show_window=False)
+    benchmark(view.draw_views)
+    view.close()
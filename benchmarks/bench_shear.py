@@ -0,0 +1,34 @@
+from vigapp.models.shear_design import shear_design
+
+
+def test_shear_design(benchmark, schedule):
+    s = schedule
+
+    def run():
+        return [
+            shear_design(
+                Vu=s["vu"][i],
+                Ln=s["ln"][i],
+                d=s["d"][i],
+                b=s["b"][i],
+                h=s["h"][i],
+                fc=s["fc"][i],
+                fy=s["fy"][i],
+                stirrup_diam='3/8"',
+                phi_long=1.59,
+            )
+            for i in range(s["n"])
+        ]
+
+    assert len(benchmark(run)) == s["n"]
+
+
+def test_shear_design_batch(benchmark, schedule):
+    from vigapp.models.shear_design import shear_design_batch
+
+    s = schedule
+    res = benchmark(
+        shear_design_batch, s["vu"], s["ln"], s["d"], s["b"], s["h"], s["fc"],
+        fy=s["fy"], phi_long=1.59,
+    )
+    assert len(res) == s["n"]
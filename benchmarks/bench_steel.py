@@ -0,0 +1,70 @@
+import numpy as np
+
+from vigapp.models.moments import correct_moments
+from vigapp.ui.design import calc_as_limits, calc_as_req
+
+
+def test_calc_as_req_scalar(benchmark):
+    benchmark(calc_as_req, 20.0, 210.0, 30.0, 44.0, 4200.0, 0.9)
+
+
+def test_calc_as_req_loop(benchmark, schedule):
+    s = schedule
+    moments = np.hstack([s["mn"], s["mp"]])
+
+    def run():
+        return [
+            calc_as_req(m, s["fc"][i], s["b"][i], s["d"][i], s["fy"][i], 0.9)
+            for i, row in enumerate(moments)
+            for m in row
+        ]
+
+    benchmark(run)
+
+
+def test_calc_as_req_batch(benchmark, schedule):
+    s = schedule
+    moments = np.hstack([s["mn"], s["mp"]])
+    col = lambda k: s[k][:, None]
+    result = benchmark(calc_as_req, moments, col("fc"), col("b"), col("d"), col("fy"), 0.9)
+    assert result.shape == moments.shape
+
+
+def test_calc_as_limits(benchmark, schedule):
+    s = schedule
+    benchmark(calc_as_limits, s["fc"], s["fy"], s["b"], s["d"])
+
+
+def test_correct_moments(benchmark, schedule):
+    benchmark(correct_moments, schedule["mn"], schedule["mp"], "dual2")
+
+
+def test_sweep_sections_grid(benchmark):
+    from vigapp.models.sweep import sweep_sections
+
+    b = np.linspace(20.0, 60.0, 100)
+    h = np.linspace(30.0, 90.0, 100)
+    fc = [175.0, 210.0, 280.0, 350.0, 420.0]
+    result = benchmark(sweep_sections, [-20.0, -10.0, -25.0], [10.0, 15.0, 8.0], b, h, fc, Vu=20.0)
+    assert result.shape == (100, 100, 5, 4)
+
+
+def test_load_combinations(benchmark, schedule):
+    from vigapp.models.load_combos import combine
+
+    rng = np.random.default_rng(9)
+    n = schedule["n"]
+    moments = rng.normal(size=(n, 4, 3)) * 10
+    shears = rng.normal(size=(n, 4, 3)) * 5
+    env = benchmark(combine, moments, shears)
+    assert env.mn.shape == (n, 3)
+
+
+def test_nominal_moment_batch(benchmark, schedule):
+    from vigapp.models.section_analysis import nominal_moment
+
+    s = schedule
+    depth = np.column_stack([s["d"], s["d"] - 4.0, np.full(s["n"], 6.0)])
+    area = np.column_stack([np.full(s["n"], 10.0), np.full(s["n"], 4.0), np.full(s["n"], 4.0)])
+    cap = benchmark(nominal_moment, s["b"], s["h"], s["fc"], s["fy"], depth, area)
+    assert cap.mn.shape == (s["n"],)
@@ -0,0 +1,89 @@
+"""Shared fixtures for the performance benchmarks."""
+
+import os
+import sys
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import numpy as np
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from vigapp.models.formula_cache import formula_cache
+
+# Number of beams of the synthetic schedules
+SIZES = (1, 100, 10000)
+
+
+@pytest.fixture(autouse=True)
+def _cache_dir(tmp_path, monkeypatch):
+    """Keep generated report images and formulas out of the user cache folder."""
+    monkeypatch.setenv("VIGAPP_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(formula_cache, "path", None)
+
+
+def make_schedule(n: int, seed: int = 60) -> dict:
+    """Return a reproducible schedule of ``n`` beams."""
+    rng = np.random.default_rng(seed)
+    b = rng.choice([25.0, 30.0, 35.0, 40.0], n)
+    h = rng.choice([40.0, 50.0, 60.0, 70.0], n)
+    r = np.full(n, 4.0)
+    d = h - 6.0
+    fc = rng.choice([210.0, 280.0], n)
+    fy = np.full(n, 4200.0)
+    scale = b * d**2 / 30 / 44**2
+    mn = -rng.uniform(4.0, 16.0, (n, 3)) * scale[:, None]
+    mp = rng.uniform(3.0, 12.0, (n, 3)) * scale[:, None]
+    ln = rng.uniform(3.0, 8.0, n)
+    vu = rng.uniform(5.0, 20.0, n) * scale
+    return {
+        "n": n,
+        "b": b,
+        "h": h,
+        "r": r,
+        "d": d,
+        "fc": fc,
+        "fy": fy,
+        "mn": mn,
+        "mp": mp,
+        "ln": ln,
+        "vu": vu,
+    }
+
+
+@pytest.fixture(params=SIZES, ids=lambda n: f"{n}vigas", scope="session")
+def schedule(request):
+    return make_schedule(request.param)
+
+
+@pytest.fixture(params=SIZES[:2], ids=lambda n: f"{n}vigas", scope="session")
+def small_schedule(request):
+    """Schedules for benchmarks that are too slow for 10,000 beams."""
+    return make_schedule(request.param)
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    from PyQt5.QtWidgets import QApplication
+
+    app = QApplication.instance() or QApplication([])
+    yield app
+
+
+@pytest.fixture(scope="session")
+def design_window(qapp):
+    """DesignWindow of a 30x50 beam with optimized reinforcement."""
+    from vigapp.ui.design_window import DesignWindow
+
+    mn = np.array([-12.0, -6.0, -14.0])
+    mp = np.array([6.0, 9.0, 7.0])
+    win = DesignWindow(mn, mp, show_window=False)
+    for key, val in (("b (cm)", "30"), ("h (cm)", "50"), ("r (cm)", "4")):
+        win.edits[key].setText(val)
+    win.optimize_rebar()
+    return win
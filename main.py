@@ -11,19 +11,31 @@ sys.path.insert(0, CURRENT_DIR)
 
 from PyQt5.QtWidgets import QApplication, QSplashScreen
 from PyQt5.QtGui import QIcon, QPixmap, QFont
-from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtCore import Qt
 
-from vigapp.ui.menu_window import MenuWindow
-from vigapp.activation.tk_dialog import run_activation
+# Only PyQt5 is imported up front; the windows load behind the splash
+from vigapp.startup import StartupPipeline
 
 # Activación de licencia y splash opcionales
 ACTIVATION_ENABLED = False
 SPLASH_ENABLED = False
 
 
+def _import_windows():
+    import vigapp.ui.menu_window  # noqa: F401  (numpy, matplotlib and all pages)
+
+
+def _hardware_id():
+    from vigapp.activation import hardware_id
+
+    hardware_id()
+
+
 def main():
     """Start the Qt application."""
     logging.basicConfig(level=logging.ERROR)
+    # Stage timings of the startup are always reported
+    logging.getLogger("vigapp.startup").setLevel(logging.INFO)
 
     app = QApplication(sys.argv)
     app.setFont(QFont("Segoe UI", 10))
@@ -32,6 +44,7 @@ def main():
         ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID("VigApp060")
 
     icon_path = os.path.join(CURRENT_DIR, "icon", "vigapp060.png")
+    pix = None
     if os.path.exists(icon_path):
         pix = QPixmap(icon_path).scaled(
             256, 256, Qt.KeepAspectRatio, Qt.SmoothTransformation)
@@ -39,25 +52,55 @@ def main():
 
     app.setStyle("Fusion")
 
-    if ACTIVATION_ENABLED and not run_activation():
-        return
-
-    if SPLASH_ENABLED:
-        splash = QSplashScreen(QPixmap(icon_path).scaled(
-            256, 256, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+    splash = None
+    if SPLASH_ENABLED and pix is not None:
+        splash = QSplashScreen(pix)
         splash.show()
+        app.processEvents()
+
+    def activation():
+        from vigapp.activation import check_activation
+
+        if check_activation():
+            return True
+        from vigapp.activation.tk_dialog import run_activation
+
+        # The Tk dialog runs its own loop; a visible splash would freeze
+        if splash is not None:
+            splash.hide()
+        ok = run_activation()
+        if ok and splash is not None:
+            splash.show()
+            app.processEvents()
+        return ok
 
-        def show_main():
-            splash.close()
-            main_win = MenuWindow()
-            main_win.show()
-            app._window = main_win
+    def show_menu():
+        from vigapp.ui.menu_window import MenuWindow
 
-        QTimer.singleShot(2000, show_main)
-    else:
         main_win = MenuWindow()
         main_win.show()
         app._window = main_win
+        if splash is not None:
+            splash.finish(main_win)
+
+    def done(ok):
+        if not ok:
+            if splash is not None:
+                splash.close()
+            app.quit()
+
+    background = [("imports", _import_windows)]
+    stages = []
+    if ACTIVATION_ENABLED:
+        # The disk query of the fingerprint overlaps the imports
+        background.append(("hardware_id", _hardware_id))
+        stages.append(("activation", activation))
+    stages.append(("menu", show_menu))
+
+    pipeline = StartupPipeline(background, stages)
+    pipeline.finished.connect(done)
+    app._startup = pipeline
+    pipeline.start()
 
     sys.exit(app.exec_())
 
@@ -2,15 +2,19 @@ import os
 import webbrowser
 from typing import Any, Dict
 
+from vigapp.sistema.artifacts import link_artifact
+from vigapp.sistema.instrumentation import timed
 
+
+@timed()
 def generar_reporte_cortante_html(datos: Dict[str, Any], result: Any, imagen: str | None = None) -> str:
     """Generate a simple HTML report for shear design."""
     os.makedirs("html_report", exist_ok=True)
 
     img_rel = None
     if imagen and os.path.isfile(imagen):
-        dst = os.path.join("html_report", os.path.basename(imagen))
-        os.replace(imagen, dst)
+        dst = os.path.join("html_report", "shear_plot.png")
+        link_artifact(imagen, dst)
         img_rel = os.path.basename(dst)
 
     html = [
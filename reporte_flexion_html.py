@@ -3,7 +3,11 @@ import subprocess
 import webbrowser
 from typing import Any, Dict, List
 
+from vigapp.sistema.artifacts import link_artifact
+from vigapp.sistema.instrumentation import timed
 
+
+@timed()
 def generar_reporte_html(
     datos: Dict[str, Any],
     resultados: Dict[str, Dict[str, Any]],
@@ -14,20 +18,19 @@ def generar_reporte_html(
 ) -> None:
     """Genera un reporte HTML profesional usando MathJax y lo abre en el navegador."""
     os.makedirs("html_report", exist_ok=True)
-    import shutil
 
     img_views: List[str] = []
     if imagenes:
         for i, path in enumerate(imagenes, 1):
             if os.path.isfile(path):
                 dst = os.path.join("html_report", f"img_view{i}.png")
-                shutil.copy(path, dst)
+                link_artifact(path, dst)
                 img_views.append(os.path.basename(dst))
 
     section_rel = None
     if seccion and os.path.isfile(seccion):
         dst = os.path.join("html_report", "img_seccion_viga.png")
-        shutil.copy(seccion, dst)
+        link_artifact(seccion, dst)
         section_rel = os.path.basename(dst)
 
     def _fmt(v: Any) -> str:
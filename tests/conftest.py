@@ -0,0 +1,17 @@
+"""Shared fixtures of the functional tests."""
+
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from vigapp.models.formula_cache import formula_cache
+
+
+@pytest.fixture(autouse=True)
+def _cache_dir(tmp_path, monkeypatch):
+    """Keep generated report images and formulas out of the user cache folder."""
+    monkeypatch.setenv("VIGAPP_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(formula_cache, "path", None)
@@ -0,0 +1,26 @@
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import vigapp.activation as activation
+
+
+def test_hardware_id_queries_disk_once(monkeypatch):
+    calls = []
+
+    def fake_serial():
+        calls.append(1)
+        return "SN123"
+
+    monkeypatch.setattr(activation, "_disk_serial", fake_serial)
+    activation._hardware_id.cache_clear()
+    try:
+        first = activation.hardware_id()
+        assert activation.machine_code() == first[:16]
+        assert activation.current_license() == activation.current_license()
+        assert activation.hardware_id() == first
+        assert len(calls) == 1
+    finally:
+        activation._hardware_id.cache_clear()
+
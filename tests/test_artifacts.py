@@ -0,0 +1,92 @@
+import os
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from vigapp.sistema.artifacts import ArtifactStore, artifact_key, link_artifact
+
+
+def _writer(calls, data=b"png"):
+    def render(path):
+        calls.append(path)
+        with open(path, "wb") as fh:
+            fh.write(data)
+
+    return render
+
+
+def test_same_parameters_render_once(tmp_path):
+    store = ArtifactStore(str(tmp_path))
+    calls = []
+    first = store.get("section", (30.0, 50.0, 4.0), _writer(calls))
+    second = store.get("section", (30.0, 50.0, 4.0), _writer(calls))
+    assert first == second and len(calls) == 1
+    assert open(first, "rb").read() == b"png"
+    other = store.get("section", (30.0, 60.0, 4.0), _writer(calls))
+    assert other != first and len(calls) == 2
+    assert not [n for n in os.listdir(tmp_path) if n.startswith(".tmp_")]
+
+
+def test_stored_images_follow_umask(tmp_path):
+    mask = os.umask(0o022)
+    try:
+        path = ArtifactStore(str(tmp_path)).put(b"abc")
+    finally:
+        os.umask(mask)
+    assert os.stat(path).st_mode & 0o777 == 0o644
+
+
+def test_default_folder_follows_cache_dir(tmp_path, monkeypatch):
+    store = ArtifactStore()
+    monkeypatch.setenv("VIGAPP_CACHE_DIR", str(tmp_path))
+    assert store.root == os.path.join(str(tmp_path), "artifacts")
+
+
+def test_key_is_deterministic():
+    assert artifact_key("k", (1.0, np.array([1.5, 2.0]))) == artifact_key("k", [1.0, [1.5, 2.0]])
+    assert artifact_key("k", (1.0,)) != artifact_key("j", (1.0,))
+    assert artifact_key("k", {"b": 1, "a": 2}) == artifact_key("k", {"a": 2, "b": 1})
+
+
+def test_put_is_content_addressed(tmp_path):
+    store = ArtifactStore(str(tmp_path))
+    assert store.put(b"abc") == store.put(b"abc")
+    assert store.put(b"abc") != store.put(b"abd")
+    assert len(os.listdir(tmp_path)) == 2
+
+
+def test_failed_render_leaves_nothing(tmp_path):
+    store = ArtifactStore(str(tmp_path))
+
+    def fail(path):
+        raise RuntimeError("boom")
+
+    try:
+        store.get("x", 1, fail)
+    except RuntimeError:
+        pass
+    assert os.listdir(tmp_path) == []
+
+
+def test_prune_removes_least_recently_used(tmp_path):
+    store = ArtifactStore(str(tmp_path), max_bytes=250)
+    paths = [store.get("img", i, _writer([], b"x" * 100)) for i in range(2)]
+    os.utime(paths[0], (1, 1))
+    os.utime(paths[1], (2, 2))
+    store.get("img", 0, _writer([]))  # hit: now the most recent
+    newest = store.get("img", 2, _writer([], b"x" * 100))
+    assert os.path.exists(paths[0]) and os.path.exists(newest)
+    assert not os.path.exists(paths[1])
+    assert store.size() <= 250
+
+
+def test_link_artifact_replaces_destination(tmp_path):
+    store = ArtifactStore(str(tmp_path / "store"))
+    src = store.put(b"image")
+    dst = str(tmp_path / "report" / "img.png")
+    link_artifact(src, dst)
+    link_artifact(src, dst)
+    assert open(dst, "rb").read() == b"image"
+    assert os.path.exists(src)
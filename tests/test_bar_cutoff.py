@@ -0,0 +1,63 @@
+import os
+import sys
+
+import numpy as np
+from scipy.interpolate import CubicSpline
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+from vigapp.models.bar_cutoff import (
+    bar_cutoffs,
+    development_length,
+    moment_envelope,
+    phi_mn,
+)
+from vigapp.ui.design import calc_as_req
+
+
+def test_envelope_matches_spline():
+    mn = np.array([[-20.0, -5.0, -18.0], [-10.0, -2.0, -12.0]])
+    mp = np.array([[8.0, 15.0, 7.0], [4.0, 9.0, 5.0]])
+    xi, neg, pos = moment_envelope(mn, mp, 51)
+    ref = CubicSpline([0, 0.5, 1.0], -mn[1])(xi)
+    assert np.allclose(neg[1], ref)
+    assert neg.shape == pos.shape == (2, 51)
+
+
+def test_phi_mn_inverts_as_req():
+    As = calc_as_req(20, 210, 30, 54, 4200, 0.9)
+    assert abs(phi_mn(As, 210, 4200, 30, 54) - 20) < 1e-6
+
+
+def test_development_length_top_factor():
+    ld_bot = development_length(1.59, 210, 4200)
+    ld_top = development_length(1.59, 210, 4200, top=True)
+    assert abs(ld_top / ld_bot - 1.3) < 1e-9
+    assert development_length(0.6, 280, 2800) >= 30.0
+
+
+def test_cutoffs_and_takeoff():
+    mn = np.array([[-20.0, -5.0, -18.0]])
+    mp = np.array([[8.0, 15.0, 7.0]])
+    res = bar_cutoffs(
+        mn, mp, 6.0, [[14, 5.2, 13]], [[6, 10, 6]],
+        30, 60, 54, 210, 4200, 1.91, 1.59,
+    )
+    # Extra top bars stop before midspan, extra bottom bars are centred
+    assert 0 < res.end[0, 0, 0] < 3.0
+    assert 3.0 < res.start[0, 0, 2] < 6.0
+    assert res.start[0, 1, 1] < 3.0 < res.end[0, 1, 1]
+    assert np.isnan(res.start[0, 0, 1])
+    # Bars never end closer than ld to the face
+    assert res.end[0, 0, 0] >= res.ld[0, 0] / 100
+    expected = (5.2 + 6.0) * 6.0 * 0.785
+    assert abs(res.kg_cont.sum() - expected) < 1e-9
+    assert res.total_kg > expected
+
+
+def test_long_beams_get_laps():
+    res = bar_cutoffs(
+        [[-20, -8, -20]], [[10, 20, 10]], 12.0, [[10, 5, 10]], [[5, 8, 5]],
+        30, 60, 54, 210, 4200, 1.59, 1.59,
+    )
+    assert np.all(res.laps == 1)
+    assert np.all(np.isfinite(res.lap_x))
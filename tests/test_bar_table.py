@@ -0,0 +1,37 @@
+import os
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+from vigapp.models.bar_table import bar_table, layer_base_width
+
+
+def test_table_sorted_by_area():
+    table = bar_table()
+    assert np.all(np.diff(table.area) >= 0)
+    assert np.allclose(table.weight, table.area * 0.785)
+
+
+def test_smallest_fits_base():
+    table = bar_table()
+    i = table.smallest(10.0, 30, 4, 0.95)
+    assert table.area[i] >= 10.0
+    assert table.min_base(4, 0.95)[i] <= 30
+    # No smaller combination fitting the base exists
+    fits = table.min_base(4, 0.95) <= 30
+    assert not np.any(fits & (table.area >= 10.0) & (table.area < table.area[i]))
+
+
+def test_smallest_many_matches_scalar():
+    table = bar_table()
+    reqs = np.array([2.0, 7.3, 15.0, 80.0])
+    many = table.smallest_many(reqs, 30, 4, 0.95)
+    for req, idx in zip(reqs, many):
+        single = table.smallest(req, 30, 4, 0.95)
+        assert (single if single is not None else -1) == idx
+
+
+def test_layer_base_width():
+    assert abs(layer_base_width(3, 3 * 1.59, 4, 0.95) - (8 + 1.9 + 5 + 4.77)) < 1e-9
+    assert layer_base_width(0, 0.0, 4, 0.95) == 2 * 4 + 2 * 0.95
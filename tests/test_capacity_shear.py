@@ -0,0 +1,47 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+from vigapp.models.capacity_shear import capacity_design, capacity_shear, end_bars
+from vigapp.models.section_analysis import nominal_moment
+
+ROWS = [
+    [(3, '5/8"', 1)],
+    [(2, '5/8"', 1)],
+    [(4, '5/8"', 1)],
+    [(2, '5/8"', 1)],
+    [(3, '5/8"', 1)],
+    [(2, '1/2"', 1)],
+]
+
+
+def test_probable_moments_and_shear():
+    depth, area = end_bars(ROWS, 50.0, 4.0, 0.95)
+    assert depth.shape == (4, 2)
+    cap = capacity_shear(30.0, 50.0, 210.0, 4200.0, depth, area, 5.0, 3.0)
+    ref = nominal_moment(30.0, 50.0, 210.0, 1.25 * 4200.0, depth[0], area[0], phi=1.0)
+    assert np.isclose(cap.mpr[0], ref.mn[0])
+    # M3- (4 bars) with M1+ controls against M1- (3 bars) with M3+ (2 of 1/2")
+    expected = (cap.mpr[1] + cap.mpr[2]) / 5.0 + 3.0 * 5.0 / 2.0
+    assert np.isclose(cap.vu, expected)
+    with pytest.raises(ValueError):
+        capacity_shear(30.0, 50.0, 210.0, 4200.0, depth, area, 0.0)
+
+
+def test_frame_in_one_pass():
+    depth, area = end_bars(ROWS, 50.0, 4.0, 0.95)
+    n = 100
+    Ln = np.linspace(3.0, 7.0, n)
+    cap = capacity_design(
+        30.0, 50.0, 210.0, 4200.0,
+        np.broadcast_to(depth, (n,) + depth.shape),
+        np.broadcast_to(area, (n,) + area.shape),
+        Ln, 44.0, 3.0, phi_long=1.59,
+    )
+    one = capacity_shear(30.0, 50.0, 210.0, 4200.0, depth, area, Ln[10], 3.0)
+    assert cap.vu.shape == (n,) and np.isclose(cap.vu[10], one.vu)
+    assert len(cap.design) == n
+    assert np.all(cap.design.phi_Vc_Vs[cap.design.ok] >= cap.vu[cap.design.ok])
@@ -0,0 +1,54 @@
+import os
+import sys
+from types import SimpleNamespace
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from docx import Document
+
+from vigapp.docx_report import BeamMemoria, write_memoria_docx
+from vigapp.graphics.formula_images import formula_png
+from vigapp.models.shear_design import ShearDesignResult
+
+
+def _flexure(d, images=()):
+    datos = (("b (cm)", "30"), ("h", "60"))
+    resultados = (
+        ("peralte", (("general", r"d = h - d_e - \frac{1}{2} d_b - r"), ("reemplazo", ""), ("resultado", f"d = {d:.2f}"))),
+        ("b1", (("general", r"\beta_1 = 0.85"), ("reemplazo", ""), ("resultado", ""))),
+    )
+    tabla = (("M1-", "5.00", "5.94", "Cumple"),)
+    dev_as = (("Calculo para M1-", (rf"$A_s^{{\text{{req}}}} = {d / 10:.2f}$",)),)
+    return datos, resultados, tabla, tuple(images), None, dev_as
+
+
+def test_many_beams_share_formula_images(tmp_path):
+    result = ShearDesignResult(
+        Vc=10.0, Vs=2.0, phi_Vc=8.5, phi_Vc_Vs=10.2, S_sc=10.0, S_sr=25.0, Lo=120.0, Lc=260.0, ok=True
+    )
+    shear = SimpleNamespace(fields=(("Vu", "12"), ("Ln", "5")), result=result)
+    view = tmp_path / "view3d.png"
+    view.write_bytes(formula_png("M_1", 12, 50))
+    consumed = []
+
+    def beams():
+        for i in range(20):
+            consumed.append(i)
+            yield BeamMemoria(f"V-{i}", _flexure(50.0 + i % 3, [str(view)]), shear if i % 2 else None)
+
+    steps = []
+    path = write_memoria_docx(beams(), str(tmp_path / "memoria.docx"), total=20,
+                              progress=lambda p, t: steps.append(p))
+    assert consumed == list(range(20))
+    assert steps == sorted(steps) and steps[-1] == 95
+
+    doc = Document(path)
+    headings = [p.text for p in doc.paragraphs if p.style.name == "Heading 1"]
+    assert headings == [f"Viga V-{i}" for i in range(20)]
+    # Flexure data and summary per beam, plus inputs and results per shear beam
+    assert len(doc.tables) == 20 * 2 + 10 * 2
+    assert doc.tables[0].cell(0, 0).text == "Dato"
+    # Section cuts, two general formulas, three distinct d and three distinct As
+    images = {rel.target_part.partname for rel in doc.part.rels.values() if "image" in rel.reltype}
+    assert len(images) == 1 + 2 + 3 + 3
+    assert len(doc.inline_shapes) == 20 * (1 + 3 + 1)
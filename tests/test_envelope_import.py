@@ -0,0 +1,61 @@
+import io
+import os
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+from vigapp.models.envelope_import import read_envelopes
+
+CSV = """TABLE: Beam Forces
+Story,Beam,Output Case,Station,V2,M3
+,,,m,tonf,tonf-m
+Story1,B1,C1,0,-10,-12
+Story1,B1,C1,2,-2,6
+Story1,B1,C1,3,0,8
+Story1,B1,C1,4,2,6
+Story1,B1,C1,6,10,-14
+Story1,B1,C2,0,-12,-15
+Story1,B1,C2,3,1,9.5
+Story1,B1,C2,6,8,-11
+Story1,B2,C1,0,-5,-4
+Story1,B2,C1,2.5,0,3
+Story1,B2,C1,5,5,-4.5
+"""
+
+
+def test_read_envelopes_csv():
+    env = read_envelopes(io.StringIO(CSV), chunk_size=3)
+    assert env.labels == ["Story1 B1", "Story1 B2"]
+    mn, mp, vu = env.for_beam("Story1 B1")
+    assert np.allclose(mn, [-15, 0, -14])
+    assert np.allclose(mp, [0, 9.5, 0])
+    assert vu == 12
+    assert np.allclose(env.length, [6, 5])
+
+
+def test_read_envelopes_vu_at_d():
+    env = read_envelopes(io.StringIO(CSV), d=1.0)
+    # |V| between stations 0 (12) and 2 (2) interpolated at 1 m
+    assert abs(env.vu[0] - 7.0) < 1e-9
+
+
+def test_read_envelopes_tab_text_with_custom_columns():
+    text = "Frame\tStation\tShear\tMoment\nV-1\t0\t3\t-5\nV-1\t4\t-3\t-6\nV-1\t2\t0\t4\n"
+    env = read_envelopes(
+        io.StringIO(text),
+        columns={"story": "", "beam": "Frame", "moment": "Moment", "shear": "Shear"},
+    )
+    assert env.labels == ["V-1"]
+    assert np.allclose(env.mn[0], [-5, 0, -6])
+    assert np.allclose(env.mp[0], [0, 4, 0])
+
+
+def test_read_envelopes_reports_progress(tmp_path):
+    path = tmp_path / "fuerzas.csv"
+    path.write_text(CSV)
+    calls = []
+    env = read_envelopes(str(path), chunk_size=4, progress=lambda p, t: calls.append(p))
+    assert len(env) == 2
+    assert len(calls) == 3  # 12 rows after the header
+    assert calls == sorted(calls) and 0 <= calls[-1] <= 90
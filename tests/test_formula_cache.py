@@ -0,0 +1,69 @@
+import json
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import vigapp.models.formula_cache as fc
+from vigapp.models.formula_cache import FormulaCache
+
+
+def test_latex_is_parsed_once(monkeypatch):
+    cache = FormulaCache()
+    calls = []
+    parse = fc._parse
+    monkeypatch.setattr(fc, "_parse", lambda text: calls.append(text) or parse(text))
+    first = cache.latex("As = Mu / (phi * fy * d)")
+    assert first == cache.latex("As = Mu / (phi * fy * d)")
+    assert "phi" in first or "\\phi" in first
+    assert cache.latex("sin igualdad") is None
+    cache.latex("sin igualdad")
+    assert len(calls) == 2
+    assert cache.parse("As = Mu / (phi * fy * d)") is cache.parse("As = Mu / (phi * fy * d)")
+
+
+def test_lru_is_bounded():
+    cache = FormulaCache(maxsize=2)
+    for text in ("a = 1", "b = 2", "c = 3"):
+        cache.latex(text)
+    assert list(cache._latex) == ["b = 2", "c = 3"]
+
+
+def test_disk_cache_survives_restart(tmp_path, monkeypatch):
+    path = tmp_path / "cache" / "formulas.json"
+    FormulaCache(str(path)).warm(["d = h - r", "texto"])
+    assert json.loads(path.read_text(encoding="utf-8"))["format"] == fc.FORMAT
+
+    def fail(text):
+        raise AssertionError("SymPy no debería usarse")
+
+    monkeypatch.setattr(fc, "_parse", fail)
+    again = FormulaCache(str(path))
+    assert again.latex("d = h - r") == "d = h - r"
+    assert again.latex("texto") is None
+    assert again.hits == 2 and again.misses == 0
+
+
+def test_disk_writes_are_batched(tmp_path, monkeypatch):
+    path = tmp_path / "formulas.json"
+    cache = FormulaCache(str(path), disk_maxsize=3)
+    saves = []
+    save = cache._save
+    monkeypatch.setattr(cache, "_save", lambda: saves.append(1) or save())
+    cache.warm(["a = 1", "b = 2", "c = 3", "d = 4"])
+    assert len(saves) == 1
+    cache.latex("e = 5")
+    assert len(saves) == 1
+    cache.flush()
+    cache.flush()
+    assert len(saves) == 2
+    data = json.loads(path.read_text(encoding="utf-8"))["latex"]
+    assert list(data) == ["c = 3", "d = 4", "e = 5"]
+    assert list(FormulaCache(str(path), disk_maxsize=2)._disk) == ["d = 4", "e = 5"]
+
+
+def test_corrupt_disk_cache_is_ignored(tmp_path):
+    path = tmp_path / "formulas.json"
+    path.write_text("{no es json", encoding="utf-8")
+    cache = FormulaCache(str(path))
+    assert cache.latex("x = 2*y") == "x = 2 y"
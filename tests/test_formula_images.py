@@ -0,0 +1,42 @@
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+
+from vigapp.graphics.formula_images import FormulaImageCache, save_formula
+
+PNG = b"\x89PNG"
+
+
+def test_render_once_per_key():
+    cache = FormulaImageCache()
+    png = cache.render(r"\beta_1 = 0.85", 12, 100)
+    assert png.startswith(PNG)
+    assert cache.render(r"$\beta_1 = 0.85$", 12, 100) != b""
+    assert cache.render(r"\beta_1 = 0.85", 12, 100) is png
+    assert cache.render(r"\beta_1 = 0.85", 12, 200) is not png
+    assert cache.render(r"\beta_1 = 0.85", 12, 100, "svg").lstrip().startswith(b"<?xml")
+    assert (cache.hits, cache.misses) == (1, 4)
+    with pytest.raises(ValueError):
+        cache.render("x", fmt="gif")
+
+
+def test_eviction_is_bounded():
+    cache = FormulaImageCache(max_entries=2)
+    for latex in ("a", "b", "c"):
+        cache.render(latex, 10, 72)
+    assert len(cache) == 2
+    cache.render("b", 10, 72)
+    assert cache.hits == 1
+
+    small = FormulaImageCache(max_bytes=1)
+    small.render("a", 10, 72)
+    assert len(small) == 0 and small.size == 0
+
+
+def test_save_formula(tmp_path):
+    path = save_formula(r"A_s = \rho\,b\,d", str(tmp_path / "as.png"), dpi=100)
+    with open(path, "rb") as fh:
+        assert fh.read(4) == PNG
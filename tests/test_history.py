@@ -0,0 +1,72 @@
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+from vigapp.models.history import History, make_state, with_orders
+
+REBAR = [[("2", '5/8"', "1")], [("3", '3/4"', "1")], [("2", '5/8"', "1")]]
+
+
+def test_undo_redo_and_dedup():
+    hist = History()
+    s1 = make_state(None, mn=[1, 2, 3], inputs=[("b (cm)", "30")], rebar=REBAR)
+    assert hist.push(s1)
+    assert not hist.push(make_state(s1, mn=[1, 2, 3], inputs=[("b (cm)", "30")], rebar=REBAR))
+    s2 = make_state(s1, mn=[1, 2, 4], inputs=[("b (cm)", "30")], rebar=REBAR)
+    hist.push(s2)
+    assert s2.changed(s1) == {"mn"}
+    assert hist.undo() is s1 and hist.undo() is None
+    assert hist.redo() is s2 and not hist.can_redo
+    hist.undo()
+    hist.push(with_orders(s1, [["a", "b"]], []))
+    assert not hist.can_redo and len(hist) == 2
+
+
+def test_snapshots_share_unchanged_parts():
+    s1 = make_state(None, mn=[1, 2, 3], inputs=[("b (cm)", "30")], rebar=REBAR)
+    rebar = [list(r) for r in REBAR]
+    rebar[1] = [("4", '3/4"', "1")]
+    s2 = make_state(s1, mn=[1, 2, 3], inputs=[("b (cm)", "30")], rebar=rebar)
+    assert s2.mn is s1.mn and s2.inputs is s1.inputs
+    assert s2.rebar[0] is s1.rebar[0] and s2.rebar[2] is s1.rebar[2]
+    assert s2.rebar[1] is not s1.rebar[1]
+    assert s2.changed(s1) == {"rebar"}
+
+
+def test_thousands_of_steps():
+    hist = History(max_steps=5000)
+    state = make_state(None, mn=[1, 2, 3], rebar=REBAR)
+    hist.push(state)
+    for i in range(6000):
+        state = make_state(state, mn=[1, 2, 3], rebar=REBAR, inputs=[("b (cm)", str(i))])
+        hist.push(state)
+    assert len(hist) == 5001
+    assert all(s.rebar is state.rebar for s, _ in hist._undo)
+    for _ in range(5000):
+        hist.undo()
+    assert hist.current.inputs == (("b (cm)", "999"),)
+    assert hist.undo() is None
+
+
+def test_design_window_undo(monkeypatch):
+    monkeypatch.setenv("QT_QPA_PLATFORM", "offscreen")
+    from PyQt5.QtWidgets import QApplication
+    from vigapp.ui.design_window import DesignWindow
+
+    app = QApplication.instance() or QApplication([])
+    win = DesignWindow([12.0, 6.0, 14.0], [6.0, 9.0, 7.0], show_window=False)
+    for key, val in (("b (cm)", "30"), ("h (cm)", "50"), ("r (cm)", "4")):
+        win.edits[key].setText(val)
+    win.optimize_rebar()
+    before = win.capture_state()
+    win.edits["b (cm)"].setText("35")
+    win._redraw()
+    revision = win.revision
+
+    win.undo()
+    assert win.edits["b (cm)"].text() == "30"
+    assert win.capture_state() == before
+    assert win.revision == revision + 1
+    win.redo()
+    assert win.edits["b (cm)"].text() == "35"
+    win.close()
@@ -0,0 +1,67 @@
+import os
+import sys
+
+import matplotlib
+
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.backend_bases import MouseEvent
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+from vigapp.graphics.hover import hover_for
+
+
+def _move(ax, x, y):
+    px, py = ax.transData.transform((x, y))
+    event = MouseEvent("motion_notify_event", ax.figure.canvas, px, py)
+    ax.figure.canvas.callbacks.process("motion_notify_event", event)
+
+
+def test_hover_shows_nearest_sample():
+    fig, ax = plt.subplots()
+    x = np.linspace(0, 1, 11)
+    ys = np.vstack([x**2, -x])
+    ax.plot(x, ys[0])
+    ax.plot(x, ys[1])
+    hover = hover_for(ax)
+    hover.set_curves(x, ys, lambda i, y: f"{i}:{y:.2f}")
+    fig.canvas.draw()
+
+    _move(ax, 0.31, -0.3)
+    assert hover.annot.get_visible()
+    assert hover.annot.get_text() == "1:-0.30"
+
+    _move(ax, 0.5, 0.8)
+    assert not hover.annot.get_visible()
+    plt.close(fig)
+
+
+def test_handlers_registered_once_per_axes():
+    fig, ax = plt.subplots()
+    x = np.linspace(0, 1, 5)
+    hover = hover_for(ax)
+    n = len(fig.canvas.callbacks.callbacks["motion_notify_event"])
+    for _ in range(5):
+        ax.clear()
+        hover_for(ax).set_curves(x, [x])
+    assert hover_for(ax) is hover
+    assert len(fig.canvas.callbacks.callbacks["motion_notify_event"]) == n
+    assert sum(t is hover.annot for t in ax.texts) == 1
+    plt.close(fig)
+
+
+def test_hover_does_not_keep_figures_alive():
+    import gc
+    import weakref
+
+    from matplotlib.figure import Figure
+
+    fig = Figure()
+    ax = fig.add_subplot(111)
+    hover_for(ax).set_curves(np.arange(3.0), [np.arange(3.0)])
+    assert hover_for(ax) is hover_for(ax)
+    ref = weakref.ref(ax)
+    del fig, ax
+    gc.collect()
+    assert ref() is None
@@ -0,0 +1,62 @@
+import os
+import sys
+import threading
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+from vigapp.sistema.instrumentation import Timings, measure, timed, timings
+
+
+def test_ring_buffer_statistics():
+    t = Timings(maxlen=100)
+    for ms in range(1, 201):
+        t.add("accion", ms / 1000.0)
+    s = t.stats()["accion"]
+    assert s["count"] == 100
+    assert abs(s["p50"] - 150.5) < 1e-6
+    assert abs(s["max"] - 200.0) < 1e-6
+    assert "accion" in t.report()
+
+
+def test_timed_and_profile_dump(tmp_path, monkeypatch):
+    monkeypatch.setenv("VIGAPP_PROFILE", "1")
+    monkeypatch.setenv("VIGAPP_PROFILE_DIR", str(tmp_path))
+    timings.clear()
+
+    @timed("prueba.externa")
+    def work(n):
+        with measure("prueba.interna"):
+            return sum(range(n))
+
+    assert work(1000) == sum(range(1000))
+    stats = timings.stats()
+    assert stats["prueba.externa"]["count"] == 1
+    assert stats["prueba.interna"]["count"] == 1
+    files = os.listdir(tmp_path)
+    # Only the outermost action is profiled
+    assert len(files) == 1 and files[0].startswith("prueba.externa")
+
+
+def test_concurrent_actions_profile_once(tmp_path, monkeypatch):
+    monkeypatch.setenv("VIGAPP_PROFILE", "1")
+    monkeypatch.setenv("VIGAPP_PROFILE_DIR", str(tmp_path))
+    started, release = threading.Event(), threading.Event()
+
+    def first():
+        with measure("prueba.hilo"):
+            started.set()
+            release.wait(5)
+
+    thread = threading.Thread(target=first)
+    thread.start()
+    started.wait(5)
+    try:
+        with measure("prueba.concurrente"):
+            pass
+    finally:
+        release.set()
+        thread.join(5)
+    files = os.listdir(tmp_path)
+    assert len(files) == 1 and files[0].startswith("prueba.hilo")
+    with measure("prueba.despues"):
+        pass
+    assert len(os.listdir(tmp_path)) == 2
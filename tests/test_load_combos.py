@@ -0,0 +1,57 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+from vigapp.models.load_combos import CombinationTable, combine, e060_table
+from vigapp.models.moments import correct_moments
+
+# CM, CV, SX, SY at M1, M2, M3
+MOMENTS = np.array(
+    [
+        [-6.0, 4.0, -7.0],
+        [-3.0, 2.0, -3.5],
+        [8.0, 0.5, -8.0],
+        [2.0, 0.1, -2.0],
+    ]
+)
+SHEARS = np.array([[5.0, 0.5, -5.5], [2.0, 0.2, -2.5], [-3.0, -3.0, -3.0], [-1.0, -1.0, -1.0]])
+
+
+def test_single_beam_envelopes():
+    env = combine(MOMENTS, SHEARS)
+    table = e060_table()
+    combos = table.factors @ MOMENTS
+    assert np.allclose(env.mn, np.minimum(combos.min(axis=0), 0))
+    assert np.allclose(env.mp, np.maximum(combos.max(axis=0), 0))
+    # M1-: 1.25(CM+CV)-SX = -11.25 - 8
+    assert np.isclose(env.mn[0], -19.25)
+    assert env.controlling("mn")[0] == "1.25(CM+CV)-SX"
+    assert env.controlling("mp")[0] == "0.9CM+SX"
+    assert np.isclose(env.vu_max, 1.25 * 8.0 + 3.0)
+
+
+def test_batch_matches_single_and_feeds_correction():
+    rng = np.random.default_rng(1)
+    m = rng.normal(size=(50, 4, 3)) * 10
+    env = combine(m)
+    one = combine(m[7])
+    assert np.allclose(env.mn[7], one.mn) and np.array_equal(env.mp_combo[7], one.mp_combo)
+    mn_c, mp_c = env.corrected("dual2")
+    ref = correct_moments(env.mn, env.mp, "dual2")
+    assert np.allclose(mn_c, ref[0]) and np.allclose(mp_c, ref[1])
+    beams = env.to_beam_envelopes(length=6.0)
+    assert len(beams) == 50 and np.allclose(beams.length, 6.0)
+
+
+def test_custom_table():
+    table = CombinationTable.from_rows([("U1", {"CM": 1.5, "CV": 1.8})])
+    env = combine(MOMENTS, table=table)
+    assert np.allclose(env.mn, np.minimum(1.5 * MOMENTS[0] + 1.8 * MOMENTS[1], 0))
+    assert table.rows() == [("U1", {"CM": 1.5, "CV": 1.8})]
+    with pytest.raises(ValueError):
+        CombinationTable.from_rows([("U1", {"W": 1.0})])
+    with pytest.raises(ValueError):
+        combine(np.zeros((3, 3)))
@@ -0,0 +1,71 @@
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+
+def test_next_pages_prebuilt_when_idle(monkeypatch):
+    monkeypatch.setenv("QT_QPA_PLATFORM", "offscreen")
+    from PyQt5.QtTest import QTest
+    from PyQt5.QtWidgets import QApplication
+    from vigapp.ui import menu_window
+
+    app = QApplication.instance() or QApplication([])
+    monkeypatch.setattr(menu_window, "PREBUILD_DELAY_MS", 10)
+    win = menu_window.MenuWindow()
+
+    win.open_diagrama()
+    win.diagram_page.set_moments([12.0, 6.0, 14.0], [6.0, 9.0, 7.0])
+    win.diagram_page.on_calculate()
+    QTest.qWait(100)
+    assert win.stacked.currentWidget() is win.diagram_page
+    design = win.design_page
+    revision = design.revision
+
+    win.diagram_page.on_next()
+    assert win.design_page is design
+    assert design.revision == revision
+    QTest.qWait(100)
+    view = win.desarrollo_page
+    assert view.drawn_revision == design.revision
+
+    win._design_next()
+    assert win.stacked.currentWidget() is view
+    win.close()
+
+
+def test_bar_orders_survive_edits_that_keep_the_bars(monkeypatch):
+    monkeypatch.setenv("QT_QPA_PLATFORM", "offscreen")
+    from PyQt5.QtWidgets import QApplication
+    from vigapp.ui import menu_window
+
+    app = QApplication.instance() or QApplication([])
+    win = menu_window.MenuWindow()
+    win._ensure_design_page([12.0, 6.0, 14.0], [6.0, 9.0, 7.0])
+    design = win.design_page
+    design.optimize_rebar()
+    win._ensure_desarrollo_page()
+    view = win.desarrollo_page
+    custom = ['1"', '5/8"', '1"']
+    view.change_order("neg", 0, custom)
+
+    design.edits["b (cm)"].setText("35")
+    design._redraw()
+    win._ensure_desarrollo_page()
+    assert view.neg_orders[0] == custom
+    assert design.history.current.neg_orders[0] == tuple(custom)
+
+    row = design.rebar_rows[0][0]
+    row["qty"].setCurrentText("4" if row["qty"].currentText() != "4" else "5")
+    design._redraw()
+    win._ensure_desarrollo_page()
+    assert view.neg_orders[0] == view._collect_order(0)
+    assert design.history.current.neg_orders == ()
+
+    design.edits["b (cm)"].setText("30")
+    design._redraw()
+    assert design.history.current.neg_orders == ()
+    design.undo()
+    design.undo()
+    assert view.neg_orders[0] == custom
+    win.close()
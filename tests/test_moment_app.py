@@ -18,3 +18,33 @@ def test_correct_moments_dual1_dual2():
     assert np.allclose(mp_c1, [5.0, 5.0, 5.0])
     assert np.allclose(mp_c2, [5.0, 5.0, 7.5])
 
+
+def _reference(mn, mp, system):
+    """Per-beam E.060 rules written out term by term."""
+    f = 1 / 3 if system.lower() == "dual1" else 1 / 2
+    m_min = max(max(abs(m) for m in mn), max(abs(m) for m in mp)) / 4
+    mp_c = [max(abs(mp[0]), f * abs(mn[0]), m_min),
+            max(abs(mp[1]), m_min),
+            max(abs(mp[2]), f * abs(mn[2]), m_min)]
+    return [-max(abs(m), m_min) for m in mn], mp_c
+
+
+def test_correct_moments_batch_per_beam_system():
+    from vigapp.models.moments import correct_moments
+
+    mn = np.array([[-12.0, -2.0, -9.0], [-12.0, -2.0, -9.0]])
+    mp = np.array([[1.0, 6.0, 1.0], [1.0, 6.0, 1.0]])
+    mn_c, mp_c = correct_moments(mn, mp, np.array(["dual1", "Dual2"]))
+    # Quarter of 12 is 3; faces take 12/3, 9/3 (Dual 1) and 12/2, 9/2 (Dual 2)
+    assert np.allclose(mn_c, [[-12.0, -3.0, -9.0], [-12.0, -3.0, -9.0]])
+    assert np.allclose(mp_c, [[4.0, 6.0, 3.0], [6.0, 6.0, 4.5]])
+
+    rng = np.random.default_rng(1)
+    mn = -rng.uniform(0, 30, (50, 3))
+    mp = rng.uniform(0, 30, (50, 3))
+    systems = np.where(rng.random(50) < 0.5, "dual1", "Dual2")
+    mn_c, mp_c = correct_moments(mn, mp, systems)
+    for i in range(50):
+        mn_1, mp_1 = _reference(mn[i], mp[i], systems[i])
+        assert np.allclose(mn_c[i], mn_1)
+        assert np.allclose(mp_c[i], mp_1)
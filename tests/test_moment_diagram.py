@@ -0,0 +1,38 @@
+import os
+import sys
+
+import numpy as np
+from scipy.interpolate import CubicSpline
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+from vigapp.models.moment_diagram import MomentDiagram, diagram_for
+
+
+def test_evaluation_matches_spline():
+    vals = np.array([[-10.0, 8.0, -12.0], [5.0, 2.0, 7.0]])
+    diag = MomentDiagram(vals)
+    x = np.array([0.0, 0.13, 0.5, 0.77, 1.0])
+    ref = CubicSpline([0, 0.5, 1.0], vals.T, axis=0)(x).T
+    assert np.allclose(diag(x), ref)
+    xi, ys = diag.sample(21)
+    assert ys.shape == (2, 21)
+    assert diag.sample(21)[1] is ys
+
+
+def test_extremes_and_zero_crossings():
+    vals = np.array([[-10.0, 8.0, -12.0]])
+    diag = MomentDiagram(vals)
+    roots = np.sort(np.roots(np.polyfit([0, 0.5, 1.0], vals[0], 2)))
+    assert np.allclose(diag.zero_crossings()[0], roots, atol=1e-8)
+    x_max, v_max = diag.extreme()
+    xs = np.linspace(0, 1, 100001)
+    ys = diag(xs)[0]
+    assert abs(v_max[0] - ys.max()) < 1e-6
+    assert abs(x_max[0] - xs[ys.argmax()]) < 1e-4
+    x_min, v_min = diag.extreme(largest=False)
+    assert x_min[0] == 1.0 and v_min[0] == -12.0
+
+
+def test_diagram_for_is_cached():
+    vals = [[20.0, 5.0, 18.0], [-8.0, -15.0, -7.0]]
+    assert diagram_for(vals) is diagram_for(np.array(vals))
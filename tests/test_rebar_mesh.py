@@ -0,0 +1,81 @@
+import os
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from vigapp.graphics.rebar_mesh import (
+    Bar,
+    RebarMeshes,
+    RebarModel,
+    bar_mesh,
+    beam_model,
+    stirrup_mesh,
+    stirrup_positions,
+)
+
+
+def _model(bars, stirrups=(10.0, 20.0)):
+    return RebarModel(30.0, 60.0, 1000.0, 4.0, '3/8"', tuple(bars), tuple(stirrups))
+
+
+def test_one_buffer_per_diameter():
+    bars = [Bar('5/8"', 6.0 + 6 * i, 6.0, 0.0, 1000.0) for i in range(4)]
+    bars += [Bar('3/4"', 6.0, 54.0, 0.0, 300.0), Bar('3/4"', 24.0, 54.0, 0.0, 300.0)]
+    meshes = RebarMeshes()
+    changed = meshes.update(_model(bars))
+    assert set(changed) == {("bar", '5/8"'), ("bar", '3/4"'), ("stirrups",)}
+
+    verts, faces = bar_mesh('5/8"')
+    merged_v, merged_f = meshes.mesh(("bar", '5/8"'))
+    assert merged_v.shape == (4 * len(verts), 3)
+    assert merged_f.shape == (4 * len(faces), 3)
+    # Faces of the last instance point to its own vertices
+    np.testing.assert_array_equal(merged_f[-len(faces):], faces + 3 * len(verts))
+    last = merged_v[-len(verts):]
+    assert np.isclose(last[:, 2].max(), 1000.0)
+    assert np.isclose(last[:, 0].mean(), 24.0, atol=1e-9)
+
+
+def test_shared_meshes_are_cached():
+    assert bar_mesh('1"') is bar_mesh('1"')
+    assert stirrup_mesh(30.0, 60.0, 4.0, '3/8"') is stirrup_mesh(30.0, 60.0, 4.0, '3/8"')
+    verts, faces = stirrup_mesh(30.0, 60.0, 4.0, '3/8"')
+    assert faces.max() == len(verts) - 1
+    assert verts[:, 0].min() >= 4.0 - 1e-9 and verts[:, 0].max() <= 26.0 + 1e-9
+
+
+def test_update_touches_only_changed_groups():
+    bars = [Bar('5/8"', 6.0, 6.0, 0.0, 1000.0), Bar('5/8"', 24.0, 6.0, 0.0, 1000.0),
+            Bar('1/2"', 15.0, 54.0, 0.0, 1000.0)]
+    meshes = RebarMeshes()
+    meshes.update(_model(bars))
+    before = meshes.mesh(("bar", '5/8"'))[0].copy()
+
+    bars[1] = Bar('5/8"', 20.0, 6.0, 0.0, 1000.0)
+    changed = meshes.update(_model(bars))
+    assert list(changed) == [("bar", '5/8"')]
+    after = meshes.mesh(("bar", '5/8"'))[0]
+    n = len(bar_mesh('5/8"')[0])
+    np.testing.assert_array_equal(after[:n], before[:n])
+    assert np.isclose(after[n:, 0].mean(), 20.0)
+
+    changed = meshes.update(_model(bars[:2]))
+    assert changed == {("bar", '1/2"'): None}
+    assert meshes.update(_model(bars[:2])) == {}
+
+
+def test_beam_model_merges_continuous_bars():
+    cont = {1: [(1.59, '5/8"'), (1.59, '5/8"')]}
+    extra = {1: [(1.59, '5/8"'), (1.59, '5/8"'), (1.59, '5/8"')], 2: [(1.91, '3/4"')]}
+    pos = {1: [(1.59, '5/8"'), (1.59, '5/8"')]}
+    stirrups = stirrup_positions(1000.0, 120.0, 15.0, 30.0)
+    model = beam_model(30.0, 60.0, 1000.0, 4.0, '3/8"', [extra, cont, extra], [pos] * 3, stirrups)
+    full = [bar for bar in model.bars if bar.z0 == 0.0 and bar.z1 == 1000.0]
+    # Two corner bars on each face run the whole span
+    assert len(full) == 4
+    ends = [bar for bar in model.bars if bar.z1 - bar.z0 < 1000.0]
+    assert len(ends) == 4 and sum(bar.key == '3/4"' for bar in ends) == 2
+    assert stirrups[0] == 5.0 and stirrups[-1] == 995.0
+    assert np.allclose(np.diff(stirrups[:8]), 15.0)
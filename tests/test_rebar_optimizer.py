@@ -0,0 +1,41 @@
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+from vigapp.models.constants import BAR_DATA
+from vigapp.models.rebar_optimizer import optimize_position, optimize_sections
+
+
+def test_optimize_position_meets_limits():
+    res = optimize_position(8.5, 20.0, 30, 4, 0.95)
+    assert res is not None
+    assert 8.5 <= res.area <= 20.0
+    assert res.base_req <= 30
+    total = sum(q * BAR_DATA[k] for q, k, _ in res.rows)
+    assert abs(total - res.area) < 1e-9
+
+
+def test_optimize_position_is_lightest():
+    res = optimize_position(2.5, 20.0, 30, 4, 0.95)
+    # Two 1/2" bars (2.58 cm²) are the lightest option above 2.5 cm²
+    assert res.rows == [(2, '1/2"', 1)]
+
+
+def test_optimize_uses_layers_when_narrow():
+    res = optimize_position(20.0, 40.0, 20, 4, 0.95)
+    assert res is not None
+    assert res.layers > 1
+    assert res.base_req <= 20
+
+
+def test_optimize_sections_no_solution():
+    res = optimize_sections([5.0, 60.0], 10.0, 30, 4, 0.95)
+    assert res[0] is not None
+    assert res[1] is None
+
+
+def test_equal_areas_prefer_fewer_layers():
+    # 9ø3/4" + 1ø1" and 4ø1/2" + 5ø1" differ only by float noise
+    layout = optimize_position(30.65, 60, 30, 4, 0.95)
+    assert abs(layout.area - 30.66) < 1e-9
+    assert layout.layers == 2
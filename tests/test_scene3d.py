@@ -0,0 +1,81 @@
+import os
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from vigapp.graphics.rebar_mesh import Bar, RebarModel, stirrup_positions
+from vigapp.graphics.scene3d import (
+    LOD_BOX,
+    LOD_FULL,
+    LOD_LINES,
+    GeometryCache,
+    SceneBeam,
+    bounding_spheres,
+    build_geometry,
+    frustum_planes,
+    lod_levels,
+    rebar_lines,
+    visible,
+)
+
+
+def _perspective(fov, aspect, near, far):
+    f = 1.0 / np.tan(np.radians(fov) / 2)
+    return np.array(
+        [
+            [f / aspect, 0, 0, 0],
+            [0, f, 0, 0],
+            [0, 0, (far + near) / (near - far), 2 * far * near / (near - far)],
+            [0, 0, -1, 0],
+        ]
+    )
+
+
+def _model(L=600.0):
+    bars = (Bar('5/8"', 6.0, 6.0, 0.0, L), Bar('5/8"', 24.0, 6.0, 0.0, L))
+    return RebarModel(30.0, 60.0, L, 4.0, '3/8"', bars, stirrup_positions(L, 120.0, 15.0, 30.0))
+
+
+def test_frustum_culls_beams_behind_and_aside():
+    # Camera at the origin looking down -z
+    planes = frustum_planes(_perspective(60.0, 1.0, 1.0, 1e5))
+    centers = np.array([[0, 0, -500.0], [0, 0, 500.0], [5000.0, 0, -500.0], [400.0, 0, -500.0]])
+    radii = np.array([50.0, 50.0, 50.0, 150.0])
+    np.testing.assert_array_equal(visible(planes, centers, radii), [True, False, False, True])
+
+
+def test_lod_by_apparent_size():
+    centers = np.array([[0, 0, 1000.0], [0, 0, 4000.0], [0, 0, 40000.0]])
+    levels = lod_levels((0, 0, 0), centers, np.full(3, 300.0))
+    np.testing.assert_array_equal(levels, [LOD_FULL, LOD_LINES, LOD_BOX])
+
+
+def test_rotated_beam_bounding_sphere():
+    beam = SceneBeam(_model(), origin=(1000.0, 0.0, 0.0), angle=90.0)
+    centers, radii = bounding_spheres([beam])
+    np.testing.assert_allclose(centers[0], [1300.0, 30.0, -15.0], atol=1e-9)
+    assert np.isclose(radii[0], 0.5 * np.sqrt(30 ** 2 + 60 ** 2 + 600 ** 2))
+
+
+def test_geometry_per_level():
+    model = _model()
+    full = build_geometry(model, LOD_FULL)
+    assert set(full) == {("prism",), ("bar", '5/8"'), ("stirrups",)}
+    assert len(rebar_lines(model)) == 2 * 2 + 8 * len(model.stirrups)
+    assert len(build_geometry(model, LOD_BOX)["lines"]) == 24
+
+
+def test_cache_builds_only_missing_visible_levels():
+    beams = [SceneBeam(_model(), origin=(0.0, 0.0, -2000.0 - 700.0 * i)) for i in range(4)]
+    beams.append(SceneBeam(_model(), origin=(0.0, 0.0, 5000.0)))
+    cache = GeometryCache(beams)
+    planes = frustum_planes(_perspective(60.0, 1.0, 1.0, 1e5))
+    wanted, missing = cache.plan(planes, (0.0, 0.0, 0.0))
+    assert 4 not in wanted
+    assert sorted(missing) == sorted(wanted.items())
+    for key, geom in cache.build(missing[:2]):
+        cache.store(key, geom)
+    _, missing = cache.plan(planes, (0.0, 0.0, 0.0))
+    assert len(missing) == len(wanted) - 2
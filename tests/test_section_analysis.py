@@ -0,0 +1,52 @@
+import os
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+from vigapp.models.section_analysis import (
+    face_bars,
+    moment_curvature,
+    nominal_moment,
+    section_bars,
+)
+
+
+def test_singly_reinforced_matches_block_formula():
+    b, fc, fy, d, As = 30.0, 210.0, 4200.0, 44.0, 10.0
+    cap = nominal_moment(b, 50.0, fc, fy, [d], [As])
+    a = As * fy / (0.85 * fc * b)
+    assert np.isclose(cap.mn[0], As * fy * (d - a / 2) / 1e5, rtol=1e-9)
+    assert np.isclose(cap.phi_mn[0], 0.9 * cap.mn[0])
+    assert cap.eps_t[0] > 0.005
+
+
+def test_compression_steel_below_yield():
+    cap = nominal_moment(30.0, 50.0, 210.0, 4200.0, [44.0, 6.0], [20.0, 6.0])
+    c = cap.c[0]
+    fs = 2.0e6 * 0.003 * (c - 6.0) / c
+    assert fs < 4200.0
+    cc = 0.85 * 210.0 * 30.0 * 0.85 * c
+    cs = 6.0 * (fs - 0.85 * 210.0)
+    assert np.isclose(cc + cs, 20.0 * 4200.0, rtol=1e-8)
+    mn = cc * (44.0 - 0.85 * c / 2) + cs * (44.0 - 6.0)
+    assert np.isclose(cap.mn[0], mn / 1e5, rtol=1e-8)
+
+
+def test_layers_and_batch():
+    y, a = face_bars([(3, '5/8"', 1), (2, '5/8"', 2)], 50.0, 4.0, 0.95)
+    assert np.allclose(a, [3 * 1.99, 2 * 1.99])
+    assert np.isclose(y[0] - y[1], 1.59 + 2.5)
+    depth, area = section_bars([(3, '5/8"', 1)], [(2, '1/2"', 1)], 50.0, 4.0, 0.95)
+    assert np.isclose(depth[1], 4.0 + 0.95 + 0.635)
+    batch = nominal_moment([30.0, 25.0], [50.0, 60.0], 210.0, 4200.0,
+                           [[44.0, 6.0], [54.0, 0.0]], [[10.0, 4.0], [8.0, 0.0]])
+    one = nominal_moment(25.0, 60.0, 210.0, 4200.0, [54.0], [8.0])
+    assert np.isclose(batch.mn[1], one.mn[0])
+
+
+def test_moment_curvature_reaches_capacity():
+    mc = moment_curvature(30.0, 50.0, 210.0, 4200.0, [44.0], [10.0])
+    cap = nominal_moment(30.0, 50.0, 210.0, 4200.0, [44.0], [10.0])
+    assert np.all(np.diff(mc.curvature) > 0)
+    assert abs(mc.moment.max() - cap.mn[0]) / cap.mn[0] < 0.02
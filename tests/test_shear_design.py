@@ -1,6 +1,13 @@
 import os, sys
+
+import numpy as np
 sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
-from vigapp.models.shear_design import shear_design, min_spacing_sc, max_spacing_sr
+from vigapp.models.shear_design import (
+    shear_design,
+    shear_design_batch,
+    min_spacing_sc,
+    max_spacing_sr,
+)
 
 
 def test_shear_design_sample():
@@ -42,3 +49,24 @@ def test_stirrup_distribution():
     assert res.n_sr > 0
     assert res.sep_sc_real > 0
     assert res.sep_sr_real > 0
+
+
+def test_batch_matches_scalar():
+    rng = np.random.default_rng(3)
+    n = 50
+    args = dict(
+        Vu=rng.uniform(0, 60, n),
+        Ln=rng.uniform(2, 8, n),
+        d=rng.uniform(30, 70, n),
+        b=rng.uniform(25, 40, n),
+        h=rng.uniform(40, 80, n),
+        fc=rng.choice([210.0, 280.0], n),
+        phi_long=rng.choice([1.27, 1.59], n),
+    )
+    systems = rng.choice(["dual1", "dual2", "volado"], n)
+    batch = shear_design_batch(system=systems, **args)
+    for i in range(n):
+        ref = shear_design(**{k: float(v[i]) for k, v in args.items()}, system=str(systems[i]))
+        res = batch.result(i)
+        for name in ref.__dataclass_fields__:
+            assert np.isclose(getattr(res, name), getattr(ref, name))
@@ -0,0 +1,58 @@
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+
+def _run(pipeline, app):
+    from PyQt5.QtTest import QTest
+
+    result = []
+    pipeline.finished.connect(result.append)
+    pipeline.start()
+    deadline = time.time() + 5
+    while not result and time.time() < deadline:
+        QTest.qWait(10)
+    return result
+
+
+def test_stages_run_after_background(monkeypatch):
+    monkeypatch.setenv("QT_QPA_PLATFORM", "offscreen")
+    from PyQt5.QtWidgets import QApplication
+    from vigapp.startup import StartupPipeline
+
+    app = QApplication.instance() or QApplication([])
+    events = []
+
+    def slow():
+        time.sleep(0.05)
+        events.append("imports")
+
+    def broken():
+        raise RuntimeError("sin disco")
+
+    pipeline = StartupPipeline(
+        [("imports", slow), ("hardware_id", broken)],
+        [("activation", lambda: events.append("activation")), ("menu", lambda: events.append("menu"))],
+    )
+    assert _run(pipeline, app) == [True]
+    assert events == ["imports", "activation", "menu"]
+    assert pipeline.durations["imports"] >= 0.05
+    assert pipeline.durations["total"] >= pipeline.durations["imports"]
+    assert "hardware_id" in pipeline.errors
+    assert "menu" in pipeline.report()
+
+
+def test_stage_returning_false_stops(monkeypatch):
+    monkeypatch.setenv("QT_QPA_PLATFORM", "offscreen")
+    from PyQt5.QtWidgets import QApplication
+    from vigapp.startup import StartupPipeline
+
+    app = QApplication.instance() or QApplication([])
+    events = []
+    pipeline = StartupPipeline(
+        [], [("activation", lambda: False), ("menu", lambda: events.append("menu"))]
+    )
+    assert _run(pipeline, app) == [False]
+    assert events == []
@@ -0,0 +1,44 @@
+import os
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+from vigapp.models.constants import DIAM_CM
+from vigapp.models.shear_design import shear_design
+from vigapp.models.sweep import sweep_sections
+from vigapp.models.steel import calc_as_limits, calc_as_req
+
+MN = [-20.0, -10.0, -25.0]
+MP = [10.0, 15.0, 8.0]
+
+
+def test_grid_matches_scalar_checks():
+    res = sweep_sections(MN, MP, [25.0, 30.0], [50.0, 60.0], [210.0, 280.0], ['5/8"'], Vu=20.0)
+    d = 60.0 - 4.0 - DIAM_CM['3/8"'] - 0.5 * DIAM_CM['5/8"']
+    as_min, as_max = calc_as_limits(280.0, 4200.0, 30.0, d)
+    as_neg = max(calc_as_req(25.0, 280.0, 30.0, d, 4200.0, 0.9), as_min)
+    assert np.isclose(res.d[1, 1, 1, 0], d)
+    assert np.isclose(res.as_neg[1, 1, 1, 0], as_neg)
+    assert res.n_neg[1, 1, 1, 0] == int(np.ceil(as_neg / 1.99))
+    ref = shear_design(20.0, 5.0, d, 30.0, 60.0, 280.0, phi_long=DIAM_CM['5/8"'])
+    assert np.isclose(res.s_sc[1, 1, 1, 0], ref.S_sc)
+    assert np.isclose(res.s_sr[1, 1, 1, 0], ref.S_sr)
+
+
+def test_feasible_region():
+    res = sweep_sections(MN, MP, [15.0, 40.0], [30.0, 80.0], [210.0], ['1"'])
+    ok = res.ok[:, :, 0, 0]
+    assert not ok[0, 0] and ok[1, 1]
+    assert not res.ok_width[0, 1, 0, 0]
+
+
+def test_large_grid():
+    b = np.linspace(20.0, 60.0, 100)
+    h = np.linspace(30.0, 90.0, 100)
+    res = sweep_sections(MN, MP, b, h, [175.0, 210.0, 280.0, 350.0, 420.0], Vu=20.0)
+    assert res.shape == (100, 100, 5, 4)
+    d = res.d[-1, -1, -1, 0]
+    as_min, _ = calc_as_limits(420.0, 4200.0, 60.0, d)
+    assert np.isclose(res.as_neg[-1, -1, -1, 0], max(calc_as_req(25.0, 420.0, 60.0, d, 4200.0, 0.9), as_min))
+    assert res.ok_flexure[-1, -1].all() and not res.ok[0, 0].any()
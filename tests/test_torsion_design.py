@@ -0,0 +1,67 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+from vigapp.models.shear_design import shear_design
+from vigapp.models.torsion_design import (
+    torsion_design,
+    torsion_design_batch,
+    torsion_section,
+)
+
+
+def test_section_properties():
+    sec = torsion_section(30, 50, 4, '3/8"')
+    assert sec.Acp[0] == 1500
+    assert sec.pcp[0] == 160
+    assert abs(sec.Aoh[0] - 21.05 * 41.05) < 1e-9
+    assert abs(sec.ph[0] - 2 * (21.05 + 41.05)) < 1e-9
+    assert abs(sec.Ao[0] - 0.85 * sec.Aoh[0]) < 1e-9
+
+
+def test_threshold_torsion_is_neglected():
+    res = torsion_design(0.2, 18, 5, 44, 30, 50, 210)
+    # phi * 0.27 sqrt(f'c) Acp^2 / pcp
+    assert abs(res.phi_Tth - 0.85 * 0.27 * np.sqrt(210) * 1500**2 / 160 / 1e5) < 1e-9
+    assert not res.required
+    assert res.At_s == 0 and res.Al == 0
+    shear = shear_design(18, 5, 44, 30, 50, 210)
+    assert res.S_sc == shear.S_sc and res.S_sr == shear.S_sr
+
+
+def test_torsion_tightens_stirrups():
+    res = torsion_design(2.0, 18, 5, 44, 30, 50, 210)
+    shear = shear_design(18, 5, 44, 30, 50, 210)
+    assert res.required and res.section_ok and res.ok
+    assert res.At_s > 0 and res.Al > 0
+    assert abs(res.Avt_s - (res.Av_s + 2 * res.At_s)) < 1e-12
+    assert res.S_sr < shear.S_sr
+    assert res.s_torsion <= res.ph / 8
+
+
+def test_compatibility_limits_torque():
+    res = torsion_design(5.0, 10, 5, 44, 30, 50, 210, compatibility=True)
+    # phi * 1.1 sqrt(f'c) Acp^2 / pcp (Art. 11.6.2.2)
+    assert abs(res.phi_Tcr - 0.85 * 1.1 * np.sqrt(210) * 1500**2 / 160 / 1e5) < 1e-9
+    assert abs(res.Tu - res.phi_Tcr) < 1e-12
+    assert not torsion_design(5.0, 10, 5, 44, 30, 50, 210).section_ok
+
+
+def test_batch_matches_scalar():
+    Tu = np.array([0.0, 1.0, 2.5, 4.0])
+    b = np.array([25.0, 30.0, 30.0, 40.0])
+    batch = torsion_design_batch(Tu, 15.0, 5.0, b + 14.0, b, b + 20.0, 210.0)
+    assert len(batch) == 4
+    for i in range(4):
+        single = torsion_design(Tu[i], 15.0, 5.0, b[i] + 14.0, b[i], b[i] + 20.0, 210.0)
+        assert batch.result(i) == single
+
+
+def test_invalid_inputs():
+    with pytest.raises(ValueError):
+        torsion_design(1.0, 10, 5, 44, 30, 50, 210, stirrup_diam="8mm")
+    with pytest.raises(ValueError):
+        torsion_section(10, 50, 5)
@@ -0,0 +1,43 @@
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+
+def _wait(app, pool):
+    pool.waitForDone(5000)
+    for _ in range(50):
+        app.processEvents()
+
+
+def test_export_task_finishes_and_cancels(monkeypatch):
+    monkeypatch.setenv("QT_QPA_PLATFORM", "offscreen")
+    from PyQt5.QtCore import QThreadPool
+    from PyQt5.QtWidgets import QApplication
+    from vigapp.ui.workers import start_export
+
+    app = QApplication.instance() or QApplication([])
+    pool = QThreadPool()
+    events = []
+
+    def job(snapshot, progress):
+        total = 0
+        for i, value in enumerate(snapshot):
+            time.sleep(0.01)
+            progress(10 * i, "")
+            total += value
+        return total
+
+    start_export(None, job, (1, 2, 3), "Prueba", on_finished=events.append,
+                 on_done=lambda: events.append("done"), pool=pool)
+    _wait(app, pool)
+    assert events == ["done", 6]
+
+    events.clear()
+    task = start_export(None, job, tuple(range(100)), "Prueba",
+                        on_finished=events.append,
+                        on_done=lambda: events.append("done"), pool=pool)
+    task.cancel()
+    _wait(app, pool)
+    assert events == ["done"]
@@ -5,7 +5,9 @@ import hashlib
 import os
 import socket
 import subprocess
+import threading
 import uuid
+from functools import lru_cache
 
 def _app_dir() -> str:
     """Return the application data folder."""
@@ -115,8 +117,12 @@ def current_license() -> str:
     counter = _read_counter()
     return license_for(machine_code(), counter)
 
-def hardware_id() -> str:
-    """Return a stable identifier for the current machine."""
+# Serializes the first fingerprint so the startup stage and a check share one query
+_HW_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def _hardware_id() -> str:
     mac = uuid.getnode()
     host = socket.gethostname()
     disk = _disk_serial()
@@ -124,6 +130,16 @@ def hardware_id() -> str:
     return hashlib.sha256(raw.encode()).hexdigest()
 
 
+def hardware_id() -> str:
+    """Return a stable identifier for the current machine.
+
+    The disk query runs once per process; later calls return the cached
+    value.
+    """
+    with _HW_LOCK:
+        return _hardware_id()
+
+
 def activate(key: str) -> bool:
     """Store the hardware hash if the provided key is correct."""
     # Accept minor formatting differences by ignoring spaces and case
@@ -0,0 +1,260 @@
+"""Native Word calculation memory for many beams with python-docx."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Iterator, Optional, Sequence, Tuple
+
+from docx import Document
+from docx.image.image import Image
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.opc.packuri import PackURI
+from docx.oxml.shape import CT_Inline
+from docx.parts.image import ImagePart
+from docx.shared import Inches, Pt
+
+from .graphics.formula_images import formula_png
+from .sistema.instrumentation import timed
+
+# Formula rendering: points and dots per inch of the cached images
+FORMULA_SIZE = 11
+FORMULA_DPI = 200
+
+# Flexure checks in the order of ``memoria_report_args``
+FLEXURE_TITLES = {
+    "peralte": "Peralte efectivo (E060 Art. 17.5.2)",
+    "b1": "Coeficiente β1 (E060 Art. 10.2.7.3)",
+    "pbal": "ρbal (E060 Art. 10.3.32)",
+    "pmax": "ρmax (E060 Art. 10.3.4)",
+    "as_min": "As mín (E060 Art. 10.5.2)",
+    "as_max": "As máx (E060 Art. 10.3.4)",
+}
+
+
+@dataclass(frozen=True)
+class BeamMemoria:
+    """Data of one beam in the memory.
+
+    ``flexure`` is the tuple returned by ``memoria_report_args`` and
+    ``shear`` a shear export snapshot (``fields`` and ``result``).
+    """
+
+    label: str
+    flexure: Optional[tuple] = None
+    shear: Any = None
+
+
+class _Writer:
+    """Append-only helpers over a python-docx ``Document``.
+
+    python-docx resolves styles by name, scans the whole body for the
+    next shape id and rehashes every stored image on each picture, which
+    makes long documents quadratic. Here style ids are resolved once,
+    shape ids and image parts are counted and images are keyed by the
+    SHA-1 of their bytes, so identical formulas are stored once.
+    """
+
+    def __init__(self, doc):
+        self.doc = doc
+        self._styles = {}
+        self._shape_id = doc.part.next_id
+        self._images = {}
+        self._n_images = len(doc.part.package.image_parts)
+        self._n_rels = len(doc.part.rels)
+
+    def style(self, name: str) -> str:
+        """Return the style id of ``name``."""
+        if name not in self._styles:
+            self._styles[name] = self.doc.styles[name].style_id
+        return self._styles[name]
+
+    def heading(self, text: str, level: int = 1):
+        p = self.doc.add_paragraph(text)
+        p._p.style = self.style("Title" if level == 0 else f"Heading {level}")
+        return p
+
+    def paragraph(self, text: str = ""):
+        return self.doc.add_paragraph(text)
+
+    def _image(self, source):
+        """Return ``(rId, Image)`` of ``source`` (path or bytes), adding it once."""
+        if isinstance(source, (bytes, bytearray)):
+            blob = bytes(source)
+        else:
+            with open(source, "rb") as fh:
+                blob = fh.read()
+        digest = hashlib.sha1(blob).hexdigest()
+        if digest not in self._images:
+            image = Image.from_blob(blob)
+            self._n_images += 1
+            partname = PackURI(f"/word/media/image{self._n_images}.{image.ext}")
+            part = ImagePart.from_image(image, partname)
+            self.doc.part.package.image_parts.append(part)
+            rels = self.doc.part.rels
+            self._n_rels += 1
+            while f"rId{self._n_rels}" in rels:
+                self._n_rels += 1
+            rId = f"rId{self._n_rels}"
+            rels.add_relationship(RT.IMAGE, part, rId)
+            self._images[digest] = (rId, image)
+        return self._images[digest]
+
+    def picture(self, source, width) -> None:
+        rId, image = self._image(source)
+        cx, cy = image.scaled_dimensions(width, None)
+        inline = CT_Inline.new_pic_inline(self._shape_id, rId, image.filename, cx, cy)
+        self._shape_id += 1
+        self.doc.add_paragraph().add_run()._r.add_drawing(inline)
+
+    def table(self, rows: Sequence[Sequence[Any]], header: Optional[Sequence[str]] = None):
+        """Add a grid table with an optional bold header."""
+        data = ([list(header)] if header else []) + [list(r) for r in rows]
+        if not data:
+            return None
+        table = self.doc.add_table(rows=len(data), cols=max(len(r) for r in data))
+        table._tbl.tblStyle_val = self.style("Table Grid")
+        for i, row in enumerate(data):
+            cells = table.rows[i].cells
+            for j, value in enumerate(row):
+                cells[j].text = str(value)
+                if header and i == 0:
+                    for run in cells[j].paragraphs[0].runs:
+                        run.bold = True
+        return table
+
+    def formula(self, latex: str) -> None:
+        """Add a cached formula image at its natural size."""
+        latex = latex.strip().strip("$")
+        if not latex:
+            return
+        try:
+            png = formula_png(latex, FORMULA_SIZE, FORMULA_DPI)
+        except ValueError:  # unsupported by mathtext; keep the source
+            self.paragraph(latex)
+            return
+        # PNG width is stored big-endian at bytes 16-19 of the IHDR chunk
+        width = int.from_bytes(png[16:20], "big") / FORMULA_DPI
+        self.picture(png, Inches(min(width, 6.0)))
+
+
+def flexure_blocks(w: _Writer, flexure: tuple) -> Iterator[None]:
+    """Write the flexure memory of one beam, yielding after each block."""
+    datos, resultados, tabla, imagenes, seccion, dev_as = flexure
+    w.heading("Diseño por flexión", level=2)
+    w.table(datos, ("Dato", "Valor"))
+    if seccion and os.path.isfile(seccion):
+        w.picture(seccion, Inches(2.5))
+    # Section cuts captured from the development view, as in the HTML memory
+    for path in imagenes:
+        if path and os.path.isfile(path):
+            w.picture(path, Inches(6))
+    yield
+    for key, parts in resultados:
+        parts = dict(parts)
+        if not any(parts.values()):
+            continue
+        w.heading(FLEXURE_TITLES.get(key, key), level=3)
+        for name in ("general", "reemplazo", "resultado"):
+            if parts.get(name):
+                w.formula(parts[name])
+        yield
+    for title, forms in dev_as:
+        w.heading(title, level=3)
+        for latex in forms:
+            w.formula(latex)
+        yield
+    if tabla:
+        w.heading("Resumen de acero", level=3)
+        w.table(tabla, ("Sección", "As requerido", "As diseño", "Estado"))
+        yield
+
+
+def shear_blocks(w: _Writer, shear: Any) -> Iterator[None]:
+    """Write the shear memory of one beam, yielding after each block."""
+    res = shear.result
+    w.heading("Diseño por cortante", level=2)
+    w.table(shear.fields, ("Parámetro", "Valor"))
+    yield
+    w.table(
+        [
+            ("Vc (T)", f"{res.Vc:.2f}"),
+            ("Vs (T)", f"{res.Vs:.2f}"),
+            ("ϕVc (T)", f"{res.phi_Vc:.2f}"),
+            ("ϕ(Vc+Vs) (T)", f"{res.phi_Vc_Vs:.2f}"),
+            ("Lo (cm)", f"{res.Lo:.0f}"),
+            ("Separación SC (cm)", f"{res.S_sc:.2f}"),
+            ("Separación SR (cm)", f"{res.S_sr:.2f}"),
+            ("Cumple", "SI" if res.ok else "NO"),
+        ],
+        ("Resultado", "Valor"),
+    )
+    yield
+
+
+def beam_blocks(w: _Writer, beam: BeamMemoria) -> Iterator[None]:
+    """Write the flexure and shear memory of ``beam``."""
+    w.heading(f"Viga {beam.label}", level=1)
+    if beam.flexure is not None:
+        yield from flexure_blocks(w, beam.flexure)
+    if beam.shear is not None and getattr(beam.shear, "result", None) is not None:
+        yield from shear_blocks(w, beam.shear)
+
+
+@timed()
+def write_memoria_docx(
+    beams: Iterable[BeamMemoria],
+    path: str,
+    *,
+    total: Optional[int] = None,
+    progress: Optional[Callable[[int, str], None]] = None,
+    title: str = "MEMORIA DE CÁLCULO",
+) -> str:
+    """Write the memory of ``beams`` to ``path`` and return it.
+
+    ``beams`` may be a generator; each beam is written and released
+    before the next one is requested. Formula images come from the
+    shared mathtext cache and python-docx stores identical images once,
+    so repeated general formulas cost a single image part.
+    """
+    doc = Document()
+    doc.styles["Normal"].font.size = Pt(10)
+    w = _Writer(doc)
+    body = doc.element.body
+    sect = body.sectPr
+    # python-docx looks for the section properties on every insertion, so
+    # finished beams are parked outside the body and put back at the end
+    done = []
+    w.heading(title, level=0)
+    for i, beam in enumerate(beams):
+        if i:
+            doc.add_page_break()
+        pct = int(90 * i / total) if total else min(90, i)
+        if progress is not None:
+            progress(pct, f"Viga {beam.label}")
+        for _ in beam_blocks(w, beam):
+            # Lets a cancelled export stop between blocks
+            if progress is not None:
+                progress(pct, "")
+        for el in list(body):
+            if el is not sect:
+                body.remove(el)
+                done.append(el)
+    for el in done:
+        if sect is not None:
+            sect.addprevious(el)
+        else:
+            body.append(el)
+    if progress is not None:
+        progress(95, "Guardando")
+    doc.save(path)
+    return path
+
+
+def export_memoria_docx(snapshot: Tuple[str, Tuple[BeamMemoria, ...]], progress) -> str:
+    """Background job writing the Word memory of ``(path, beams)``."""
+    path, beams = snapshot
+    out = write_memoria_docx(beams, path, total=len(beams), progress=progress)
+    progress(100, "Listo")
+    return out
@@ -0,0 +1,101 @@
+"""Formula images rendered once with Matplotlib mathtext and cached."""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from io import BytesIO
+from typing import Tuple
+
+from matplotlib import mathtext
+from matplotlib.font_manager import FontProperties
+
+# Bounds of the in-memory cache
+MAX_ENTRIES = 512
+MAX_BYTES = 32 * 1024 * 1024
+
+FORMATS = ("png", "svg", "pdf")
+
+Key = Tuple[str, int, int, str]
+
+
+def _math(latex: str) -> str:
+    """Return ``latex`` wrapped in ``$`` as mathtext expects."""
+    latex = latex.strip()
+    if latex.startswith("$") and latex.endswith("$") and len(latex) > 1:
+        return latex
+    return f"${latex}$"
+
+
+class FormulaImageCache:
+    """LRU of rendered formulas keyed by ``(latex, fontsize, dpi, format)``.
+
+    Entries are evicted oldest first once either ``max_entries`` or
+    ``max_bytes`` is exceeded.
+    """
+
+    def __init__(self, max_entries: int = MAX_ENTRIES, max_bytes: int = MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._data: "OrderedDict[Key, bytes]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @property
+    def size(self) -> int:
+        """Total bytes held."""
+        return self._size
+
+    def render(self, latex: str, fontsize: int = 12, dpi: int = 200, fmt: str = "png") -> bytes:
+        """Return the image of ``latex`` as ``fmt`` bytes."""
+        if fmt not in FORMATS:
+            raise ValueError(f"Formato no soportado: {fmt}")
+        key = (latex, int(fontsize), int(dpi), fmt)
+        with self._lock:
+            data = self._data.get(key)
+            if data is not None:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return data
+            self.misses += 1
+        buf = BytesIO()
+        # math_to_image builds its own Figure, so this is safe off the GUI thread
+        mathtext.math_to_image(_math(latex), buf, prop=FontProperties(size=fontsize), dpi=dpi, format=fmt)
+        data = buf.getvalue()
+        with self._lock:
+            if key not in self._data:
+                self._data[key] = data
+                self._size += len(data)
+                self._evict()
+        return data
+
+    def _evict(self) -> None:
+        while self._data and (len(self._data) > self.max_entries or self._size > self.max_bytes):
+            _, old = self._data.popitem(last=False)
+            self._size -= len(old)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._size = 0
+
+
+formula_images = FormulaImageCache()
+
+
+def formula_png(latex: str, fontsize: int = 12, dpi: int = 200) -> bytes:
+    """Return the cached PNG of ``latex``."""
+    return formula_images.render(latex, fontsize, dpi, "png")
+
+
+def save_formula(latex: str, path: str, *, fontsize: int = 12, dpi: int = 300) -> str:
+    """Write the image of ``latex`` to ``path`` (format from its extension)."""
+    fmt = path.rsplit(".", 1)[-1].lower() if "." in path else "png"
+    with open(path, "wb") as fh:
+        fh.write(formula_images.render(latex, fontsize, dpi, fmt))
+    return path
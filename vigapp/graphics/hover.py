@@ -0,0 +1,134 @@
+"""Lightweight hover readout for sampled curves on Matplotlib axes."""
+
+from __future__ import annotations
+
+from typing import Callable, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Maximum distance (px) between the mouse and a curve to show the readout
+PICK_RADIUS = 15.0
+
+# Attribute holding the hover on its axes, so both are collected together
+_ATTR = "_vig_hover"
+
+
+def _default_fmt(index: int, y: float) -> str:
+    return f"{y:.2f}"
+
+
+class CurveHover:
+    """Show the value of the nearest curve sample under the mouse.
+
+    The sampled curves are stored as arrays and looked up with
+    ``searchsorted``; the single annotation is redrawn by blitting over a
+    background cached on every full draw. Use :func:`hover_for` so the
+    canvas handlers are connected only once per axes.
+    """
+
+    def __init__(self, ax):
+        self.ax = ax
+        self.canvas = ax.figure.canvas
+        self.x = np.zeros(0)
+        self.ys = np.zeros((0, 0))
+        self.fmt: Callable[[int, float], str] = _default_fmt
+        self.annot = None
+        self._bg = None
+        self._cids = [
+            self.canvas.mpl_connect("draw_event", self._on_draw),
+            self.canvas.mpl_connect("motion_notify_event", self._on_move),
+        ]
+
+    def set_curves(
+        self,
+        x: np.ndarray,
+        ys: Sequence[np.ndarray],
+        fmt: Optional[Callable[[int, float], str]] = None,
+    ) -> None:
+        """Replace the hovered curves; ``x`` must be increasing."""
+        self.x = np.asarray(x, dtype=float)
+        self.ys = np.atleast_2d(np.asarray(ys, dtype=float))
+        if fmt is not None:
+            self.fmt = fmt
+        # ``ax.clear`` removes the previous annotation, so create it again
+        if not self._attached():
+            self.annot = self.ax.annotate(
+                "",
+                (0, 0),
+                xytext=(10, 10),
+                textcoords="offset points",
+                bbox=dict(boxstyle="round", fc="w", alpha=0.9),
+                arrowprops=dict(arrowstyle="->"),
+                animated=True,
+            )
+            self.annot.set_visible(False)
+
+    def _attached(self) -> bool:
+        return self.annot is not None and self.annot in self.ax.texts
+
+    def disconnect(self) -> None:
+        """Remove the canvas handlers."""
+        for cid in self._cids:
+            self.canvas.mpl_disconnect(cid)
+        self._cids = []
+        if getattr(self.ax, _ATTR, None) is self:
+            delattr(self.ax, _ATTR)
+
+    def nearest(self, xdata: float, ydata: float) -> Optional[Tuple[int, int]]:
+        """Return ``(curve, sample)`` closest to a data point within the radius."""
+        n = self.x.size
+        if n == 0:
+            return None
+        i = int(np.searchsorted(self.x, xdata))
+        cand = np.array([max(i - 1, 0), min(i, n - 1)])
+        pts = np.column_stack(
+            [np.tile(self.x[cand], len(self.ys)), self.ys[:, cand].ravel()]
+        )
+        disp = self.ax.transData.transform(pts)
+        mouse = self.ax.transData.transform((xdata, ydata))
+        dist = np.hypot(*(disp - mouse).T)
+        k = int(np.argmin(dist))
+        if dist[k] > PICK_RADIUS:
+            return None
+        return k // 2, int(cand[k % 2])
+
+    def _on_draw(self, event) -> None:
+        self._bg = self.canvas.copy_from_bbox(self.ax.figure.bbox)
+        if self.annot is not None and self.annot.get_visible():
+            self.ax.draw_artist(self.annot)
+
+    def _on_move(self, event) -> None:
+        if not self._attached():
+            return
+        hit = None
+        if event.inaxes is self.ax and event.xdata is not None:
+            hit = self.nearest(event.xdata, event.ydata)
+        if hit is None:
+            if self.annot.get_visible():
+                self.annot.set_visible(False)
+                self._blit()
+            return
+        curve, i = hit
+        y = float(self.ys[curve, i])
+        self.annot.xy = (self.x[i], y)
+        self.annot.set_text(self.fmt(curve, y))
+        self.annot.set_visible(True)
+        self._blit()
+
+    def _blit(self) -> None:
+        if self._bg is None:
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self._bg)
+        if self.annot.get_visible():
+            self.ax.draw_artist(self.annot)
+        self.canvas.blit(self.ax.figure.bbox)
+
+
+def hover_for(ax) -> CurveHover:
+    """Return the hover of ``ax``, creating it on first use."""
+    hover = getattr(ax, _ATTR, None)
+    if hover is None:
+        hover = CurveHover(ax)
+        setattr(ax, _ATTR, hover)
+    return hover
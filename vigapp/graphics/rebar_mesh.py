@@ -0,0 +1,303 @@
+"""Merged triangle meshes of longitudinal bars and stirrups for the 3D view.
+
+Every diameter shares one unit cylinder and every stirrup shape one
+swept tube; the instances of a group are written into a single vertex
+buffer, so a beam is drawn with one mesh item per diameter plus one for
+the stirrups.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..models.constants import DIAM_CM
+from .utilities import distribute_x, layer_positions_bottom, layer_positions_top
+
+# Sides of the polygon approximating a bar cross-section
+SEGMENTS = 8
+
+# Samples along each bent corner of a stirrup
+CORNER_SAMPLES = 4
+
+# First stirrup from the support face (cm)
+FIRST_STIRRUP = 5.0
+
+Mesh = Tuple[np.ndarray, np.ndarray]
+
+
+@dataclass(frozen=True)
+class Bar:
+    """Longitudinal bar of diameter ``key`` at ``(x, y)`` from ``z0`` to ``z1`` (cm)."""
+
+    key: str
+    x: float
+    y: float
+    z0: float
+    z1: float
+
+
+@dataclass(frozen=True)
+class RebarModel:
+    """Concrete prism, longitudinal bars and stirrup positions of a beam (cm)."""
+
+    b: float
+    h: float
+    L: float
+    r: float = 4.0
+    stirrup_key: str = '3/8"'
+    bars: Tuple[Bar, ...] = ()
+    stirrups: Tuple[float, ...] = ()
+
+
+@lru_cache(maxsize=None)
+def bar_mesh(key: str, segments: int = SEGMENTS) -> Mesh:
+    """Return a closed cylinder of diameter ``key`` from ``z=0`` to ``z=1``."""
+    radius = DIAM_CM[key] / 2.0
+    t = np.linspace(0.0, 2.0 * np.pi, segments, endpoint=False)
+    ring = np.column_stack([radius * np.cos(t), radius * np.sin(t)])
+    verts = np.vstack(
+        [
+            np.column_stack([ring, np.zeros(segments)]),
+            np.column_stack([ring, np.ones(segments)]),
+            [[0.0, 0.0, 0.0], [0.0, 0.0, 1.0]],
+        ]
+    )
+    i = np.arange(segments)
+    j = (i + 1) % segments
+    c0, c1 = 2 * segments, 2 * segments + 1
+    faces = np.vstack(
+        [
+            np.column_stack([i, j, i + segments]),
+            np.column_stack([j, j + segments, i + segments]),
+            np.column_stack([np.full(segments, c0), j, i]),
+            np.column_stack([np.full(segments, c1), i + segments, j + segments]),
+        ]
+    )
+    return _frozen(verts), _frozen(faces)
+
+
+@lru_cache(maxsize=64)
+def stirrup_mesh(b: float, h: float, r: float, key: str, segments: int = SEGMENTS) -> Mesh:
+    """Return a closed stirrup tube in the plane ``z=0``.
+
+    The centerline runs at ``r + de/2`` from the faces with corners bent
+    around a radius of two diameters.
+    """
+    de = DIAM_CM[key]
+    off = r + de / 2.0
+    bend = min(2.0 * de, (b - 2 * off) / 2.0, (h - 2 * off) / 2.0)
+    corners = (
+        (b - off - bend, off + bend, -np.pi / 2),
+        (b - off - bend, h - off - bend, 0.0),
+        (off + bend, h - off - bend, np.pi / 2),
+        (off + bend, off + bend, np.pi),
+    )
+    path = []
+    for cx, cy, start in corners:
+        a = start + np.linspace(0.0, np.pi / 2, CORNER_SAMPLES)
+        path.append(np.column_stack([cx + bend * np.cos(a), cy + bend * np.sin(a)]))
+    path = np.vstack(path)
+    n = len(path)
+    # Outward normal at each path point, used to sweep the tube section
+    tangent = np.roll(path, -1, axis=0) - np.roll(path, 1, axis=0)
+    normal = np.column_stack([tangent[:, 1], -tangent[:, 0]])
+    normal /= np.linalg.norm(normal, axis=1)[:, None]
+    t = np.linspace(0.0, 2.0 * np.pi, segments, endpoint=False)
+    rad = de / 2.0
+    xy = path[:, None, :] + rad * np.cos(t)[None, :, None] * normal[:, None, :]
+    z = np.broadcast_to(rad * np.sin(t)[None, :], (n, segments))
+    verts = np.concatenate([xy, z[..., None]], axis=2).reshape(-1, 3)
+
+    p = np.arange(n)[:, None]
+    s = np.arange(segments)[None, :]
+    a = p * segments + s
+    b_ = p * segments + (s + 1) % segments
+    c = ((p + 1) % n) * segments + s
+    d = ((p + 1) % n) * segments + (s + 1) % segments
+    faces = np.concatenate(
+        [np.stack([a, b_, c], axis=-1), np.stack([b_, d, c], axis=-1)], axis=1
+    ).reshape(-1, 3)
+    return _frozen(verts), _frozen(faces)
+
+
+def _frozen(arr: np.ndarray) -> np.ndarray:
+    arr = np.ascontiguousarray(arr)
+    arr.setflags(write=False)
+    return arr
+
+
+def place(verts: np.ndarray, origin: np.ndarray, scale_z: Optional[np.ndarray] = None) -> np.ndarray:
+    """Return ``(M, V, 3)`` copies of ``verts`` scaled along z and translated."""
+    out = np.broadcast_to(verts, (len(origin),) + verts.shape).copy()
+    if scale_z is not None:
+        out[..., 2] *= np.asarray(scale_z)[:, None]
+    out += np.asarray(origin)[:, None, :]
+    return out
+
+
+def merge_faces(faces: np.ndarray, n_instances: int, n_verts: int) -> np.ndarray:
+    """Return the faces of ``n_instances`` copies sharing one vertex buffer."""
+    offsets = (np.arange(n_instances) * n_verts)[:, None, None]
+    return (faces[None] + offsets).reshape(-1, 3)
+
+
+class RebarMeshes:
+    """Merged buffers per group, rebuilt only where the model changed.
+
+    Groups are ``("bar", key)`` for each diameter and ``("stirrups",)``.
+    When a group keeps its number of instances only the vertices of the
+    moved instances are rewritten.
+    """
+
+    def __init__(self):
+        self._instances: Dict[Hashable, tuple] = {}
+        self._verts: Dict[Hashable, np.ndarray] = {}
+        self._faces: Dict[Hashable, np.ndarray] = {}
+        self._stirrup_shape = None
+
+    def mesh(self, group: Hashable) -> Optional[Mesh]:
+        """Return the merged ``(vertexes, faces)`` of ``group``."""
+        if group not in self._verts:
+            return None
+        return self._verts[group].reshape(-1, 3), self._faces[group]
+
+    @property
+    def groups(self) -> List[Hashable]:
+        return list(self._verts)
+
+    def update(self, model: RebarModel) -> Dict[Hashable, Optional[Mesh]]:
+        """Sync with ``model`` and return the changed groups (``None`` = removed)."""
+        wanted: Dict[Hashable, tuple] = {}
+        for bar in model.bars:
+            wanted.setdefault(("bar", bar.key), []).append((bar.x, bar.y, bar.z0, bar.z1))
+        shape = (model.b, model.h, model.r, model.stirrup_key)
+        if model.stirrups and model.stirrup_key in DIAM_CM:
+            wanted[("stirrups",)] = [(0.0, 0.0, z, z) for z in model.stirrups]
+        wanted = {g: tuple(v) for g, v in wanted.items()}
+        # A new stirrup shape changes every instance
+        if shape != self._stirrup_shape:
+            self._instances.pop(("stirrups",), None)
+            self._stirrup_shape = shape
+
+        changed: Dict[Hashable, Optional[Mesh]] = {}
+        for group in list(self._verts):
+            if group not in wanted:
+                for store in (self._instances, self._verts, self._faces):
+                    store.pop(group, None)
+                changed[group] = None
+        for group, inst in wanted.items():
+            old = self._instances.get(group)
+            if old == inst:
+                continue
+            self._build(group, inst, old, model)
+            self._instances[group] = inst
+            changed[group] = self.mesh(group)
+        return changed
+
+    def _build(self, group, inst, old, model: RebarModel) -> None:
+        if group[0] == "bar":
+            verts, faces = bar_mesh(group[1])
+        else:
+            verts, faces = stirrup_mesh(model.b, model.h, model.r, model.stirrup_key)
+        data = np.array(inst, dtype=float)
+        if old is not None and len(old) == len(inst):
+            idx = np.flatnonzero(np.any(np.array(old) != data, axis=1))
+        else:
+            self._verts[group] = np.empty((len(inst),) + verts.shape)
+            self._faces[group] = merge_faces(faces, len(inst), len(verts))
+            idx = np.arange(len(inst))
+        sel = data[idx]
+        origin = sel[:, :3]
+        scale = sel[:, 3] - sel[:, 2] if group[0] == "bar" else None
+        self._verts[group][idx] = place(verts, origin, scale)
+
+
+def prism_mesh(b: float, h: float, L: float) -> Mesh:
+    """Return the 12 triangles of the concrete prism."""
+    verts = np.array(
+        [
+            [0, 0, 0], [b, 0, 0], [b, h, 0], [0, h, 0],
+            [0, 0, L], [b, 0, L], [b, h, L], [0, h, L],
+        ],
+        dtype=float,
+    )
+    faces = np.array(
+        [
+            [0, 1, 2], [0, 2, 3],
+            [4, 5, 6], [4, 6, 7],
+            [0, 1, 5], [0, 5, 4],
+            [1, 2, 6], [1, 6, 5],
+            [2, 3, 7], [2, 7, 6],
+            [3, 0, 4], [3, 4, 7],
+        ]
+    )
+    return verts, faces
+
+
+def stirrup_positions(L: float, Lo: float, s_sc: float, s_sr: float) -> Tuple[float, ...]:
+    """Return stirrup z positions (cm) for confinement zones ``Lo`` at both ends.
+
+    ``L`` and ``Lo`` are in cm, like the spacings.
+    """
+    if L <= 0 or s_sc <= 0 or s_sr <= 0:
+        return ()
+    Lo = min(Lo, L / 2.0)
+    ends = np.arange(FIRST_STIRRUP, Lo + 1e-9, s_sc)
+    start = ends[-1] + s_sr if len(ends) else FIRST_STIRRUP
+    middle = np.arange(start, L - start + 1e-9, s_sr)
+    z = np.concatenate([ends, middle, L - ends[::-1]])
+    return tuple(float(v) for v in np.unique(np.round(z, 6)))
+
+
+def _section_bars(layers: Dict[int, List[Tuple[float, str]]], ys: Dict[int, float], b, r, de):
+    out = []
+    for layer in sorted(layers):
+        keys = [k for _, k in layers[layer]]
+        xs = distribute_x([DIAM_CM[k] for k in keys], b, r, de)
+        for x, k in zip(xs, keys):
+            out.append((k, round(x, 6), round(ys[layer], 6)))
+    return out
+
+
+def beam_model(
+    b: float,
+    h: float,
+    L: float,
+    r: float,
+    stirrup_key: str,
+    neg_layers: Sequence[Dict[int, List[Tuple[float, str]]]],
+    pos_layers: Sequence[Dict[int, List[Tuple[float, str]]]],
+    stirrups: Iterable[float] = (),
+) -> RebarModel:
+    """Build the 3D model from the bars of the M1, M2 and M3 sections.
+
+    ``neg_layers``/``pos_layers`` are the per-layer ``(diameter, key)``
+    lists of the sections view. Each section covers a third of ``L``
+    (cm); a bar found at the same place in consecutive thirds becomes a
+    single continuous bar.
+    """
+    de = DIAM_CM.get(stirrup_key, 0.0)
+    zones = [float(z) for z in np.linspace(0.0, L, len(neg_layers) + 1)]
+    runs: Dict[Tuple[str, float, float], List[float]] = {}
+    bars: List[Bar] = []
+    for zone, (neg, pos) in enumerate(zip(neg_layers, pos_layers)):
+        current = _section_bars(neg, layer_positions_top(neg, r, de, h), b, r, de)
+        current += _section_bars(pos, layer_positions_bottom(pos, r, de), b, r, de)
+        seen = set()
+        for spot in current:
+            if spot in seen:
+                continue
+            seen.add(spot)
+            if spot in runs and runs[spot][1] == zones[zone]:
+                runs[spot][1] = zones[zone + 1]
+            else:
+                if spot in runs:
+                    bars.append(Bar(spot[0], spot[1], spot[2], *runs[spot]))
+                runs[spot] = [zones[zone], zones[zone + 1]]
+    bars += [Bar(k, x, y, z0, z1) for (k, x, y), (z0, z1) in runs.items()]
+    bars.sort(key=lambda bar: (bar.key, bar.z0, bar.y, bar.x))
+    return RebarModel(b, h, L, r, stirrup_key, tuple(bars), tuple(stirrups))
@@ -0,0 +1,181 @@
+"""Culling and level of detail for 3D scenes with many beams.
+
+Beams are placed in the floor with an origin and a rotation about the
+vertical axis (``y``, the section height). Each beam is drawn at one of
+three levels depending on its apparent size: full meshes, bar and
+stirrup lines, or its bounding box. Geometry is plain numpy so it can be
+built off the GUI thread.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Hashable, Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..models.constants import DIAM_CM
+from .rebar_mesh import RebarMeshes, RebarModel, prism_mesh
+
+# Levels of detail
+LOD_FULL = 0
+LOD_LINES = 1
+LOD_BOX = 2
+
+# Bounding radius over camera distance above which each level is used
+FULL_SIZE = 0.25
+LINES_SIZE = 0.05
+
+# Edges of a box given by its 8 corners as ordered in ``_corners``
+_BOX_EDGES = np.array(
+    [[0, 1], [1, 2], [2, 3], [3, 0], [4, 5], [5, 6], [6, 7], [7, 4], [0, 4], [1, 5], [2, 6], [3, 7]]
+)
+
+
+@dataclass(frozen=True)
+class SceneBeam:
+    """Beam of a scene: its model, origin (cm) and rotation about ``y`` (degrees)."""
+
+    model: RebarModel
+    origin: Tuple[float, float, float] = (0.0, 0.0, 0.0)
+    angle: float = 0.0
+    label: str = ""
+
+
+def beam_transform(beam: SceneBeam) -> np.ndarray:
+    """Return the 4x4 matrix placing the beam in the scene."""
+    a = np.radians(beam.angle)
+    c, s = np.cos(a), np.sin(a)
+    m = np.eye(4)
+    m[:3, :3] = [[c, 0.0, s], [0.0, 1.0, 0.0], [-s, 0.0, c]]
+    m[:3, 3] = beam.origin
+    return m
+
+
+def bounding_spheres(beams: Sequence[SceneBeam]) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the ``(N, 3)`` world centers and ``(N,)`` radii of the beams."""
+    centers = np.zeros((len(beams), 3))
+    radii = np.zeros(len(beams))
+    for i, beam in enumerate(beams):
+        m = beam.model
+        local = np.array([m.b / 2, m.h / 2, m.L / 2, 1.0])
+        centers[i] = (beam_transform(beam) @ local)[:3]
+        radii[i] = 0.5 * np.sqrt(m.b ** 2 + m.h ** 2 + m.L ** 2)
+    return centers, radii
+
+
+def frustum_planes(mvp) -> np.ndarray:
+    """Return the six ``(a, b, c, d)`` planes of a projection·view matrix.
+
+    Planes point inwards and are normalized, so ``a·x + b·y + c·z + d``
+    is the signed distance of a point to each of them.
+    """
+    m = np.asarray(mvp, dtype=float)
+    planes = np.array(
+        [m[3] + m[0], m[3] - m[0], m[3] + m[1], m[3] - m[1], m[3] + m[2], m[3] - m[2]]
+    )
+    return planes / np.linalg.norm(planes[:, :3], axis=1)[:, None]
+
+
+def visible(planes: np.ndarray, centers: np.ndarray, radii: np.ndarray) -> np.ndarray:
+    """Return which spheres are at least partly inside the frustum."""
+    dist = centers @ planes[:, :3].T + planes[:, 3]
+    return np.all(dist >= -np.asarray(radii)[:, None], axis=1)
+
+
+def lod_levels(
+    eye, centers: np.ndarray, radii: np.ndarray, *, full: float = FULL_SIZE, lines: float = LINES_SIZE
+) -> np.ndarray:
+    """Return the level of detail of each beam seen from ``eye``."""
+    dist = np.linalg.norm(np.asarray(centers) - np.asarray(eye, dtype=float), axis=1)
+    size = np.asarray(radii) / np.maximum(dist, 1e-9)
+    return np.where(size >= full, LOD_FULL, np.where(size >= lines, LOD_LINES, LOD_BOX))
+
+
+def _corners(x0, y0, z0, x1, y1, z1) -> np.ndarray:
+    return np.array(
+        [
+            [x0, y0, z0], [x1, y0, z0], [x1, y1, z0], [x0, y1, z0],
+            [x0, y0, z1], [x1, y0, z1], [x1, y1, z1], [x0, y1, z1],
+        ],
+        dtype=float,
+    )
+
+
+def box_lines(b: float, h: float, L: float) -> np.ndarray:
+    """Return the 12 edges of the beam prism as ``(24, 3)`` line endpoints."""
+    return _corners(0, 0, 0, b, h, L)[_BOX_EDGES].reshape(-1, 3)
+
+
+def rebar_lines(model: RebarModel) -> np.ndarray:
+    """Return bars and stirrups as line endpoints.
+
+    Each bar is one segment along its axis and each stirrup the four
+    sides of its centerline rectangle.
+    """
+    segs = [
+        np.array([[bar.x, bar.y, bar.z0], [bar.x, bar.y, bar.z1]]) for bar in model.bars
+    ]
+    if model.stirrups:
+        off = model.r + DIAM_CM.get(model.stirrup_key, 0.0) / 2.0
+        rect = np.array(
+            [[off, off], [model.b - off, off], [model.b - off, model.h - off], [off, model.h - off]]
+        )
+        sides = np.stack([rect, np.roll(rect, -1, axis=0)], axis=1)  # (4, 2, 2)
+        z = np.asarray(model.stirrups, dtype=float)
+        xy = np.broadcast_to(sides, (len(z),) + sides.shape)
+        zz = np.broadcast_to(z[:, None, None, None], (len(z), 4, 2, 1))
+        segs.append(np.concatenate([xy, zz], axis=-1).reshape(-1, 3))
+    if not segs:
+        return np.zeros((0, 3))
+    return np.vstack(segs)
+
+
+def build_geometry(model: RebarModel, level: int) -> Dict[Hashable, object]:
+    """Return the geometry of a beam at ``level`` in its local axes.
+
+    Mesh groups map to ``(vertexes, faces)``; ``"lines"`` to line
+    endpoints.
+    """
+    if level == LOD_FULL:
+        geom: Dict[Hashable, object] = {("prism",): prism_mesh(model.b, model.h, model.L)}
+        geom.update(RebarMeshes().update(model))
+        return geom
+    if level == LOD_LINES:
+        return {"lines": np.vstack([box_lines(model.b, model.h, model.L), rebar_lines(model)])}
+    return {"lines": box_lines(model.b, model.h, model.L)}
+
+
+class GeometryCache:
+    """Geometry built on demand per ``(beam index, level)``."""
+
+    def __init__(self, beams: Iterable[SceneBeam] = ()):
+        self.beams = list(beams)
+        self.centers, self.radii = bounding_spheres(self.beams)
+        self._geometry: Dict[Tuple[int, int], dict] = {}
+
+    def __len__(self) -> int:
+        return len(self.beams)
+
+    def get(self, key: Tuple[int, int]) -> Optional[dict]:
+        return self._geometry.get(key)
+
+    def store(self, key: Tuple[int, int], geometry: dict) -> None:
+        self._geometry[key] = geometry
+
+    def plan(self, planes: np.ndarray, eye) -> Tuple[Dict[int, int], list]:
+        """Return the level of each visible beam and the keys still to build."""
+        shown = np.flatnonzero(visible(planes, self.centers, self.radii))
+        levels = lod_levels(eye, self.centers[shown], self.radii[shown])
+        wanted = {int(i): int(lv) for i, lv in zip(shown, levels)}
+        missing = [(i, lv) for i, lv in wanted.items() if (i, lv) not in self._geometry]
+        return wanted, missing
+
+    def build(self, keys: Sequence[Tuple[int, int]], progress=None) -> list:
+        """Build ``keys`` without storing them; safe to call from a worker."""
+        out = []
+        for n, (i, lv) in enumerate(keys):
+            if progress is not None:
+                progress(int(100 * n / max(len(keys), 1)), "")
+            out.append(((i, lv), build_geometry(self.beams[i].model, lv)))
+        return out
@@ -1,8 +1,40 @@
 """3D window rendering the beam model using pyqtgraph.opengl."""
 
+import numpy as np
+from PyQt5.QtCore import QThreadPool, QTimer, pyqtSignal
+from PyQt5.QtGui import QColor, QMatrix4x4
 from PyQt5.QtWidgets import QMainWindow, QVBoxLayout, QWidget
 import pyqtgraph.opengl as gl
-import numpy as np
+from pyqtgraph import Vector
+
+from ..ui.workers import ExportTask
+from .rebar_mesh import RebarMeshes, RebarModel, prism_mesh
+from .scene3d import GeometryCache, beam_transform, frustum_planes
+from .utilities import DIAM_COLOR
+
+STIRRUP_COLOR = (0.2, 0.6, 0.2, 1.0)
+LINE_COLOR = (0.8, 0.8, 0.8, 1.0)
+
+# Delay (ms) after the last camera move before culling again
+CULL_DELAY = 80
+
+
+class _SceneView(gl.GLViewWidget):
+    """GL view that reports camera moves."""
+
+    cameraChanged = pyqtSignal()
+
+    def mouseMoveEvent(self, ev):
+        super().mouseMoveEvent(ev)
+        self.cameraChanged.emit()
+
+    def wheelEvent(self, ev):
+        super().wheelEvent(ev)
+        self.cameraChanged.emit()
+
+    def resizeGL(self, w, h):
+        super().resizeGL(w, h)
+        self.cameraChanged.emit()
 
 
 class Section3DView(QMainWindow):
@@ -14,25 +46,145 @@ class Section3DView(QMainWindow):
         central = QWidget()
         self.setCentralWidget(central)
         layout = QVBoxLayout(central)
-        self.view = gl.GLViewWidget()
+        self.view = _SceneView()
         layout.addWidget(self.view)
         self.view.opts['distance'] = 200
+        self.meshes = RebarMeshes()
+        self._items = {}
+        self._prism = None
+
+        self.scene = None
+        self._scene_items = {}
+        self._task = None
+        self._cull_timer = QTimer(self)
+        self._cull_timer.setSingleShot(True)
+        self._cull_timer.setInterval(CULL_DELAY)
+        self._cull_timer.timeout.connect(self.refresh_scene)
+        self.view.cameraChanged.connect(self._cull_timer.start)
+
+    def set_model(self, b, h, L, bars=(), stirrups=(), *, r=4.0, stirrup_key='3/8"'):
+        """Draw the beam prism with its bars and stirrups.
+
+        Each diameter and the stirrups are a single mesh item; only the
+        groups that changed since the previous call are re-uploaded.
+        """
+        self.set_rebar(RebarModel(b, h, L, r, stirrup_key, tuple(bars), tuple(stirrups)))
+
+    def set_rebar(self, model: RebarModel):
+        """Sync the scene with ``model``."""
+        verts, faces = prism_mesh(model.b, model.h, model.L)
+        if self._prism is None:
+            self._prism = gl.GLMeshItem(
+                vertexes=verts, faces=faces, smooth=False, color=(0.5, 0.5, 0.5, 0.3),
+                shader='shaded', drawEdges=True, glOptions='translucent',
+            )
+            self.view.addItem(self._prism)
+        else:
+            self._prism.setMeshData(vertexes=verts, faces=faces)
+
+        for group, mesh in self.meshes.update(model).items():
+            item = self._items.get(group)
+            if mesh is None:
+                if item is not None:
+                    self.view.removeItem(item)
+                    del self._items[group]
+                continue
+            if item is None:
+                item = gl.GLMeshItem(
+                    vertexes=mesh[0], faces=mesh[1], smooth=False,
+                    color=self._color(group), shader='shaded',
+                )
+                self.view.addItem(item)
+                self._items[group] = item
+            else:
+                item.setMeshData(vertexes=mesh[0], faces=mesh[1])
+        self.view.opts['center'] = Vector(model.b / 2, model.h / 2, model.L / 2)
+
+    @staticmethod
+    def _color(group):
+        if group[0] == "bar":
+            return QColor(DIAM_COLOR.get(group[1], "red")).getRgbF()
+        return STIRRUP_COLOR
+
+    # ------------------------------------------------------------------
+    def set_scene(self, beams):
+        """Show many :class:`SceneBeam` with culling and level of detail.
+
+        Only beams inside the camera frustum are drawn, each at the level
+        given by its apparent size; their geometry is built on a worker
+        thread the first time a level is needed.
+        """
+        if self._task is not None:
+            # Its result is dropped; the new scene is queued once it stops
+            self._task.cancel()
+        for items in self._scene_items.values():
+            for item in items:
+                self.view.removeItem(item)
+        self._scene_items = {}
+        self.scene = GeometryCache(beams)
+        if len(self.scene):
+            lo = (self.scene.centers - self.scene.radii[:, None]).min(axis=0)
+            hi = (self.scene.centers + self.scene.radii[:, None]).max(axis=0)
+            self.view.opts['center'] = Vector(*(0.5 * (lo + hi)))
+            self.view.opts['distance'] = float(np.linalg.norm(hi - lo))
+        self.refresh_scene()
+
+    def _camera(self):
+        """Return the frustum planes and the eye position in scene axes."""
+        viewport = self.view.getViewport()
+        mvp = self.view.projectionMatrix(viewport, viewport) * self.view.viewMatrix()
+        planes = frustum_planes(np.array(mvp.data()).reshape(4, 4).T)
+        eye = self.view.cameraPosition()
+        return planes, (eye.x(), eye.y(), eye.z())
+
+    def refresh_scene(self):
+        """Show the visible beams and queue the geometry they lack."""
+        if self.scene is None:
+            return
+        planes, eye = self._camera()
+        wanted, missing = self.scene.plan(planes, eye)
+        for key, items in self._scene_items.items():
+            show = wanted.get(key[0]) == key[1]
+            for item in items:
+                item.setVisible(show)
+        for i, level in wanted.items():
+            key = (i, level)
+            if key not in self._scene_items and self.scene.get(key) is not None:
+                self._scene_items[key] = self._add_beam(i, self.scene.get(key))
+        if missing and self._task is None:
+            scene = self.scene
+            task = ExportTask(lambda keys, progress: scene.build(keys, progress), missing)
+            task.signals.finished.connect(lambda built: self._on_built(task, scene, built))
+            task.signals.cancelled.connect(lambda: self._on_built(task, scene, []))
+            task.signals.failed.connect(lambda _msg: self._on_built(task, None, []))
+            self._task = task
+            QThreadPool.globalInstance().start(task)
+
+    def _on_built(self, task, scene, built):
+        if task is self._task:
+            self._task = None
+        if scene is None:
+            return  # failed; wait for the next camera move
+        if scene is self.scene:
+            for key, geometry in built:
+                scene.store(key, geometry)
+        self.refresh_scene()
 
-    def set_model(self, b, h, L):
-        """Draw a simple rectangular prism as the beam."""
-        self.view.clear()
-        verts = np.array([
-            [0, 0, 0], [b, 0, 0], [b, h, 0], [0, h, 0],
-            [0, 0, L], [b, 0, L], [b, h, L], [0, h, L]
-        ])
-        faces = np.array([
-            [0, 1, 2], [0, 2, 3],
-            [4, 5, 6], [4, 6, 7],
-            [0, 1, 5], [0, 5, 4],
-            [1, 2, 6], [1, 6, 5],
-            [2, 3, 7], [2, 7, 6],
-            [3, 0, 4], [3, 4, 7]
-        ])
-        mesh = gl.GLMeshItem(vertexes=verts, faces=faces, smooth=False,
-                              color=(0.5, 0.5, 0.5, 0.3), shader='shaded', drawEdges=True)
-        self.view.addItem(mesh)
+    def _add_beam(self, index, geometry):
+        """Create the GL items of one beam from its local geometry."""
+        transform = QMatrix4x4(*beam_transform(self.scene.beams[index]).ravel())
+        items = []
+        for group, data in geometry.items():
+            if group == "lines":
+                item = gl.GLLinePlotItem(pos=data, mode='lines', color=LINE_COLOR, antialias=False)
+            else:
+                prism = group == ("prism",)
+                item = gl.GLMeshItem(
+                    vertexes=data[0], faces=data[1], smooth=False, shader='shaded',
+                    color=(0.5, 0.5, 0.5, 0.3) if prism else self._color(group),
+                    glOptions='translucent' if prism else 'opaque',
+                )
+            item.setTransform(transform)
+            self.view.addItem(item)
+            items.append(item)
+        return items
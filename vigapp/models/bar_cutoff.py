@@ -0,0 +1,224 @@
+"""Bar cutoff, development length and steel takeoff along the span."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from .constants import DIAM_CM, STEEL_KG_PER_CM2_M
+from .moment_diagram import MomentDiagram
+
+# Commercial bar length (m)
+STOCK_LENGTH = 9.0
+
+# Class B lap splice factor (E060 Art. 12.15)
+LAP_FACTOR = 1.3
+
+
+def moment_envelope(mn, mp, n_points: int = 201):
+    """Return the grid and the ``|M-|``/``M+`` envelopes ``(N, P)``.
+
+    The curves are the same cubic splines drawn by ``MomentApp`` through
+    the three section values, evaluated for every beam at once.
+    """
+    mn = np.abs(np.atleast_2d(np.asarray(mn, dtype=float)))
+    mp = np.abs(np.atleast_2d(np.asarray(mp, dtype=float)))
+    xi, neg = MomentDiagram(mn).sample(n_points)
+    _, pos = MomentDiagram(mp).sample(n_points)
+    return xi, np.maximum(neg, 0.0), np.maximum(pos, 0.0)
+
+
+def phi_mn(As, fc, fy, b, d, phi: float = 0.9):
+    """Return the design moment ``φMn`` (T·m) of a singly reinforced section."""
+    As = np.asarray(As, dtype=float)
+    a = As * fy / (0.85 * fc * b)
+    return phi * As * fy * (d - a / 2) / 100000.0
+
+
+def development_length(db, fc, fy, *, top=False, psi_e: float = 1.0, lam: float = 1.0):
+    """Return the straight development length ``ld`` in cm (E060 Art. 12.2.2)."""
+    db = np.asarray(db, dtype=float)
+    psi_t = np.where(top, 1.3, 1.0)
+    coef = np.where(db <= DIAM_CM['3/4"'] + 1e-9, 6.6, 5.3)
+    ld = fy * psi_t * psi_e / (coef * lam * np.sqrt(fc)) * db
+    return np.maximum(ld, 30.0)
+
+
+def _first_drop(m, cap, dist):
+    """Return the distance where ``m`` first falls to ``cap`` along axis 1.
+
+    ``dist`` holds the (increasing) distance of each column from the
+    start; the crossing is interpolated linearly between grid points.
+    """
+    below = m <= cap[:, None]
+    idx = np.argmax(below, axis=1)
+    never = ~below.any(axis=1)
+    prev = np.maximum(idx - 1, 0)
+    rows = np.arange(m.shape[0])
+    m0 = m[rows, prev]
+    m1 = m[rows, idx]
+    t = np.where(m0 > m1, (m0 - cap) / np.where(m0 > m1, m0 - m1, 1.0), 0.0)
+    x = dist[prev] + np.clip(t, 0.0, 1.0) * (dist[idx] - dist[prev])
+    x = np.where(idx == 0, 0.0, x)
+    return np.where(never, dist[-1], x)
+
+
+def theoretical_cutoffs(xi, m, cap):
+    """Return normalized cutoff points ``(N, 3)`` for M1, M2 and M3 bars.
+
+    Columns 0 and 2 give the distance from the left and right supports
+    where ``m`` drops below ``cap``; column 1 is the half-width of the
+    region around midspan where ``m`` exceeds ``cap``.
+    """
+    cap = np.broadcast_to(np.asarray(cap, dtype=float), (m.shape[0],))
+    mid = len(xi) // 2
+    left = _first_drop(m, cap, xi)
+    right = _first_drop(m[:, ::-1], cap, 1.0 - xi[::-1])
+    half_l = _first_drop(m[:, mid::-1], cap, xi[mid] - xi[mid::-1])
+    half_r = _first_drop(m[:, mid:], cap, xi[mid:] - xi[mid])
+    return np.stack([left, np.maximum(half_l, half_r), right], axis=1)
+
+
+@dataclass
+class CutoffResult:
+    """Cutoff points, bar lengths and steel weights for many beams.
+
+    Arrays indexed ``[beam, face]`` use face 0 for top (negative) bars and
+    face 1 for bottom (positive) bars; a last axis of 3 refers to the
+    extra bars added at M1, M2 and M3. Lengths in m, ``ld`` in cm.
+    """
+
+    xi: np.ndarray
+    x_theory: np.ndarray
+    start: np.ndarray
+    end: np.ndarray
+    length: np.ndarray
+    ld: np.ndarray
+    cont_length: np.ndarray
+    laps: np.ndarray
+    lap_x: np.ndarray
+    kg_cont: np.ndarray
+    kg_extra: np.ndarray
+
+    @property
+    def kg(self) -> np.ndarray:
+        """Return the total steel weight per beam."""
+        return self.kg_cont.sum(axis=1) + self.kg_extra.sum(axis=(1, 2))
+
+    @property
+    def total_kg(self) -> float:
+        """Return the steel weight of all beams."""
+        return float(self.kg.sum())
+
+
+def bar_cutoffs(
+    mn,
+    mp,
+    L,
+    as_neg,
+    as_pos,
+    b,
+    h,
+    d,
+    fc,
+    fy,
+    db_neg,
+    db_pos,
+    *,
+    as_cont_neg=None,
+    as_cont_pos=None,
+    phi: float = 0.9,
+    anchor: float = 0.0,
+    n_points: int = 201,
+) -> CutoffResult:
+    """Return cutoffs, lengths and takeoff for beams with given envelopes.
+
+    ``as_neg``/``as_pos`` are the provided areas (N, 3) at M1, M2 and M3.
+    The bars running along the whole span default to the smallest of the
+    three areas; the rest are extra bars cut where the remaining steel is
+    enough, extended ``max(d, 12 db)`` and at least ``ld``. ``anchor`` adds
+    a length (m) at each support for hooks or embedment.
+    """
+    as_neg = np.atleast_2d(np.asarray(as_neg, dtype=float))
+    as_pos = np.atleast_2d(np.asarray(as_pos, dtype=float))
+    n = as_neg.shape[0]
+
+    def _col(val):
+        return np.broadcast_to(np.asarray(val, dtype=float), (n,)).copy()
+
+    L, b, h, d = _col(L), _col(b), _col(h), _col(d)
+    fc, fy = _col(fc), _col(fy)
+    db = np.stack([_col(db_neg), _col(db_pos)], axis=1)
+
+    if as_cont_neg is None:
+        as_cont_neg = as_neg.min(axis=1)
+    if as_cont_pos is None:
+        as_cont_pos = as_pos.min(axis=1)
+    as_cont = np.stack([_col(as_cont_neg), _col(as_cont_pos)], axis=1)
+    extra = np.maximum(np.stack([as_neg, as_pos], axis=1) - as_cont[:, :, None], 0.0)
+
+    xi, m_neg, m_pos = moment_envelope(mn, mp, n_points)
+    x_theory = np.empty((n, 2, 3))
+    for face, m in enumerate((m_neg, m_pos)):
+        cap = phi_mn(as_cont[:, face], fc, fy, b, d, phi)
+        x_theory[:, face] = theoretical_cutoffs(xi, m, cap) * L[:, None]
+
+    ld = np.stack(
+        [
+            development_length(db[:, 0], fc, fy, top=True),
+            development_length(db[:, 1], fc, fy),
+        ],
+        axis=1,
+    )
+    ld_m = ld / 100.0
+    ext = np.maximum(d[:, None], 12.0 * db) / 100.0
+
+    Lc = L[:, None]
+    start = np.empty((n, 2, 3))
+    end = np.empty((n, 2, 3))
+    # Support bars run from the face to the cutoff plus extension
+    start[:, :, 0] = 0.0 - anchor
+    end[:, :, 0] = np.minimum(np.maximum(x_theory[:, :, 0] + ext, ld_m), Lc)
+    start[:, :, 2] = np.maximum(Lc - np.maximum(x_theory[:, :, 2] + ext, ld_m), 0.0)
+    end[:, :, 2] = Lc + anchor
+    # Midspan bars extend past both theoretical points and develop ld
+    half = np.maximum(x_theory[:, :, 1] + ext, ld_m)
+    start[:, :, 1] = np.maximum(Lc / 2 - half, 0.0)
+    end[:, :, 1] = np.minimum(Lc / 2 + half, Lc)
+
+    length = np.where(extra > 0, end - start, 0.0)
+    start = np.where(extra > 0, start, np.nan)
+    end = np.where(extra > 0, end, np.nan)
+
+    cont_length = np.repeat((L + 2 * anchor)[:, None], 2, axis=1)
+    laps = np.maximum(np.ceil(cont_length / STOCK_LENGTH) - 1, 0).astype(int)
+    lap_len = LAP_FACTOR * ld_m
+
+    # Splice where demand is lowest, away from the 2h confined zones
+    x = xi[None, :] * L[:, None]
+    zone = 2 * h[:, None] / 100.0
+    lap_x = np.full((n, 2), np.nan)
+    for face, m in enumerate((m_neg, m_pos)):
+        half_lap = lap_len[:, face, None] / 2
+        ok = (x >= zone + half_lap) & (x <= L[:, None] - zone - half_lap)
+        ok[~ok.any(axis=1), len(xi) // 2] = True
+        best = np.argmin(np.where(ok, m, np.inf), axis=1)
+        lap_x[:, face] = np.where(laps[:, face] > 0, x[np.arange(n), best], np.nan)
+
+    kg_cont = as_cont * (cont_length + laps * lap_len) * STEEL_KG_PER_CM2_M
+    kg_extra = extra * length * STEEL_KG_PER_CM2_M
+
+    return CutoffResult(
+        xi=xi,
+        x_theory=x_theory,
+        start=start,
+        end=end,
+        length=length,
+        ld=ld,
+        cont_length=cont_length,
+        laps=laps,
+        lap_x=lap_x,
+        kg_cont=kg_cont,
+        kg_extra=kg_extra,
+    )
@@ -0,0 +1,127 @@
+"""Precomputed tables of longitudinal bar combinations."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, Tuple
+
+import numpy as np
+
+from .constants import BAR_DATA, BAR_SPACING, DIAM_CM, LONG_BAR_KEYS, STEEL_KG_PER_CM2_M
+
+# Maximum quantity per diameter, matching the combo rows of DesignWindow
+MAX_QTY = 10
+
+
+def layer_base_width(n, sum_d, r: float, de: float):
+    """Return the base needed for ``n`` bars whose diameters add up to ``sum_d``."""
+    return 2 * r + 2 * de + np.maximum(n - 1, 0) * BAR_SPACING + sum_d
+
+
+@dataclass(frozen=True)
+class BarTable:
+    """Combinations ``n1·d1 + n2·d2`` sorted by total area.
+
+    ``d1`` are the corner bars (at least two) and ``d2`` the optional second
+    diameter; ``n2 = 0`` marks a single-diameter combination.
+    """
+
+    keys: Tuple[str, ...]
+    n1: np.ndarray
+    i1: np.ndarray
+    n2: np.ndarray
+    i2: np.ndarray
+    area: np.ndarray
+    bar_width: np.ndarray
+    weight: np.ndarray
+    diams: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.area)
+
+    def min_base(self, r: float, de: float) -> np.ndarray:
+        """Return the base required to fit each combination in one layer."""
+        return self.bar_width + 2 * r + 2 * de
+
+    def area_range(self, as_min: float, as_max: float = np.inf) -> slice:
+        """Return the slice of combinations with ``as_min <= As <= as_max``."""
+        start = int(np.searchsorted(self.area, as_min - 1e-9, side="left"))
+        stop = int(np.searchsorted(self.area, as_max + 1e-9, side="right"))
+        return slice(start, max(start, stop))
+
+    def smallest(
+        self,
+        as_req: float,
+        b: float,
+        r: float,
+        de: float,
+        as_max: float = np.inf,
+    ) -> Optional[int]:
+        """Return the index of the smallest single-layer combination fitting ``b``."""
+        sl = self.area_range(as_req, as_max)
+        fits = self.bar_width[sl] <= b - 2 * r - 2 * de + 1e-9
+        if not np.any(fits):
+            return None
+        return sl.start + int(np.argmax(fits))
+
+    def smallest_many(self, as_req, b: float, r: float, de: float) -> np.ndarray:
+        """Vectorized :meth:`smallest` for many areas; ``-1`` when none fits."""
+        fits = self.bar_width <= b - 2 * r - 2 * de + 1e-9
+        idx = np.where(fits, np.arange(len(self)), len(self))
+        # next_fit[i] is the first fitting index at or after i
+        next_fit = np.minimum.accumulate(idx[::-1])[::-1]
+        next_fit = np.append(next_fit, len(self))
+        start = np.searchsorted(self.area, np.asarray(as_req) - 1e-9, side="left")
+        found = next_fit[start]
+        return np.where(found < len(self), found, -1)
+
+    def rows(self, i: int) -> list[Tuple[int, str]]:
+        """Return ``(qty, key)`` pairs describing combination ``i``."""
+        out = [(int(self.n1[i]), self.keys[self.i1[i]])]
+        if self.n2[i]:
+            out.append((int(self.n2[i]), self.keys[self.i2[i]]))
+        return out
+
+    def label(self, i: int) -> str:
+        """Return a short text such as ``2ø5/8" + 1ø1/2"``."""
+        return " + ".join(f"{n}ø{key}" for n, key in self.rows(i))
+
+
+@lru_cache(maxsize=None)
+def bar_table(keys: Tuple[str, ...] = LONG_BAR_KEYS) -> BarTable:
+    """Return the cached combination table for ``keys``."""
+    n1, i1, n2, i2 = [], [], [], []
+    for a in range(len(keys)):
+        for q1 in range(2, MAX_QTY + 1):
+            n1.append(q1)
+            i1.append(a)
+            n2.append(0)
+            i2.append(a)
+            for c in range(len(keys)):
+                if c == a:
+                    continue
+                for q2 in range(1, MAX_QTY + 1):
+                    n1.append(q1)
+                    i1.append(a)
+                    n2.append(q2)
+                    i2.append(c)
+    n1 = np.array(n1, dtype=int)
+    n2 = np.array(n2, dtype=int)
+    i1 = np.array(i1, dtype=int)
+    i2 = np.array(i2, dtype=int)
+    areas = np.array([BAR_DATA[k] for k in keys])
+    diams = np.array([DIAM_CM[k] for k in keys])
+
+    area = n1 * areas[i1] + n2 * areas[i2]
+    bar_width = n1 * diams[i1] + n2 * diams[i2] + (n1 + n2 - 1) * BAR_SPACING
+
+    order = np.lexsort((n1 + n2, area))
+    arrays = [a[order] for a in (n1, i1, n2, i2, area, bar_width)]
+    for arr in arrays:
+        arr.flags.writeable = False
+    n1, i1, n2, i2, area, bar_width = arrays
+    weight = area * STEEL_KG_PER_CM2_M
+    weight.flags.writeable = False
+    diams.flags.writeable = False
+    return BarTable(tuple(keys), n1, i1, n2, i2, area, bar_width, weight, diams)
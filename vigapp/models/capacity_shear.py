@@ -0,0 +1,126 @@
+"""Capacity design shear from the probable moments of the placed bars."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+from .section_analysis import nominal_moment, section_bars
+from .shear_design import ShearDesignBatch, shear_design_batch
+
+# Steel overstrength of the probable moment (E.060 21.5.4.1)
+ALPHA = 1.25
+
+# End sections in the order of the arrays: M1-, M3-, M1+, M3+
+END_POSITIONS = (0, 2, 3, 5)
+
+
+@dataclass
+class CapacityShear:
+    """Probable moments (T·m) at the beam ends and the resulting shear (T).
+
+    ``mpr`` has shape ``(N, 4)`` with M1-, M3-, M1+ and M3+; ``vu`` adds
+    the larger sway sum over ``Ln`` to the gravity shear ``vg``.
+    """
+
+    mpr: np.ndarray
+    vg: np.ndarray
+    vu: np.ndarray
+    design: Optional[ShearDesignBatch] = None
+
+
+def end_bars(rows: Sequence[Sequence[Tuple[int, str, int]]], h: float, r: float, de: float):
+    """Return ``(4, K)`` bar depths and areas of the end sections.
+
+    ``rows`` are the six design positions (M1-, M2-, M3-, M1+, M2+, M3+)
+    as ``(qty, diameter key, layer)``; the opposite face at the same end
+    is taken as compression steel.
+    """
+    bars = [section_bars(rows[i], rows[(i + 3) % 6], h, r, de) for i in END_POSITIONS]
+    return pad_bars(bars)
+
+
+def pad_bars(bars) -> Tuple[np.ndarray, np.ndarray]:
+    """Stack ``(depth, area)`` pairs of different lengths padding with zero areas."""
+    k = max((len(y) for y, _ in bars), default=0) or 1
+    depth = np.zeros((len(bars), k))
+    area = np.zeros((len(bars), k))
+    for i, (y, a) in enumerate(bars):
+        depth[i, : len(y)] = y
+        area[i, : len(a)] = a
+    return depth, area
+
+
+def capacity_shear(
+    b,
+    h,
+    fc,
+    fy,
+    depth,
+    area,
+    Ln,
+    wu=0.0,
+    *,
+    alpha: float = ALPHA,
+) -> CapacityShear:
+    """Return the capacity shear of one or many beams.
+
+    ``depth``/``area`` are ``(4, K)`` or ``(N, 4, K)`` as returned by
+    :func:`end_bars`. ``Mpr`` is the nominal moment with ``alpha·fy`` and
+    φ = 1; ``wu`` (T/m) is the factored gravity load on the clear span
+    ``Ln`` (m). All end sections are analysed in a single batch.
+    """
+    depth = np.asarray(depth, dtype=float)
+    area = np.asarray(area, dtype=float)
+    single = depth.ndim == 2
+    if single:
+        depth, area = depth[None], area[None]
+    n, ends, k = depth.shape
+    if ends != 4:
+        raise ValueError("Se esperan cuatro secciones de extremo")
+
+    def per_end(v):
+        return np.repeat(np.broadcast_to(np.asarray(v, dtype=float), (n,)), 4)
+
+    cap = nominal_moment(
+        per_end(b),
+        per_end(h),
+        per_end(fc),
+        alpha * per_end(fy),
+        depth.reshape(n * 4, k),
+        area.reshape(n * 4, k),
+        phi=1.0,
+    )
+    mpr = cap.mn.reshape(n, 4)
+    Ln = np.broadcast_to(np.asarray(Ln, dtype=float), (n,))
+    if np.any(Ln <= 0):
+        raise ValueError("La luz libre debe ser mayor que cero")
+    # Sway to either side: M1- with M3+, or M1+ with M3-
+    sway = np.maximum(mpr[:, 0] + mpr[:, 3], mpr[:, 2] + mpr[:, 1]) / Ln
+    vg = np.broadcast_to(np.asarray(wu, dtype=float), (n,)) * Ln / 2.0
+    result = CapacityShear(mpr=mpr, vg=vg, vu=sway + vg)
+    if single:
+        result.mpr, result.vg, result.vu = mpr[0], vg[0], result.vu[0]
+    return result
+
+
+def capacity_design(
+    b,
+    h,
+    fc,
+    fy,
+    depth,
+    area,
+    Ln,
+    d,
+    wu=0.0,
+    *,
+    alpha: float = ALPHA,
+    **shear_kwargs,
+) -> CapacityShear:
+    """Return the capacity shear with the stirrup design for that shear."""
+    cap = capacity_shear(b, h, fc, fy, depth, area, Ln, wu, alpha=alpha)
+    cap.design = shear_design_batch(cap.vu, Ln, d, b, h, fc, fy=fy, **shear_kwargs)
+    return cap
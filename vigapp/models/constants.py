@@ -23,3 +23,12 @@ DIAM_CM = {
     '3/4"': 1.91,
     '1"': 2.54,
 }
+
+# Longitudinal bar diameters offered in the design window
+LONG_BAR_KEYS = ('1/2"', '5/8"', '3/4"', '1"')
+
+# Clear spacing between bars and between layers (cm)
+BAR_SPACING = 2.5
+
+# Weight of steel bars in kg/m per cm² of bar area (7850 kg/m³)
+STEEL_KG_PER_CM2_M = 0.785
@@ -0,0 +1,244 @@
+"""Streaming import of beam forces exported by analysis software."""
+
+from __future__ import annotations
+
+import csv
+import io
+import os
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from .moments import correct_moments
+
+# Column names of the ETABS/SAP2000 "Beam Forces" table
+DEFAULT_COLUMNS = {
+    "story": "Story",
+    "beam": "Beam",
+    "station": "Station",
+    "moment": "M3",
+    "shear": "V2",
+}
+
+# Rows searched for the header line (tables usually start with a title)
+_HEADER_SEARCH = 50
+
+
+@dataclass
+class BeamEnvelopes:
+    """M–/M+ envelopes at M1, M2 and M3 and Vu at d for many beams.
+
+    ``mn`` holds non-positive and ``mp`` non-negative moments (T·m) in
+    the layout expected by ``correct_moments``; ``vu`` is in T and
+    ``length`` is the distance between the first and last stations (m).
+    """
+
+    labels: List[str] = field(default_factory=list)
+    mn: np.ndarray = field(default_factory=lambda: np.zeros((0, 3)))
+    mp: np.ndarray = field(default_factory=lambda: np.zeros((0, 3)))
+    vu: np.ndarray = field(default_factory=lambda: np.zeros(0))
+    length: np.ndarray = field(default_factory=lambda: np.zeros(0))
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def for_beam(self, label: str) -> Tuple[np.ndarray, np.ndarray, float]:
+        """Return ``(mn, mp, vu)`` for the beam named ``label``."""
+        i = self.labels.index(label)
+        return self.mn[i].copy(), self.mp[i].copy(), float(self.vu[i])
+
+    def corrected(self, system) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the corrected ``(mn, mp)`` of every beam for ``system``."""
+        return correct_moments(self.mn, self.mp, system)
+
+
+class _Accumulator:
+    """Running min/max of M and max |V| per (beam, station)."""
+
+    def __init__(self, size: int = 1024):
+        self.keys: Dict[Tuple[str, int], int] = {}
+        self.m_min = np.full(size, np.inf)
+        self.m_max = np.full(size, -np.inf)
+        self.v_abs = np.zeros(size)
+
+    def _grow(self, needed: int) -> None:
+        size = len(self.m_min)
+        if needed <= size:
+            return
+        new = max(needed, 2 * size)
+        self.m_min = np.concatenate([self.m_min, np.full(new - size, np.inf)])
+        self.m_max = np.concatenate([self.m_max, np.full(new - size, -np.inf)])
+        self.v_abs = np.concatenate([self.v_abs, np.zeros(new - size)])
+
+    def add(self, keys: List[Tuple[str, int]], m: np.ndarray, v: np.ndarray) -> None:
+        """Fold one chunk of rows into the running envelopes."""
+        index = self.keys
+        idx = np.fromiter(
+            (index.setdefault(k, len(index)) for k in keys), dtype=int, count=len(keys)
+        )
+        self._grow(len(index))
+        np.minimum.at(self.m_min, idx, m)
+        np.maximum.at(self.m_max, idx, m)
+        np.maximum.at(self.v_abs, idx, np.abs(v))
+
+
+def _to_float(text: str) -> float:
+    """Parse ``text`` accepting a decimal comma."""
+    try:
+        return float(text)
+    except ValueError:
+        return float(text.replace(",", "."))
+
+
+def _open(source, encoding: str):
+    """Return a text stream and whether it must be closed by the caller."""
+    if isinstance(source, (str, os.PathLike)):
+        return open(source, newline="", encoding=encoding, errors="replace"), True
+    return source, False
+
+
+def _detect_delimiter(fh) -> Optional[str]:
+    """Guess the delimiter from the first lines of ``fh``; ``None`` means spaces."""
+    try:
+        pos = fh.tell()
+        sample = fh.read(4096)
+        fh.seek(pos)
+    except (OSError, io.UnsupportedOperation):
+        return ","
+    lines = sample.splitlines()[:20]
+    counts = {c: sum(line.count(c) for line in lines) for c in ",;\t|"}
+    best = max(counts, key=counts.get)
+    return best if counts[best] else None
+
+
+def _fraction_read(fh, size: int) -> Optional[float]:
+    """Return the fraction of a file stream consumed, if it can be known."""
+    try:
+        return min(fh.buffer.tell() / size, 1.0)
+    except (AttributeError, OSError, ValueError, ZeroDivisionError):
+        return None
+
+
+def _rows(fh, delimiter: Optional[str]) -> Iterable[List[str]]:
+    """Yield the split rows of ``fh``."""
+    if delimiter is None:
+        return (line.split() for line in fh)
+    return csv.reader(fh, delimiter=delimiter)
+
+
+def _find_header(rows, columns: Dict[str, str]) -> Dict[str, int]:
+    """Consume rows up to the header and return the column positions."""
+    wanted = {k: v.strip().lower() for k, v in columns.items() if v}
+    required = ("beam", "station", "moment", "shear")
+    for row in islice(rows, _HEADER_SEARCH):
+        names = [c.strip().lower() for c in row]
+        if all(wanted[k] in names for k in required):
+            return {k: names.index(v) for k, v in wanted.items() if v in names}
+    raise ValueError("No se encontraron las columnas de la tabla de fuerzas")
+
+
+def read_envelopes(
+    source,
+    *,
+    d: float = 0.0,
+    columns: Optional[Dict[str, str]] = None,
+    delimiter: Optional[str] = "auto",
+    chunk_size: int = 50000,
+    encoding: str = "utf-8",
+    progress: Optional[Callable[[int, str], None]] = None,
+) -> BeamEnvelopes:
+    """Read a beam forces table and return the envelopes of every beam.
+
+    ``source`` is a path or text stream. Rows are processed ``chunk_size``
+    at a time, so memory depends on the number of beam stations and not on
+    the number of rows or load combinations. The first and last stations
+    are taken as the faces, M2 is the extreme over the middle third and
+    ``vu`` is the largest |V| interpolated at ``d`` (m) from either face.
+    ``progress(percent, text)`` is called after every chunk (0-90 %).
+    """
+    cols = dict(DEFAULT_COLUMNS)
+    if columns:
+        cols.update(columns)
+
+    fh, owned = _open(source, encoding)
+    size = os.path.getsize(source) if owned else 0
+    try:
+        if delimiter == "auto":
+            delimiter = _detect_delimiter(fh)
+        rows = iter(_rows(fh, delimiter))
+        pos = _find_header(rows, cols)
+        i_beam, i_sta = pos["beam"], pos["station"]
+        i_m, i_v = pos["moment"], pos["shear"]
+        i_story = pos.get("story")
+        width = max(pos.values()) + 1
+
+        acc = _Accumulator()
+        n_rows = 0
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                break
+            keys, ms, vs = [], [], []
+            for row in chunk:
+                if len(row) < width:
+                    continue
+                try:
+                    sta = _to_float(row[i_sta])
+                    m = _to_float(row[i_m])
+                    v = _to_float(row[i_v])
+                except ValueError:
+                    # Units rows and repeated headers
+                    continue
+                label = row[i_beam].strip()
+                if i_story is not None:
+                    label = f"{row[i_story].strip()} {label}"
+                keys.append((label, int(round(sta * 1000))))
+                ms.append(m)
+                vs.append(v)
+            if keys:
+                acc.add(keys, np.array(ms), np.array(vs))
+            n_rows += len(chunk)
+            if progress is not None:
+                frac = _fraction_read(fh, size)
+                progress(int(90 * frac) if frac is not None else 0, f"{n_rows} filas leídas")
+    finally:
+        if owned:
+            fh.close()
+
+    return _finalize(acc, d)
+
+
+def _finalize(acc: _Accumulator, d: float) -> BeamEnvelopes:
+    """Reduce the per-station accumulators to three sections per beam."""
+    groups: Dict[str, List[Tuple[int, int]]] = {}
+    for (label, sta), i in acc.keys.items():
+        groups.setdefault(label, []).append((sta, i))
+
+    labels = list(groups)
+    n = len(labels)
+    mn = np.zeros((n, 3))
+    mp = np.zeros((n, 3))
+    vu = np.zeros(n)
+    length = np.zeros(n)
+    for b, label in enumerate(labels):
+        stations = sorted(groups[label])
+        x = np.array([s for s, _ in stations]) / 1000.0
+        idx = np.array([i for _, i in stations])
+        m_min = np.minimum(acc.m_min[idx], 0.0)
+        m_max = np.maximum(acc.m_max[idx], 0.0)
+        v_abs = acc.v_abs[idx]
+
+        x0, x1 = x[0], x[-1]
+        span = x1 - x0
+        third = (x >= x0 + span / 3 - 1e-9) & (x <= x1 - span / 3 + 1e-9)
+        if not third.any():
+            third = np.abs(x - (x0 + x1) / 2) == np.min(np.abs(x - (x0 + x1) / 2))
+
+        mn[b] = [m_min[0], m_min[third].min(), m_min[-1]]
+        mp[b] = [m_max[0], m_max[third].max(), m_max[-1]]
+        vu[b] = max(np.interp(x0 + d, x, v_abs), np.interp(x1 - d, x, v_abs))
+        length[b] = span
+
+    return BeamEnvelopes(labels=labels, mn=mn, mp=mp, vu=vu, length=length)
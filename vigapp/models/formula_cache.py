@@ -0,0 +1,205 @@
+"""Cache of parsed formulas and their LaTeX, in memory and on disk.
+
+SymPy is imported only when a formula is not cached yet, so a catalogue
+rendered in a previous session needs no SymPy at all. New entries are
+written once per :meth:`FormulaCache.warm` batch and at exit. Set
+``VIGAPP_FORMULA_CACHE=0`` to keep the cache in memory only and
+``VIGAPP_CACHE_DIR`` to move the cache folder.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Formulas kept in memory
+MAXSIZE = 256
+
+# Formulas kept in the cache file
+DISK_MAXSIZE = 4096
+
+# Bump when the parsing rules change so old disk entries are ignored
+FORMAT = 1
+
+_MISSING = object()
+
+
+def cache_dir() -> str:
+    """Return the folder of the persistent caches."""
+    path = os.environ.get("VIGAPP_CACHE_DIR")
+    if path:
+        return path
+    if os.name == "nt":
+        base = os.getenv(
+            "LOCALAPPDATA", os.path.join(os.path.expanduser("~"), "AppData", "Local")
+        )
+        return os.path.join(base, "vigapp060", "cache")
+    base = os.getenv("XDG_CACHE_HOME", os.path.expanduser("~/.cache"))
+    return os.path.join(base, "vigapp060")
+
+
+def default_path() -> Optional[str]:
+    """Return the cache file, or ``None`` when disk caching is disabled."""
+    if os.environ.get("VIGAPP_FORMULA_CACHE", "1") in ("", "0"):
+        return None
+    return os.path.join(cache_dir(), "formulas.json")
+
+
+def _symbols(text: str):
+    import sympy as sp
+
+    tokens = set(re.findall(r"[A-Za-z_][A-Za-z0-9_]*", text))
+    return sp, {t: sp.symbols(t) for t in tokens}
+
+
+def _parse(text: str):
+    """Parse ``lhs = rhs`` into a SymPy ``Eq`` or return ``None``."""
+    if "=" not in text:
+        return None
+    left, right = text.split("=", 1)
+    left, right = left.strip(), right.strip()
+    sp, symbols = _symbols(text)
+    try:
+        expr_l = symbols.get(left, sp.symbols(left))
+        expr_r = sp.sympify(right.replace("^", "**"), locals=symbols)
+    except Exception:
+        return None
+    return sp.Eq(expr_l, expr_r)
+
+
+def _latex(eq) -> str:
+    import sympy as sp
+
+    return sp.latex(eq)
+
+
+class FormulaCache:
+    """LRU of parsed equations and their LaTeX keyed by the formula text.
+
+    Only the LaTeX goes to ``path``, bounded to ``disk_maxsize`` entries;
+    equations are rebuilt on demand. ``None`` is cached too, for texts
+    that are not equations. New entries reach the file on :meth:`flush`.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        maxsize: int = MAXSIZE,
+        disk_maxsize: int = DISK_MAXSIZE,
+    ):
+        self.path = path
+        self.maxsize = maxsize
+        self.disk_maxsize = disk_maxsize
+        self._eqs: "OrderedDict[str, object]" = OrderedDict()
+        self._latex: "OrderedDict[str, Optional[str]]" = OrderedDict()
+        self._disk: "OrderedDict[str, Optional[str]]" = OrderedDict()
+        self._dirty = False
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        if path:
+            for text, value in self._load(path).items():
+                self._remember(self._disk, text, value, disk_maxsize)
+
+    @staticmethod
+    def _load(path: str) -> dict:
+        try:
+            with open(path, encoding="utf-8") as fh:
+                data = json.load(fh)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("format") != FORMAT:
+            return {}
+        entries = data.get("latex", {})
+        return entries if isinstance(entries, dict) else {}
+
+    def _remember(self, store: OrderedDict, key: str, value, maxsize: Optional[int] = None) -> None:
+        store[key] = value
+        store.move_to_end(key)
+        limit = self.maxsize if maxsize is None else maxsize
+        while len(store) > limit:
+            store.popitem(last=False)
+
+    def parse(self, text: str):
+        """Return the SymPy ``Eq`` of ``text`` or ``None``."""
+        with self._lock:
+            eq = self._eqs.get(text, _MISSING)
+            if eq is not _MISSING:
+                self._eqs.move_to_end(text)
+                return eq
+        eq = _parse(text)
+        with self._lock:
+            self._remember(self._eqs, text, eq)
+        return eq
+
+    def latex(self, text: str) -> Optional[str]:
+        """Return the LaTeX of the equation in ``text`` or ``None``."""
+        with self._lock:
+            value = self._latex.get(text, _MISSING)
+            if value is _MISSING:
+                value = self._disk.get(text, _MISSING)
+                if value is not _MISSING:
+                    self._disk.move_to_end(text)
+            if value is not _MISSING:
+                self.hits += 1
+                self._remember(self._latex, text, value)
+                return value
+            self.misses += 1
+        eq = self.parse(text)
+        value = None if eq is None else _latex(eq)
+        with self._lock:
+            self._remember(self._latex, text, value)
+            if self.path:
+                self._remember(self._disk, text, value, self.disk_maxsize)
+                self._dirty = True
+        return value
+
+    def warm(self, texts: Iterable[str]) -> None:
+        """Cache the LaTeX of ``texts``, e.g. a fixed catalogue, and flush."""
+        for text in texts:
+            self.latex(text)
+        self.flush()
+
+    def flush(self) -> None:
+        """Write the new entries to ``path``, if any."""
+        with self._lock:
+            if self.path and self._dirty:
+                self._save()
+                self._dirty = False
+
+    def clear(self) -> None:
+        """Forget every entry, in memory and on disk."""
+        with self._lock:
+            self._eqs.clear()
+            self._latex.clear()
+            self._disk.clear()
+            self._dirty = False
+            if self.path and os.path.exists(self.path):
+                try:
+                    os.remove(self.path)
+                except OSError:
+                    logger.exception("No se pudo borrar %s", self.path)
+
+    def _save(self) -> None:
+        folder = os.path.dirname(self.path)
+        try:
+            os.makedirs(folder, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=folder, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump({"format": FORMAT, "latex": self._disk}, fh, ensure_ascii=False)
+            os.replace(tmp, self.path)
+        except OSError:
+            logger.warning("No se pudo guardar la caché de fórmulas en %s", self.path)
+
+
+formula_cache = FormulaCache(default_path())
+atexit.register(formula_cache.flush)
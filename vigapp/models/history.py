@@ -0,0 +1,134 @@
+"""Undo/redo history of design edits built on immutable snapshots."""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass, fields, replace
+from typing import Deque, FrozenSet, List, Optional, Sequence, Tuple
+
+# Rebar row as (qty, diameter key, layer) combo texts
+Row = Tuple[str, str, str]
+
+# Steps kept before the oldest ones are forgotten
+MAX_STEPS = 10000
+
+
+@dataclass(frozen=True)
+class DesignState:
+    """Snapshot of every user-editable design value.
+
+    All fields are nested tuples, so consecutive snapshots share the parts
+    that did not change: an edit of one rebar position only allocates a
+    new tuple for that position and a new top-level state.
+    """
+
+    mn: Tuple[float, ...] = ()
+    mp: Tuple[float, ...] = ()
+    inputs: Tuple[Tuple[str, str], ...] = ()
+    rebar: Tuple[Tuple[Row, ...], ...] = ()
+    neg_orders: Tuple[Tuple[str, ...], ...] = ()
+    pos_orders: Tuple[Tuple[str, ...], ...] = ()
+
+    def changed(self, other: "DesignState") -> FrozenSet[str]:
+        """Return the names of the fields that differ from ``other``."""
+        return frozenset(
+            f.name
+            for f in fields(self)
+            if getattr(self, f.name) is not getattr(other, f.name)
+            and getattr(self, f.name) != getattr(other, f.name)
+        )
+
+
+def _share(new: tuple, old: tuple) -> tuple:
+    """Return ``new`` reusing the equal items (and itself) of ``old``."""
+    if new == old:
+        return old
+    if len(new) != len(old):
+        return new
+    return tuple(o if n == o else n for n, o in zip(new, old))
+
+
+def make_state(
+    previous: Optional[DesignState],
+    *,
+    mn: Sequence[float] = (),
+    mp: Sequence[float] = (),
+    inputs: Sequence[Tuple[str, str]] = (),
+    rebar: Sequence[Sequence[Row]] = (),
+    neg_orders: Sequence[Sequence[str]] = (),
+    pos_orders: Sequence[Sequence[str]] = (),
+) -> DesignState:
+    """Build a state from plain sequences sharing unchanged parts of ``previous``."""
+    prev = previous or DesignState()
+    return DesignState(
+        mn=_share(tuple(float(v) for v in mn), prev.mn),
+        mp=_share(tuple(float(v) for v in mp), prev.mp),
+        inputs=_share(tuple((k, v) for k, v in inputs), prev.inputs),
+        rebar=_share(tuple(tuple(tuple(r) for r in rows) for rows in rebar), prev.rebar),
+        neg_orders=_share(tuple(tuple(o) for o in neg_orders), prev.neg_orders),
+        pos_orders=_share(tuple(tuple(o) for o in pos_orders), prev.pos_orders),
+    )
+
+
+def with_orders(state: DesignState, neg_orders, pos_orders) -> DesignState:
+    """Return ``state`` with new bar orders, sharing everything else."""
+    return replace(
+        state,
+        neg_orders=_share(tuple(tuple(o) for o in neg_orders), state.neg_orders),
+        pos_orders=_share(tuple(tuple(o) for o in pos_orders), state.pos_orders),
+    )
+
+
+class History:
+    """Linear undo/redo stack of :class:`DesignState` snapshots."""
+
+    def __init__(self, max_steps: int = MAX_STEPS):
+        self._undo: Deque[Tuple[DesignState, str]] = deque(maxlen=max_steps)
+        self._redo: List[Tuple[DesignState, str]] = []
+        self.current: Optional[DesignState] = None
+        self.label = ""
+
+    def push(self, state: DesignState, label: str = "") -> bool:
+        """Record ``state`` as the result of an edit; return ``False`` if unchanged."""
+        if self.current is not None and state == self.current:
+            return False
+        if self.current is not None:
+            self._undo.append((self.current, self.label))
+        self.current = state
+        self.label = label
+        self._redo.clear()
+        return True
+
+    def reset(self, state: Optional[DesignState] = None) -> None:
+        """Forget all steps and start again from ``state``."""
+        self._undo.clear()
+        self._redo.clear()
+        self.current = state
+        self.label = ""
+
+    @property
+    def can_undo(self) -> bool:
+        return bool(self._undo)
+
+    @property
+    def can_redo(self) -> bool:
+        return bool(self._redo)
+
+    def undo(self) -> Optional[DesignState]:
+        """Step back and return the state to restore, or ``None``."""
+        if not self._undo:
+            return None
+        self._redo.append((self.current, self.label))
+        self.current, self.label = self._undo.pop()
+        return self.current
+
+    def redo(self) -> Optional[DesignState]:
+        """Step forward and return the state to restore, or ``None``."""
+        if not self._redo:
+            return None
+        self._undo.append((self.current, self.label))
+        self.current, self.label = self._redo.pop()
+        return self.current
+
+    def __len__(self) -> int:
+        return len(self._undo) + len(self._redo) + (self.current is not None)
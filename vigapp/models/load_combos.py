@@ -0,0 +1,172 @@
+"""Load combinations of per-case beam forces and their envelopes."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .envelope_import import BeamEnvelopes
+from .moments import correct_moments
+
+# Load cases: dead, live and seismic in X and Y
+CASES = ("CM", "CV", "SX", "SY")
+
+
+@dataclass(frozen=True)
+class CombinationTable:
+    """Factors of each load case (columns) in each combination (rows)."""
+
+    names: Tuple[str, ...]
+    cases: Tuple[str, ...]
+    factors: np.ndarray
+
+    def __post_init__(self):
+        factors = np.array(self.factors, dtype=float)
+        if factors.shape != (len(self.names), len(self.cases)):
+            raise ValueError("La tabla de combinaciones no coincide con los casos")
+        if len(set(self.names)) != len(self.names):
+            raise ValueError("Nombres de combinación repetidos")
+        factors.setflags(write=False)
+        object.__setattr__(self, "names", tuple(self.names))
+        object.__setattr__(self, "cases", tuple(self.cases))
+        object.__setattr__(self, "factors", factors)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @classmethod
+    def from_rows(
+        cls, rows: Sequence[Tuple[str, Mapping[str, float]]], cases: Sequence[str] = CASES
+    ) -> "CombinationTable":
+        """Build a table from ``(name, {case: factor})`` rows; missing cases are 0."""
+        unknown = {c for _, row in rows for c in row} - set(cases)
+        if unknown:
+            raise ValueError("Casos de carga desconocidos: " + ", ".join(sorted(unknown)))
+        factors = [[float(row.get(c, 0.0)) for c in cases] for _, row in rows]
+        factors = np.reshape(factors, (len(rows), len(cases)))
+        return cls(tuple(n for n, _ in rows), tuple(cases), factors)
+
+    def rows(self) -> List[Tuple[str, Dict[str, float]]]:
+        """Return the table as ``(name, {case: factor})`` rows for editing."""
+        return [
+            (name, {c: float(f) for c, f in zip(self.cases, row) if f})
+            for name, row in zip(self.names, self.factors)
+        ]
+
+
+def e060_table(cases: Sequence[str] = CASES) -> CombinationTable:
+    """Return the E.060 (9.2) combinations of dead, live and seismic loads.
+
+    ``cases`` names the dead, live and seismic cases in that order; every
+    seismic case is combined with both signs.
+    """
+    dead, live, *seismic = cases
+    rows = [("1.4CM+1.7CV", {dead: 1.4, live: 1.7})]
+    for s in seismic:
+        for sign, tag in ((1.0, "+"), (-1.0, "-")):
+            rows.append((f"1.25(CM+CV){tag}{s}", {dead: 1.25, live: 1.25, s: sign}))
+    for s in seismic:
+        for sign, tag in ((1.0, "+"), (-1.0, "-")):
+            rows.append((f"0.9CM{tag}{s}", {dead: 0.9, s: sign}))
+    return CombinationTable.from_rows(rows, cases)
+
+
+@dataclass
+class CombinationEnvelopes:
+    """Envelopes at M1, M2 and M3 and the combination controlling each value.
+
+    ``mn``/``mp``/``vu`` have shape ``(N, 3)`` (``(3,)`` for a single
+    beam); the ``*_combo`` arrays hold row indices of ``table``. ``mn`` is
+    non-positive and ``mp`` non-negative, as expected by
+    ``correct_moments``.
+    """
+
+    table: CombinationTable
+    mn: np.ndarray
+    mp: np.ndarray
+    vu: np.ndarray
+    mn_combo: np.ndarray
+    mp_combo: np.ndarray
+    vu_combo: np.ndarray
+
+    def controlling(self, kind: str) -> np.ndarray:
+        """Return the names of the combinations controlling ``"mn"``, ``"mp"`` or ``"vu"``."""
+        if kind not in ("mn", "mp", "vu"):
+            raise ValueError("Envolvente no válida")
+        return np.asarray(self.table.names, dtype=object)[getattr(self, f"{kind}_combo")]
+
+    @property
+    def vu_max(self) -> np.ndarray:
+        """Largest Vu of each beam, as taken by ``shear_design``."""
+        return self.vu.max(axis=-1)
+
+    def corrected(self, system) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the corrected ``(mn, mp)`` for ``system``."""
+        return correct_moments(self.mn, self.mp, system)
+
+    def to_beam_envelopes(
+        self, labels: Optional[Sequence[str]] = None, length=None
+    ) -> BeamEnvelopes:
+        """Return the envelopes in the layout of imported beam forces."""
+        mn = np.atleast_2d(self.mn)
+        n = len(mn)
+        if labels is None:
+            labels = [str(i + 1) for i in range(n)]
+        length = np.zeros(n) if length is None else np.broadcast_to(length, (n,)).astype(float)
+        return BeamEnvelopes(
+            labels=list(labels),
+            mn=mn,
+            mp=np.atleast_2d(self.mp),
+            vu=np.atleast_1d(self.vu_max),
+            length=length,
+        )
+
+
+def _pick(values: np.ndarray, idx: np.ndarray) -> np.ndarray:
+    """Return ``values[n, idx[n, s], s]`` for every beam and section."""
+    return np.take_along_axis(values, idx[:, None], axis=1)[:, 0]
+
+
+def combine(
+    moments,
+    shears=None,
+    table: Optional[CombinationTable] = None,
+) -> CombinationEnvelopes:
+    """Combine per-case forces and return the design envelopes.
+
+    ``moments`` has shape ``(N, n_cases, 3)`` (or ``(n_cases, 3)`` for one
+    beam) with M1, M2 and M3 of every load case of ``table`` (E.060 by
+    default); ``shears`` has the same shape. All combinations of all
+    beams are evaluated with a single matrix product.
+    """
+    table = table or e060_table()
+    m = np.asarray(moments, dtype=float)
+    single = m.ndim == 2
+    if single:
+        m = m[None]
+    v = np.zeros_like(m) if shears is None else np.asarray(shears, dtype=float).reshape(m.shape)
+    if m.shape[1:] != (len(table.cases), 3):
+        raise ValueError("Se esperan momentos de forma (N, casos, 3)")
+
+    # (C, L) @ (N, L, 6) -> (N, C, 6): moments and shears in one product
+    combos = np.matmul(table.factors, np.concatenate([m, v], axis=-1))
+    mc, vc = combos[..., :3], np.abs(combos[..., 3:])
+
+    mn_combo = mc.argmin(axis=1)
+    mp_combo = mc.argmax(axis=1)
+    vu_combo = vc.argmax(axis=1)
+    out = CombinationEnvelopes(
+        table=table,
+        mn=np.minimum(_pick(mc, mn_combo), 0.0),
+        mp=np.maximum(_pick(mc, mp_combo), 0.0),
+        vu=_pick(vc, vu_combo),
+        mn_combo=mn_combo,
+        mp_combo=mp_combo,
+        vu_combo=vu_combo,
+    )
+    if single:
+        for name in ("mn", "mp", "vu", "mn_combo", "mp_combo", "vu_combo"):
+            setattr(out, name, getattr(out, name)[0])
+    return out
@@ -0,0 +1,139 @@
+"""Continuous moment diagrams fitted through the M1, M2 and M3 values."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+import numpy as np
+from scipy.interpolate import CubicSpline
+
+# Normalized positions of the M1, M2 and M3 sections
+X_CTRL = np.array([0.0, 0.5, 1.0])
+
+
+class MomentDiagram:
+    """Cubic spline curves of one or many beams on a normalized span.
+
+    ``values`` is ``(3,)`` or ``(N, 3)``; the curves are the same
+    ``CubicSpline`` used by ``MomentApp`` but the coefficients are fitted
+    once and evaluated for all beams with matrix products.
+    """
+
+    def __init__(self, values):
+        vals = np.atleast_2d(np.array(values, dtype=float))
+        vals.flags.writeable = False
+        self.values = vals
+        spline = CubicSpline(X_CTRL, vals.T, axis=0)
+        self.breaks = spline.x
+        # coef[k] is (N, 4) with t³, t², t, 1 coefficients of piece k
+        self.coef = [np.ascontiguousarray(spline.c[:, k, :].T) for k in range(len(self.breaks) - 1)]
+        self._samples: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+
+    def __len__(self) -> int:
+        return self.values.shape[0]
+
+    def __call__(self, x) -> np.ndarray:
+        """Return the curves at normalized positions ``x`` as ``(N, len(x))``."""
+        x = np.atleast_1d(np.asarray(x, dtype=float))
+        out = np.empty((len(self), x.size))
+        piece = np.clip(np.searchsorted(self.breaks, x, side="right") - 1, 0, len(self.coef) - 1)
+        for k, coef in enumerate(self.coef):
+            sel = np.nonzero(piece == k)[0]
+            if sel.size == 0:
+                continue
+            t = x[sel] - self.breaks[k]
+            powers = np.vstack([t**3, t**2, t, np.ones_like(t)])
+            out[:, sel] = coef @ powers
+        return out
+
+    def sample(self, n_points: int = 200) -> Tuple[np.ndarray, np.ndarray]:
+        """Return a shared grid and the curves on it, cached per size."""
+        if n_points not in self._samples:
+            xi = np.linspace(0.0, 1.0, n_points)
+            ys = self(xi)
+            # Cached diagrams are shared, so keep their samples immutable
+            xi.flags.writeable = False
+            ys.flags.writeable = False
+            self._samples[n_points] = (xi, ys)
+        return self._samples[n_points]
+
+    def extreme(self, largest: bool = True) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the location and value of the maximum (or minimum) curve point."""
+        sign = 1.0 if largest else -1.0
+        best_x = np.full(len(self), np.nan)
+        best_v = np.full(len(self), -np.inf)
+        for k, coef in enumerate(self.coef):
+            h = self.breaks[k + 1] - self.breaks[k]
+            a = 3 * coef[:, 0]
+            b = 2 * coef[:, 1]
+            c = coef[:, 2]
+            disc = b * b - 4 * a * c
+            sq = np.sqrt(np.where(disc >= 0, disc, np.nan))
+            with np.errstate(divide="ignore", invalid="ignore"):
+                safe_a = np.where(np.abs(a) > 1e-12, a, np.nan)
+                r1 = (-b + sq) / (2 * safe_a)
+                r2 = (-b - sq) / (2 * safe_a)
+                lin = np.where(np.abs(b) > 1e-12, -c / np.where(b == 0, 1.0, b), np.nan)
+            r1 = np.where(np.abs(a) > 1e-12, r1, lin)
+            cand = np.stack([np.zeros(len(self)), np.full(len(self), h), r1, r2], axis=1)
+            cand = np.where((cand >= 0) & (cand <= h), cand, np.nan)
+            vals = (
+                coef[:, 0:1] * cand**3
+                + coef[:, 1:2] * cand**2
+                + coef[:, 2:3] * cand
+                + coef[:, 3:4]
+            )
+            vals = np.where(np.isnan(vals), -np.inf, sign * vals)
+            idx = np.argmax(vals, axis=1)
+            rows = np.arange(len(self))
+            v = vals[rows, idx]
+            better = v > best_v
+            best_v = np.where(better, v, best_v)
+            best_x = np.where(better, self.breaks[k] + cand[rows, idx], best_x)
+        return best_x, sign * best_v
+
+    def zero_crossings(self, n_points: int = 200) -> List[np.ndarray]:
+        """Return the normalized positions where each curve changes sign."""
+        xi, ys = self.sample(n_points)
+        s = np.sign(ys)
+        change = (s[:, :-1] * s[:, 1:]) < 0
+        rows, cols = np.nonzero(change)
+        y0 = ys[rows, cols]
+        y1 = ys[rows, cols + 1]
+        x = xi[cols] + y0 / (y0 - y1) * (xi[cols + 1] - xi[cols])
+        # Two Newton steps on the exact curve
+        for _ in range(2):
+            f = self._eval_rows(rows, x)
+            df = (self._eval_rows(rows, x + 1e-6) - self._eval_rows(rows, x - 1e-6)) / 2e-6
+            step = np.where(np.abs(df) > 1e-12, f / np.where(df == 0, 1.0, df), 0.0)
+            x = np.clip(x - step, xi[cols], xi[cols + 1])
+        exact = np.nonzero(ys == 0)
+        rows = np.concatenate([rows, exact[0]])
+        x = np.concatenate([x, xi[exact[1]]])
+        out = []
+        for i in range(len(self)):
+            out.append(np.sort(x[rows == i]))
+        return out
+
+    def _eval_rows(self, rows: np.ndarray, x: np.ndarray) -> np.ndarray:
+        """Return curve ``rows[i]`` evaluated at ``x[i]``."""
+        piece = np.clip(np.searchsorted(self.breaks, x, side="right") - 1, 0, len(self.coef) - 1)
+        out = np.empty_like(x)
+        for k, coef in enumerate(self.coef):
+            sel = piece == k
+            t = x[sel] - self.breaks[k]
+            c = coef[rows[sel]]
+            out[sel] = ((c[:, 0] * t + c[:, 1]) * t + c[:, 2]) * t + c[:, 3]
+        return out
+
+
+@lru_cache(maxsize=64)
+def _cached(values: Tuple[float, ...]) -> MomentDiagram:
+    return MomentDiagram(np.array(values).reshape(-1, 3))
+
+
+def diagram_for(values) -> MomentDiagram:
+    """Return a cached diagram for ``values`` so repeated plots do not refit."""
+    key = tuple(float(v) for v in np.ravel(values))
+    return _cached(key)
@@ -0,0 +1,41 @@
+"""Moment correction rules independent of the user interface."""
+
+from __future__ import annotations
+
+import numpy as np
+
+
+def face_factor(system) -> np.ndarray:
+    """Return the M+/M- face ratio: 1/3 for Dual 1 and 1/2 otherwise."""
+    if isinstance(system, str):
+        return np.asarray(1 / 3 if system.lower() == "dual1" else 1 / 2)
+    codes, inverse = np.unique(np.asarray(system, dtype=str), return_inverse=True)
+    factors = np.array([1 / 3 if c.lower() == "dual1" else 1 / 2 for c in codes])
+    return factors[inverse.reshape(np.shape(system))]
+
+
+def correct_moments(mn, mp, system):
+    """Return moments corrected by face and global rules.
+
+    ``mn`` and ``mp`` are ``(3,)`` or ``(N, 3)`` arrays with M1, M2 and M3;
+    ``system`` is ``"dual1"``/``"dual2"`` or one such code per beam. The
+    positive moments at the faces must reach 1/3 (Dual 1) or 1/2 (Dual 2)
+    of the negative moment there, and no moment may fall below a quarter
+    of the largest moment of its beam.
+    """
+    mn = np.abs(np.asarray(mn, dtype=float))
+    mp = np.abs(np.asarray(mp, dtype=float))
+
+    f = face_factor(system)
+    # Column-wise reductions are much faster than max(axis=-1) on 3 values
+    m_max = np.maximum(
+        np.maximum(np.maximum(mn[..., 0], mn[..., 1]), mn[..., 2]),
+        np.maximum(np.maximum(mp[..., 0], mp[..., 1]), mp[..., 2]),
+    )
+    min_global = (m_max / 4.0)[..., None]
+
+    mp_corr = np.maximum(mp, min_global)
+    for face in (0, 2):
+        np.maximum(mp_corr[..., face], f * mn[..., face], out=mp_corr[..., face])
+    mn_corr = -np.maximum(mn, min_global)
+    return mn_corr, mp_corr
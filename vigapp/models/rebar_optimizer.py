@@ -0,0 +1,113 @@
+"""Automatic selection of longitudinal bars for the design positions."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .bar_table import bar_table, layer_base_width
+from .constants import BAR_SPACING, LONG_BAR_KEYS
+
+# Limits matching the combo rows of DesignWindow
+MAX_LAYERS = 4
+MAX_ROWS = 4
+
+_EPS = 1e-9
+
+
+@dataclass
+class RebarLayout:
+    """Bars chosen for one design position."""
+
+    rows: List[Tuple[int, str, int]] = field(default_factory=list)
+    area: float = 0.0
+    weight: float = 0.0
+    base_req: float = 0.0
+    layers: int = 1
+
+
+def _pack_layers(n1, w1, n2, w2, avail, max_layers):
+    """Return bars per layer ``(m, max_layers, 2)`` packing corner bars first."""
+    counts = np.zeros((len(n1), max_layers, 2), dtype=int)
+    rem1 = n1.copy()
+    rem2 = n2.copy()
+    for layer in range(max_layers):
+        t1 = np.minimum(rem1, np.floor((avail + _EPS) / w1).astype(int))
+        left = avail - t1 * w1
+        t2 = np.minimum(rem2, np.floor((left + _EPS) / w2).astype(int))
+        counts[:, layer, 0] = t1
+        counts[:, layer, 1] = t2
+        rem1 = rem1 - t1
+        rem2 = rem2 - t2
+    return counts, rem1 + rem2
+
+
+def optimize_position(
+    as_req: float,
+    as_max: float,
+    b: float,
+    r: float,
+    de: float,
+    *,
+    diameters: Sequence[str] = LONG_BAR_KEYS,
+    max_layers: int = MAX_LAYERS,
+    max_rows: int = MAX_ROWS,
+) -> Optional[RebarLayout]:
+    """Return the lightest layout with ``as_req <= As <= as_max`` fitting in ``b``."""
+    table = bar_table(tuple(diameters))
+    sel = table.area_range(as_req, as_max)
+    if sel.start == sel.stop:
+        return None
+    n1, i1, n2, i2 = table.n1[sel], table.i1[sel], table.n2[sel], table.i2[sel]
+    area = table.area[sel]
+
+    d1 = table.diams[i1]
+    d2 = table.diams[i2]
+    # Each bar takes its diameter plus one clear spacing; the last spacing
+    # of the layer is compensated by adding it to the available width.
+    avail = b - 2 * r - 2 * de + BAR_SPACING
+    counts, rest = _pack_layers(n1, d1 + BAR_SPACING, n2, d2 + BAR_SPACING, avail, max_layers)
+
+    n_layer = counts.sum(axis=2)
+    used = counts[:, :, 0] * d1[:, None] + counts[:, :, 1] * d2[:, None]
+    width = np.where(n_layer > 0, layer_base_width(n_layer, used, r, de), 0.0)
+    n_rows = (counts > 0).sum(axis=(1, 2))
+    layers = (n_layer > 0).sum(axis=1)
+
+    ok = (rest == 0) & (counts[:, 0, 0] >= 2) & (n_rows <= max_rows)
+    if not np.any(ok):
+        return None
+
+    idx = np.nonzero(ok)[0]
+    # Areas rounded to 0.01 cm² so float noise does not beat the tie-breakers
+    order = np.lexsort((n1[idx] + n2[idx], layers[idx], np.round(area[idx], 2)))
+    best = idx[order[0]]
+
+    rows = []
+    for layer in range(max_layers):
+        for col, key_idx in ((0, i1[best]), (1, i2[best])):
+            qty = int(counts[best, layer, col])
+            if qty:
+                rows.append((qty, table.keys[key_idx], layer + 1))
+
+    return RebarLayout(
+        rows=rows,
+        area=float(area[best]),
+        weight=float(table.weight[sel][best]),
+        base_req=float(width[best].max()),
+        layers=int(layers[best]),
+    )
+
+
+def optimize_sections(
+    as_reqs: Sequence[float],
+    as_max: float,
+    b: float,
+    r: float,
+    de: float,
+    **kwargs,
+) -> List[Optional[RebarLayout]]:
+    """Return the optimal layout for each required area in ``as_reqs``."""
+    return [optimize_position(a, as_max, b, r, de, **kwargs) for a in as_reqs]
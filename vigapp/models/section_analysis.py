@@ -0,0 +1,230 @@
+"""Fiber analysis of rectangular sections by strain compatibility."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable, Tuple
+
+import numpy as np
+
+from .constants import BAR_DATA, BAR_SPACING, DIAM_CM
+
+# Steel modulus (kg/cm²) and concrete crushing strain
+ES = 2.0e6
+ECU = 0.003
+
+# Concrete fibers over the depth of the section
+N_FIBERS = 100
+
+# Bisection steps for the neutral axis (h / 2**40 is below 1e-10 cm)
+_ITER = 40
+
+
+@dataclass
+class SectionCapacity:
+    """Nominal flexural capacity at ``ECU`` in the extreme fiber.
+
+    ``c`` is the neutral axis depth (cm), ``mn`` and ``phi_mn`` are in T·m
+    and ``eps_t`` is the strain of the extreme tension bar.
+    """
+
+    c: np.ndarray
+    mn: np.ndarray
+    phi_mn: np.ndarray
+    eps_t: np.ndarray
+
+
+@dataclass
+class MomentCurvature:
+    """Moment–curvature curve; ``curvature`` in 1/m and ``moment`` in T·m."""
+
+    curvature: np.ndarray
+    moment: np.ndarray
+    c: np.ndarray
+    eps_top: np.ndarray
+
+
+def beta1(fc):
+    """Return the depth ratio of the equivalent stress block."""
+    return np.clip(0.85 - 0.05 * (np.asarray(fc, dtype=float) - 280.0) / 70.0, 0.65, 0.85)
+
+
+def face_bars(rows: Iterable[Tuple[int, str, int]], h: float, r: float, de: float):
+    """Return bar depths from the opposite face and areas of one face.
+
+    ``rows`` are ``(qty, diameter key, layer)`` as entered in the design
+    window. Layers are stacked from the face with the clear spacing of
+    ``calc_effective_depth``, each one as thick as its largest bar.
+    """
+    layers = {}
+    for n, key, layer in rows:
+        if n <= 0 or key not in BAR_DATA:
+            continue
+        entry = layers.setdefault(int(layer), [0.0, 0.0])
+        entry[0] += n * BAR_DATA[key]
+        entry[1] = max(entry[1], DIAM_CM[key])
+    depth, area = [], []
+    offset = r + de
+    for layer in sorted(layers):
+        a, db = layers[layer]
+        depth.append(h - offset - 0.5 * db)
+        area.append(a)
+        offset += db + BAR_SPACING
+    return np.array(depth), np.array(area)
+
+
+def section_bars(tension_rows, compression_rows, h: float, r: float, de: float):
+    """Return depths (from the compression face) and areas of both faces."""
+    yt, at = face_bars(tension_rows, h, r, de)
+    yc, ac = face_bars(compression_rows, h, r, de)
+    return np.concatenate([yt, h - yc]), np.concatenate([at, ac])
+
+
+def _pad(values, n: int) -> np.ndarray:
+    """Return ``values`` as a 2-D ``(n, K)`` array."""
+    arr = np.asarray(values, dtype=float)
+    if arr.ndim == 1:
+        arr = arr[None, :]
+    return np.broadcast_to(arr, (n, arr.shape[-1]))
+
+
+def _concrete_parabola(eps, fc):
+    """Hognestad parabola (kg/cm²); no tension."""
+    e0 = 2.0 * 0.85 * fc / (15000.0 * np.sqrt(fc))
+    x = np.clip(eps / e0, 0.0, None)
+    falling = np.maximum(1.0 - 0.15 * (eps - e0) / (ECU - e0), 0.0)
+    return 0.85 * fc * np.where(x < 1.0, 2.0 * x - x * x, falling)
+
+
+class _Section:
+    """Broadcast arrays of ``N`` sections ready for fiber integration."""
+
+    def __init__(self, b, h, fc, fy, bar_depth, bar_area, n_fibers):
+        b, h, fc, fy = np.broadcast_arrays(*(np.atleast_1d(v).astype(float) for v in (b, h, fc, fy)))
+        n = max(len(b), np.atleast_2d(bar_depth).shape[0])
+        self.b, self.h, self.fc, self.fy = (
+            np.broadcast_to(v, (n,))[:, None] for v in (b, h, fc, fy)
+        )
+        self.ys = _pad(bar_depth, n)
+        self.As = _pad(bar_area, n)
+        # Fiber centers and thickness
+        self.dy = self.h / n_fibers
+        self.yc = (np.arange(n_fibers) + 0.5) * self.dy
+        self.n = n
+
+    def _bar_forces(self, c, eps_top, concrete):
+        """Return bar forces and strains; ``concrete`` is the stress at each bar."""
+        eps_s = eps_top * (c - self.ys) / c
+        fs = np.clip(ES * eps_s, -self.fy, self.fy)
+        # Bars in the compression zone displace concrete
+        return self.As * (fs - concrete * (eps_s > 0)), eps_s
+
+    def forces(self, c, eps_top, block: bool):
+        """Return concrete fiber forces and depths, bar forces and bar strains.
+
+        Forces are in kg with compression positive.
+        """
+        c = c[:, None]
+        eps_top = eps_top[:, None]
+        if block:
+            depth = beta1(self.fc) * c
+            top = self.yc - 0.5 * self.dy
+            cover = np.clip((depth - top) / self.dy, 0.0, 1.0)
+            fcc = 0.85 * self.fc * cover * self.b * self.dy
+            # The fiber cut by the block acts at the middle of its covered part
+            yf = top + 0.5 * cover * self.dy
+            sc_bar = np.where(self.ys < depth, 0.85 * self.fc, 0.0)
+        else:
+            eps_c = eps_top * (c - self.yc) / c
+            fcc = _concrete_parabola(eps_c, self.fc) * self.b * self.dy
+            yf = self.yc
+            sc_bar = _concrete_parabola(eps_top * (c - self.ys) / c, self.fc)
+        fsb, eps_s = self._bar_forces(c, eps_top, sc_bar)
+        return fcc, yf, fsb, eps_s
+
+    def net_force(self, c, eps_top, block: bool):
+        """Return the axial resultant (kg) for neutral axis depths ``c``."""
+        if not block:
+            fcc, _, fsb, _ = self.forces(c, eps_top, block)
+            return fcc.sum(axis=1) + fsb.sum(axis=1)
+        # The block fibers add up exactly to its resultant, so skip them here
+        c = c[:, None]
+        depth = beta1(self.fc) * c
+        sc_bar = np.where(self.ys < depth, 0.85 * self.fc, 0.0)
+        fsb, _ = self._bar_forces(c, eps_top[:, None], sc_bar)
+        conc = 0.85 * self.fc * self.b * np.minimum(depth, self.h)
+        return conc[:, 0] + fsb.sum(axis=1)
+
+    def solve(self, eps_top, block: bool):
+        """Return the neutral axis depth balancing the section forces."""
+        lo = np.full(self.n, 1e-6)
+        hi = self.h[:, 0].copy()
+        for _ in range(_ITER):
+            mid = 0.5 * (lo + hi)
+            net = self.net_force(mid, eps_top, block)
+            # Net compression grows with c
+            too_deep = net > 0
+            hi = np.where(too_deep, mid, hi)
+            lo = np.where(too_deep, lo, mid)
+        return 0.5 * (lo + hi)
+
+    def moment(self, c, eps_top, block: bool):
+        """Return the moment (T·m) about mid-depth and the bar strains."""
+        fcc, yf, fsb, eps_s = self.forces(c, eps_top, block)
+        mid = 0.5 * self.h
+        m = (fcc * (mid - yf)).sum(axis=1) + (fsb * (mid - self.ys)).sum(axis=1)
+        return m / 1e5, eps_s
+
+
+def nominal_moment(
+    b,
+    h,
+    fc,
+    fy,
+    bar_depth,
+    bar_area,
+    *,
+    phi: float = 0.9,
+    n_fibers: int = N_FIBERS,
+) -> SectionCapacity:
+    """Return φMn of one or many sections by strain compatibility.
+
+    ``bar_depth`` (cm, from the compression face) and ``bar_area`` (cm²)
+    are ``(K,)`` or ``(N, K)``; pad with zero areas when sections have
+    different numbers of bars. Concrete uses the equivalent stress block
+    integrated over ``n_fibers`` fibers and steel is elastoplastic, so
+    compression bars and every layer take the stress of their own strain.
+    """
+    sec = _Section(b, h, fc, fy, bar_depth, bar_area, n_fibers)
+    eps_top = np.full(sec.n, ECU)
+    c = sec.solve(eps_top, block=True)
+    mn, eps_s = sec.moment(c, eps_top, block=True)
+    tension = np.where(sec.As > 0, -eps_s, -np.inf)
+    eps_t = tension.max(axis=1)
+    return SectionCapacity(c=c, mn=mn, phi_mn=phi * mn, eps_t=eps_t)
+
+
+def moment_curvature(
+    b: float,
+    h: float,
+    fc: float,
+    fy: float,
+    bar_depth,
+    bar_area,
+    *,
+    n_points: int = 40,
+    n_fibers: int = N_FIBERS,
+) -> MomentCurvature:
+    """Return the moment–curvature curve of one section up to ``ECU``.
+
+    Concrete follows the Hognestad parabola without tension. All points
+    are solved together: every step of the neutral axis bisection
+    integrates the fibers of the whole curve at once.
+    """
+    eps_top = np.linspace(ECU / n_points, ECU, n_points)
+    depth = _pad(bar_depth, n_points)
+    area = _pad(bar_area, n_points)
+    sec = _Section(b, h, fc, fy, depth, area, n_fibers)
+    c = sec.solve(eps_top, block=False)
+    m, _ = sec.moment(c, eps_top, block=False)
+    return MomentCurvature(curvature=eps_top / c * 100.0, moment=m, c=c, eps_top=eps_top)
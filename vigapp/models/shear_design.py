@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from math import sqrt, ceil
 
+import numpy as np
+
 
 # Available stirrup diameters and areas (cm^2)
 BAR_AREAS = {
@@ -147,3 +149,106 @@ def shear_design(
         sep_sr_real=sep_sr,
     )
 
+
+@dataclass
+class ShearDesignBatch:
+    """Arrays with the :class:`ShearDesignResult` fields of many beams."""
+
+    Vc: np.ndarray
+    Vs: np.ndarray
+    phi_Vc: np.ndarray
+    phi_Vc_Vs: np.ndarray
+    S_sc: np.ndarray
+    S_sr: np.ndarray
+    Lo: np.ndarray
+    Lc: np.ndarray
+    ok: np.ndarray
+    n_sc: np.ndarray
+    n_sr: np.ndarray
+    sep_sc_real: np.ndarray
+    sep_sr_real: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.Vc)
+
+    def result(self, i: int) -> ShearDesignResult:
+        """Return the result of beam ``i``."""
+        return ShearDesignResult(
+            **{f.name: getattr(self, f.name)[i].item() for f in fields(self)}
+        )
+
+
+def _count(length, spacing):
+    """Return stirrup count and real spacing as in :func:`shear_design`."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        n = np.where(spacing > 0, np.ceil(length / spacing), 0).astype(int)
+        sep = np.where(n != 0, length / np.where(n != 0, n, 1), 0.0)
+    return n, sep
+
+
+def shear_design_batch(
+    Vu,
+    Ln,
+    d,
+    b,
+    h,
+    fc,
+    *,
+    fy=4200.0,
+    phi: float = 0.85,
+    system="dual2",
+    stirrup_diam: str = '3/8"',
+    phi_long=1.0,
+    n_legs: int = 2,
+) -> ShearDesignBatch:
+    """Vectorized :func:`shear_design` for arrays of beams.
+
+    Every numeric argument may be a scalar or an ``(N,)`` array;
+    ``system`` may also be one code per beam.
+    """
+    if stirrup_diam not in BAR_AREAS:
+        raise ValueError("Di\u00e1metro de estribo no v\u00e1lido")
+
+    Vu, Ln, d, b, h, fc, fy, phi_long = np.broadcast_arrays(
+        *(np.atleast_1d(np.asarray(v, dtype=float)) for v in (Vu, Ln, d, b, h, fc, fy, phi_long))
+    )
+    system = np.char.lower(np.broadcast_to(np.asarray(system, dtype=str), Vu.shape))
+
+    Vc = 0.53 * np.sqrt(fc) * b * d / 1000.0
+    phi_Vc = phi * Vc
+    Av = n_legs * BAR_AREAS[stirrup_diam]
+    phi_st = BAR_DIAM_CM[stirrup_diam]
+
+    Vs_req = np.maximum(Vu / phi - Vc, 0.0)
+    with np.errstate(divide="ignore"):
+        S_req = np.where(Vs_req > 0, Av * fy * d / (Vs_req * 1000.0), np.inf)
+    sc_min = np.minimum(np.minimum(d / 4.0, 10.0 * phi_long), min(24.0 * phi_st, 30.0))
+    sr_max = np.minimum(0.5 * d, 30.0)
+    S_sc = np.minimum(S_req, sc_min)
+    S_sr = np.minimum(S_req, sr_max)
+
+    Vs_prov = Av * fy * d / np.minimum(S_sc, S_sr) / 1000.0
+    phi_Vc_Vs = phi * (Vc + Vs_prov)
+    ok = Vu <= phi_Vc_Vs
+
+    Lo_cm = np.where(system == "dual1", 2.0 * h, 2.0 * d)
+    Ln_cm = np.maximum(Ln * 100.0, 0.0)
+    Lc_cm = np.where(system == "volado", Ln_cm - Lo_cm, np.maximum(Ln_cm - 2.0 * Lo_cm, 0.0))
+    n_sc, sep_sc = _count(Lo_cm, S_sc)
+    n_sr, sep_sr = _count(Lc_cm, S_sr)
+
+    return ShearDesignBatch(
+        Vc=Vc,
+        Vs=Vs_prov,
+        phi_Vc=phi_Vc,
+        phi_Vc_Vs=phi_Vc_Vs,
+        S_sc=S_sc,
+        S_sr=S_sr,
+        Lo=Lo_cm / 100.0,
+        Lc=Lc_cm / 100.0,
+        ok=ok,
+        n_sc=n_sc,
+        n_sr=n_sr,
+        sep_sc_real=sep_sc,
+        sep_sr_real=sep_sr,
+    )
@@ -0,0 +1,139 @@
+"""Vectorized evaluation of section checks over a grid of dimensions."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Sequence, Tuple
+
+import numpy as np
+
+from .bar_table import layer_base_width
+from .constants import BAR_DATA, DIAM_CM, LONG_BAR_KEYS
+from .steel import calc_as_limits, calc_as_req
+
+# Grid axes, in the order of the result arrays
+AXES = ("b", "h", "fc", "bar")
+
+
+@dataclass(frozen=True)
+class SweepResult:
+    """Checks of every ``(b, h, fc, bar)`` combination.
+
+    Every array has shape ``(len(b), len(h), len(fc), len(bars))``. Areas
+    are in cm², lengths in cm. Bars are placed in a single layer of the
+    swept diameter.
+    """
+
+    b: np.ndarray
+    h: np.ndarray
+    fc: np.ndarray
+    bars: Tuple[str, ...]
+    d: np.ndarray
+    as_min: np.ndarray
+    as_max: np.ndarray
+    as_neg: np.ndarray
+    as_pos: np.ndarray
+    n_neg: np.ndarray
+    n_pos: np.ndarray
+    base_req: np.ndarray
+    s_sc: np.ndarray
+    s_sr: np.ndarray
+    ok_flexure: np.ndarray
+    ok_width: np.ndarray
+    ok_shear: np.ndarray
+
+    @property
+    def ok(self) -> np.ndarray:
+        """Combinations passing every check."""
+        return self.ok_flexure & self.ok_width & self.ok_shear
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        return self.d.shape
+
+    def plane(self, name: str, fc_idx: int, bar_idx: int) -> np.ndarray:
+        """Return the ``(b, h)`` slice of field ``name``."""
+        return getattr(self, name)[:, :, fc_idx, bar_idx]
+
+
+def sweep_sections(
+    mn: Sequence[float],
+    mp: Sequence[float],
+    b: Sequence[float],
+    h: Sequence[float],
+    fc: Sequence[float],
+    bars: Sequence[str] = LONG_BAR_KEYS,
+    *,
+    r: float = 4.0,
+    fy: float = 4200.0,
+    phi: float = 0.9,
+    stirrup: str = '3/8"',
+    Vu: float = 0.0,
+    phi_v: float = 0.85,
+    n_legs: int = 2,
+) -> SweepResult:
+    """Evaluate flexure, bar fit and stirrup spacing over the whole grid.
+
+    ``mn``/``mp`` are the design moments (T·m); the largest of each sign
+    governs. ``Vu`` (T) is the design shear used for the stirrup spacing.
+    """
+    bars = tuple(bars)
+    unknown = [k for k in bars if k not in BAR_DATA]
+    if unknown or stirrup not in DIAM_CM:
+        raise ValueError("Diámetro no válido: " + ", ".join(unknown or [stirrup]))
+
+    bb = np.asarray(b, dtype=float)[:, None, None, None]
+    hh = np.asarray(h, dtype=float)[None, :, None, None]
+    ff = np.asarray(fc, dtype=float)[None, None, :, None]
+    db = np.array([DIAM_CM[k] for k in bars])[None, None, None, :]
+    ab = np.array([BAR_DATA[k] for k in bars])[None, None, None, :]
+    de = DIAM_CM[stirrup]
+
+    d = hh - r - de - 0.5 * db
+    as_min, as_max = calc_as_limits(ff, fy, bb, d)
+    mu_neg = float(np.max(np.abs(mn), initial=0.0))
+    mu_pos = float(np.max(np.abs(mp), initial=0.0))
+    as_neg = np.maximum(calc_as_req(mu_neg, ff, bb, d, fy, phi), as_min)
+    as_pos = np.maximum(calc_as_req(mu_pos, ff, bb, d, fy, phi), as_min)
+    ok_flexure = (d > 0) & (as_neg <= as_max) & (as_pos <= as_max)
+
+    n_neg = np.maximum(np.ceil(as_neg / ab - 1e-9), 2).astype(int)
+    n_pos = np.maximum(np.ceil(as_pos / ab - 1e-9), 2).astype(int)
+    n_max = np.maximum(n_neg, n_pos)
+    base_req = layer_base_width(n_max, n_max * db, r, de)
+    ok_width = base_req <= bb + 1e-9
+
+    # Stirrups (E.060 11.5 and 21.4.4.4), Vs in T
+    vc = 0.53 * np.sqrt(ff) * bb * d / 1000.0
+    vs_req = np.maximum(Vu / phi_v - vc, 0.0)
+    av = n_legs * BAR_DATA[stirrup]
+    with np.errstate(divide="ignore"):
+        s_req = np.where(vs_req > 0, av * fy * d / (vs_req * 1000.0), np.inf)
+    s_sc = np.minimum(s_req, np.minimum(np.minimum(d / 4.0, 10.0 * db), min(24.0 * de, 30.0)))
+    s_sr = np.minimum(s_req, np.minimum(0.5 * d, 30.0))
+    ok_shear = vs_req <= 2.1 * np.sqrt(ff) * bb * d / 1000.0
+
+    shape = np.broadcast_shapes(bb.shape, hh.shape, ff.shape, db.shape)
+
+    def full(a):
+        return np.broadcast_to(a, shape)
+
+    return SweepResult(
+        b=bb.ravel(),
+        h=hh.ravel(),
+        fc=ff.ravel(),
+        bars=bars,
+        d=full(d),
+        as_min=full(as_min),
+        as_max=full(as_max),
+        as_neg=full(as_neg),
+        as_pos=full(as_pos),
+        n_neg=full(n_neg),
+        n_pos=full(n_pos),
+        base_req=full(base_req),
+        s_sc=full(s_sc),
+        s_sr=full(s_sr),
+        ok_flexure=full(ok_flexure),
+        ok_width=full(ok_width),
+        ok_shear=full(ok_shear),
+    )
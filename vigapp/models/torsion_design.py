@@ -0,0 +1,225 @@
+"""Torsion design of rectangular beams (E.060 Art. 11.6), units kg and cm.
+
+The checks are written once over numpy arrays; :func:`torsion_design`
+is the one-beam view of :func:`torsion_design_batch`. The shear part
+comes from :func:`shear_design_batch`, so the combined closed-stirrup
+spacing never exceeds the shear spacing of each zone.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, fields
+
+import numpy as np
+
+from .shear_design import BAR_AREAS, BAR_DIAM_CM, shear_design_batch
+
+
+@dataclass
+class TorsionSection:
+    """Torsion properties of rectangular sections (cm, cm²)."""
+
+    Acp: np.ndarray
+    pcp: np.ndarray
+    Aoh: np.ndarray
+    ph: np.ndarray
+    Ao: np.ndarray
+
+
+def torsion_section(b, h, r, stirrup_diam: str = '3/8"') -> TorsionSection:
+    """Return ``Acp``, ``pcp``, ``Aoh``, ``ph`` and ``Ao`` of ``b x h`` sections.
+
+    ``r`` is the cover to the outer face of the stirrup; ``Aoh`` and
+    ``ph`` are measured on the stirrup centerline.
+    """
+    if stirrup_diam not in BAR_AREAS:
+        raise ValueError("Diámetro de estribo no válido")
+    b, h, r = np.broadcast_arrays(*(np.atleast_1d(np.asarray(v, dtype=float)) for v in (b, h, r)))
+    ds = BAR_DIAM_CM[stirrup_diam]
+    x1 = b - 2.0 * r - ds
+    y1 = h - 2.0 * r - ds
+    if np.any(x1 <= 0) or np.any(y1 <= 0):
+        raise ValueError("Recubrimiento excesivo para la sección")
+    Aoh = x1 * y1
+    return TorsionSection(
+        Acp=b * h,
+        pcp=2.0 * (b + h),
+        Aoh=Aoh,
+        ph=2.0 * (x1 + y1),
+        Ao=0.85 * Aoh,
+    )
+
+
+@dataclass
+class TorsionDesignResult:
+    """Result summary for combined shear and torsion design."""
+
+    Acp: float
+    pcp: float
+    Aoh: float
+    ph: float
+    Ao: float
+    phi_Tth: float
+    phi_Tcr: float
+    Tu: float
+    required: bool
+    section_ok: bool
+    Av_s: float
+    At_s: float
+    Avt_s: float
+    s_torsion: float
+    S_sc: float
+    S_sr: float
+    Al: float
+    ok: bool
+
+
+@dataclass
+class TorsionDesignBatch:
+    """Arrays with the :class:`TorsionDesignResult` fields of many beams."""
+
+    Acp: np.ndarray
+    pcp: np.ndarray
+    Aoh: np.ndarray
+    ph: np.ndarray
+    Ao: np.ndarray
+    phi_Tth: np.ndarray
+    phi_Tcr: np.ndarray
+    Tu: np.ndarray
+    required: np.ndarray
+    section_ok: np.ndarray
+    Av_s: np.ndarray
+    At_s: np.ndarray
+    Avt_s: np.ndarray
+    s_torsion: np.ndarray
+    S_sc: np.ndarray
+    S_sr: np.ndarray
+    Al: np.ndarray
+    ok: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.Tu)
+
+    def result(self, i: int) -> TorsionDesignResult:
+        """Return the result of beam ``i``."""
+        return TorsionDesignResult(
+            **{f.name: getattr(self, f.name)[i].item() for f in fields(self)}
+        )
+
+
+def torsion_design_batch(
+    Tu,
+    Vu,
+    Ln,
+    d,
+    b,
+    h,
+    fc,
+    *,
+    r=4.0,
+    fy=4200.0,
+    phi: float = 0.85,
+    system="dual2",
+    stirrup_diam: str = '3/8"',
+    phi_long=1.0,
+    compatibility=False,
+) -> TorsionDesignBatch:
+    """Vectorized combined shear and torsion design for arrays of beams.
+
+    ``Tu`` is in T·m and ``Vu`` in T. Every numeric argument may be a
+    scalar or an ``(N,)`` array. With ``compatibility`` the design
+    torque is limited to the cracking torque ``phi_Tcr`` (Art. 11.6.2.2).
+    Stirrups are closed with two legs at 45°; ``Al`` is the longitudinal
+    steel for torsion (cm²) and spacings are in cm.
+    """
+    Tu, Vu, Ln, d, b, h, fc, r, fy, compatibility = np.broadcast_arrays(
+        *(np.atleast_1d(np.asarray(v, dtype=float)) for v in (Tu, Vu, Ln, d, b, h, fc, r, fy, compatibility))
+    )
+    sec = torsion_section(b, h, r, stirrup_diam)
+    shear = shear_design_batch(
+        Vu, Ln, d, b, h, fc, fy=fy, phi=phi, system=system,
+        stirrup_diam=stirrup_diam, phi_long=phi_long,
+    )
+    sqrt_fc = np.sqrt(fc)
+    Ab = BAR_AREAS[stirrup_diam]
+
+    # Threshold and cracking torques (kg·cm -> T·m)
+    k = sec.Acp ** 2 / sec.pcp
+    phi_Tth = phi * 0.27 * sqrt_fc * k / 1e5
+    phi_Tcr = phi * 1.1 * sqrt_fc * k / 1e5
+    Tu = np.abs(Tu)
+    Tu = np.where(compatibility != 0, np.minimum(Tu, phi_Tcr), Tu)
+    required = Tu > phi_Tth
+    Tu_kgcm = np.where(required, Tu, 0.0) * 1e5
+    Vu_kg = np.abs(Vu) * 1000.0
+
+    # Cross-section limit for solid sections (Art. 11.6.3.1)
+    stress = np.hypot(Vu_kg / (b * d), Tu_kgcm * sec.ph / (1.7 * sec.Aoh ** 2))
+    section_ok = stress <= phi * (shear.Vc * 1000.0 / (b * d) + 2.1 * sqrt_fc)
+
+    # Transverse demand: shear on both legs, torsion on one leg
+    Av_s = np.maximum(Vu_kg / phi - shear.Vc * 1000.0, 0.0) / (fy * d)
+    At_s = Tu_kgcm / (phi * 2.0 * sec.Ao * fy)
+    Avt_s = Av_s + 2.0 * At_s
+    with np.errstate(divide="ignore"):
+        s_req = np.where(Avt_s > 0, 2.0 * Ab / Avt_s, np.inf)
+    s_min_area = 2.0 * Ab * fy / np.maximum(0.2 * sqrt_fc * b, 3.5 * b)
+    s_torsion = np.where(
+        required,
+        np.minimum(np.minimum(s_req, s_min_area), np.minimum(sec.ph / 8.0, 30.0)),
+        np.inf,
+    )
+
+    # Longitudinal steel with its minimum (Art. 11.6.5.3)
+    Al = At_s * sec.ph
+    Al_min = 1.33 * sqrt_fc * sec.Acp / fy - np.maximum(At_s, 1.75 * b / fy) * sec.ph
+    Al = np.where(required, np.maximum(Al, Al_min), 0.0)
+
+    S_sc = np.minimum(shear.S_sc, s_torsion)
+    S_sr = np.minimum(shear.S_sr, s_torsion)
+    ok = section_ok & shear.ok
+
+    return TorsionDesignBatch(
+        Acp=sec.Acp,
+        pcp=sec.pcp,
+        Aoh=sec.Aoh,
+        ph=sec.ph,
+        Ao=sec.Ao,
+        phi_Tth=phi_Tth,
+        phi_Tcr=phi_Tcr,
+        Tu=Tu,
+        required=required,
+        section_ok=section_ok,
+        Av_s=Av_s,
+        At_s=At_s,
+        Avt_s=Avt_s,
+        s_torsion=s_torsion,
+        S_sc=S_sc,
+        S_sr=S_sr,
+        Al=Al,
+        ok=ok,
+    )
+
+
+def torsion_design(
+    Tu: float,
+    Vu: float,
+    Ln: float,
+    d: float,
+    b: float,
+    h: float,
+    fc: float,
+    *,
+    r: float = 4.0,
+    fy: float = 4200.0,
+    phi: float = 0.85,
+    system: str = "dual2",
+    stirrup_diam: str = '3/8"',
+    phi_long: float = 1.0,
+    compatibility: bool = False,
+) -> TorsionDesignResult:
+    """Design one beam for combined shear and torsion."""
+    return torsion_design_batch(
+        Tu, Vu, Ln, d, b, h, fc, r=r, fy=fy, phi=phi, system=system,
+        stirrup_diam=stirrup_diam, phi_long=phi_long, compatibility=compatibility,
+    ).result(0)
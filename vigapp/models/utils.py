@@ -18,8 +18,10 @@ def latex_image(latex: str, fontsize: int = 6) -> str:
 
 
 def latex_to_png(latex: str, path: str, *, fontsize: int = 12, dpi: int = 300) -> str:
-    """Deprecated helper kept for backwards compatibility."""
-    raise NotImplementedError("LaTeX a PNG deshabilitado")
+    """Write ``latex`` rendered with mathtext to ``path`` and return it."""
+    from ..graphics.formula_images import save_formula
+
+    return save_formula(latex, path, fontsize=fontsize, dpi=dpi)
 
 
 def capture_widget(widget: QWidget, path: str) -> Optional[str]:
@@ -31,9 +33,7 @@ def capture_widget(widget: QWidget, path: str) -> Optional[str]:
     return path
 
 
-import tempfile
-import re
-import sympy as sp
+from .formula_cache import formula_cache
 
 
 def draw_beam_section_png(b: float, h: float, r: float, de: float, db: float, path: str) -> str:
@@ -100,18 +100,7 @@ def draw_beam_section_png(b: float, h: float, r: float, de: float, db: float, pa
 
 def parse_formula(text: str):
     """Parse a simple equation string into a SymPy Eq if possible."""
-    if "=" not in text:
-        return None
-    left, right = text.split("=", 1)
-    left, right = left.strip(), right.strip()
-    tokens = set(re.findall(r"[A-Za-z_][A-Za-z0-9_]*", text))
-    symbols = {t: sp.symbols(t) for t in tokens}
-    try:
-        expr_l = symbols.get(left, sp.symbols(left))
-        expr_r = sp.sympify(right.replace("^", "**"), locals=symbols)
-    except Exception:
-        return None
-    return sp.Eq(expr_l, expr_r)
+    return formula_cache.parse(text)
 
 
 def formula_html(text: str, *, fontsize: int = 8) -> str:
@@ -119,17 +108,37 @@ def formula_html(text: str, *, fontsize: int = 8) -> str:
     if text.startswith("$") and text.endswith("$"):
         latex = text.strip("$")
         return f'<span style="font-size:{fontsize}px">\\({latex}\\)</span>'
-    eq = parse_formula(text)
-    if eq is None:
+    latex = formula_cache.latex(text)
+    if latex is None:
         return f"<pre>{text}</pre>"
-    latex = sp.latex(eq)
     return f'<span style="font-size:{fontsize}px">\\({latex}\\)</span>'
 
 
 def capture_widget_temp(widget: QWidget, prefix: str = "img") -> Optional[str]:
-    """Capture a widget to a temporary PNG and return the path."""
+    """Capture a widget to the artifact store and return the path.
+
+    ``prefix`` is kept for callers; identical captures share one file.
+    """
     if widget is None:
         return None
-    tmp = tempfile.NamedTemporaryFile(prefix=prefix, suffix=".png", delete=False)
-    tmp.close()
-    return capture_widget(widget, tmp.name)
+    from PyQt5.QtCore import QBuffer, QByteArray, QIODevice
+
+    from ..sistema.artifacts import artifacts
+
+    data = QByteArray()
+    buf = QBuffer(data)
+    buf.open(QIODevice.WriteOnly)
+    widget.grab().save(buf, "PNG")
+    buf.close()
+    return artifacts.put(bytes(data))
+
+
+def beam_section_png(b: float, h: float, r: float, de: float, db: float) -> str:
+    """Return the stored section drawing of these dimensions, drawn once."""
+    from ..sistema.artifacts import artifacts
+
+    return artifacts.get(
+        "beam_section",
+        (b, h, r, de, db),
+        lambda path: draw_beam_section_png(b, h, r, de, db, path),
+    )
@@ -9,7 +9,10 @@ from reportlab.lib.units import cm
 from reportlab.lib.styles import getSampleStyleSheet
 from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image
 
+from ..sistema.instrumentation import timed
 
+
+@timed()
 def generate_shear_pdf(data: Dict[str, Any], result: Any, fig_path: str, output_path: str) -> str:
     """Generate a simple shear design PDF report."""
     doc = SimpleDocTemplate(output_path, pagesize=letter)
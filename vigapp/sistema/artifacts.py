@@ -0,0 +1,208 @@
+"""Content-addressed store of generated report images.
+
+Images are keyed by a hash of the parameters that produced them (or of
+their bytes), written once and reused by later reports. Reports get a
+hard link to the stored file, or a copy when linking is not possible.
+The folder is kept under ``max_bytes`` by removing the least recently
+used files. Set ``VIGAPP_CACHE_DIR`` to move the cache folder.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+from typing import Any, Callable, Optional
+
+from ..models.formula_cache import cache_dir
+
+logger = logging.getLogger(__name__)
+
+# Bound of the artifact folder
+MAX_BYTES = 64 * 1024 * 1024
+
+# Bump when a renderer changes so stale images are not reused
+FORMAT = 1
+
+
+def _canon(value: Any) -> Any:
+    """Return ``value`` as JSON-friendly data with stable float formatting."""
+    if hasattr(value, "tolist"):  # numpy arrays and scalars
+        value = value.tolist()
+    if isinstance(value, dict):
+        return {str(k): _canon(v) for k, v in sorted(value.items(), key=lambda kv: str(kv[0]))}
+    if isinstance(value, (list, tuple)):
+        return [_canon(v) for v in value]
+    if isinstance(value, float):
+        return repr(round(value, 9))
+    if value is None or isinstance(value, (bool, int, str)):
+        return value
+    return repr(value)
+
+
+def artifact_key(kind: str, params: Any) -> str:
+    """Return the hash identifying the ``kind`` image rendered from ``params``."""
+    text = json.dumps([FORMAT, kind, _canon(params)], separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _umask() -> int:
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+class ArtifactStore:
+    """Folder of images named by their key, with LRU cleanup by size."""
+
+    def __init__(self, root: Optional[str] = None, max_bytes: int = MAX_BYTES):
+        self._root = root
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def root(self) -> str:
+        """Folder of the images; by default resolved from the cache folder on use."""
+        return self._root or os.path.join(cache_dir(), "artifacts")
+
+    def path(self, key: str, suffix: str = ".png") -> str:
+        """Return the file of ``key``, stored or not."""
+        return os.path.join(self.root, key + suffix)
+
+    def get(
+        self,
+        kind: str,
+        params: Any,
+        render: Callable[[str], Any],
+        suffix: str = ".png",
+    ) -> str:
+        """Return the stored image of ``(kind, params)``.
+
+        ``render(path)`` writes the image when it is not stored yet; it
+        receives a private temporary path so concurrent renders of the
+        same image never see a partial file.
+        """
+        path = self.path(artifact_key(kind, params), suffix)
+        if self._touch(path):
+            return path
+        self._write(path, render)
+        return path
+
+    def put(self, data: bytes, suffix: str = ".png") -> str:
+        """Store ``data`` under the hash of its bytes and return the path."""
+        path = self.path(hashlib.sha256(data).hexdigest(), suffix)
+        if self._touch(path):
+            return path
+
+        def write(tmp: str) -> None:
+            with open(tmp, "wb") as fh:
+                fh.write(data)
+
+        self._write(path, write)
+        return path
+
+    def _touch(self, path: str) -> bool:
+        """Mark ``path`` as recently used; ``False`` when it is missing."""
+        try:
+            os.utime(path)
+        except OSError:
+            with self._lock:
+                self.misses += 1
+            return False
+        with self._lock:
+            self.hits += 1
+        return True
+
+    def _write(self, path: str, render: Callable[[str], Any]) -> None:
+        os.makedirs(self.root, exist_ok=True)
+        suffix = os.path.splitext(path)[1]
+        fd, tmp = tempfile.mkstemp(dir=self.root, prefix=".tmp_", suffix=suffix)
+        os.close(fd)
+        try:
+            render(tmp)
+            # mkstemp creates 0600 files; reports get links to this one
+            os.chmod(tmp, 0o644 & ~_umask())
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+        self.prune(keep=path)
+
+    def size(self) -> int:
+        """Total bytes stored."""
+        return sum(size for _, _, size in self._entries())
+
+    def _entries(self):
+        try:
+            names = os.listdir(self.root)
+        except OSError:
+            return []
+        entries = []
+        for name in names:
+            if name.startswith(".tmp_"):
+                continue
+            path = os.path.join(self.root, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            entries.append((st.st_mtime, path, st.st_size))
+        return entries
+
+    def prune(self, keep: Optional[str] = None) -> int:
+        """Remove the oldest images until the folder fits; return the count."""
+        with self._lock:
+            entries = sorted(self._entries())
+            total = sum(size for _, _, size in entries)
+            removed = 0
+            for _, path, size in entries:
+                if total <= self.max_bytes:
+                    break
+                if path == keep:
+                    continue
+                try:
+                    os.remove(path)
+                except OSError:
+                    logger.warning("No se pudo borrar %s", path)
+                    continue
+                total -= size
+                removed += 1
+            return removed
+
+    def clear(self) -> None:
+        """Remove every stored image."""
+        with self._lock:
+            for _, path, _ in self._entries():
+                try:
+                    os.remove(path)
+                except OSError:
+                    logger.warning("No se pudo borrar %s", path)
+
+
+def link_artifact(src: str, dst: str) -> str:
+    """Make ``dst`` a hard link to ``src`` (a copy across filesystems)."""
+    try:
+        if os.path.samefile(src, dst):
+            return dst
+    except OSError:
+        pass
+    folder = os.path.dirname(dst)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    if os.path.lexists(dst):
+        os.remove(dst)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+    return dst
+
+
+artifacts = ArtifactStore()
@@ -0,0 +1,154 @@
+"""Timing of user actions with optional cProfile dumps.
+
+Set ``VIGAPP_PROFILE=1`` to write one ``.prof`` file per timed action to
+``VIGAPP_PROFILE_DIR`` (default: ``vigapp_profile`` in the temp folder).
+"""
+
+from __future__ import annotations
+
+import cProfile
+import functools
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Deque, Dict, Iterator, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Timings kept per action
+HISTORY = 256
+
+
+class Timings:
+    """Ring buffers with the recent durations (s) of each action."""
+
+    def __init__(self, maxlen: int = HISTORY):
+        self.maxlen = maxlen
+        self._data: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def add(self, name: str, seconds: float) -> None:
+        """Record one duration of ``name``."""
+        with self._lock:
+            buf = self._data.get(name)
+            if buf is None:
+                buf = self._data[name] = deque(maxlen=self.maxlen)
+            buf.append(seconds)
+
+    def clear(self) -> None:
+        """Forget all recorded timings."""
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Return count, p50, p95 and max (ms) of every action."""
+        with self._lock:
+            data = {k: np.array(v) for k, v in self._data.items()}
+        out = {}
+        for name, arr in sorted(data.items()):
+            p50, p95 = np.percentile(arr, [50, 95]) * 1000.0
+            out[name] = {
+                "count": len(arr),
+                "p50": float(p50),
+                "p95": float(p95),
+                "max": float(arr.max() * 1000.0),
+            }
+        return out
+
+    def report(self) -> str:
+        """Return the statistics as a text table."""
+        stats = self.stats()
+        if not stats:
+            return "Sin mediciones"
+        width = max(len(k) for k in stats)
+        lines = [f"{'Acción':<{width}}  {'n':>5}  {'p50 ms':>9}  {'p95 ms':>9}  {'máx ms':>9}"]
+        for name, s in stats.items():
+            lines.append(
+                f"{name:<{width}}  {s['count']:>5}  {s['p50']:>9.1f}  {s['p95']:>9.1f}  {s['max']:>9.1f}"
+            )
+        return "\n".join(lines)
+
+    def dump(self, level: int = logging.INFO) -> None:
+        """Write the statistics to the log."""
+        logger.log(level, "Tiempos de respuesta:\n%s", self.report())
+
+
+timings = Timings()
+
+# Held while an action is profiled; cProfile allows one active profiler per process
+_profiling = threading.Lock()
+
+
+def profiling_enabled() -> bool:
+    """Return ``True`` when ``VIGAPP_PROFILE`` asks for cProfile dumps."""
+    return os.environ.get("VIGAPP_PROFILE", "") not in ("", "0")
+
+
+def profile_dir() -> str:
+    """Return the folder receiving the ``.prof`` files."""
+    return os.environ.get(
+        "VIGAPP_PROFILE_DIR", os.path.join(tempfile.gettempdir(), "vigapp_profile")
+    )
+
+
+def _dump_profile(prof: cProfile.Profile, name: str) -> None:
+    folder = profile_dir()
+    os.makedirs(folder, exist_ok=True)
+    safe = "".join(c if c.isalnum() or c in "._-" else "_" for c in name)
+    path = os.path.join(folder, f"{safe}-{time.strftime('%Y%m%d-%H%M%S')}-{time.perf_counter_ns() % 10**6}.prof")
+    prof.dump_stats(path)
+    logger.debug("Perfil de %s guardado en %s", name, path)
+
+
+@contextmanager
+def measure(name: str) -> Iterator[None]:
+    """Time the enclosed block as action ``name``.
+
+    With profiling enabled, actions nested in or concurrent with a
+    profiled action are timed but not profiled.
+    """
+    prof = None
+    if profiling_enabled() and _profiling.acquire(blocking=False):
+        prof = cProfile.Profile()
+        try:
+            prof.enable()
+        except ValueError:  # another profiler is active, e.g. a debugger
+            prof = None
+            _profiling.release()
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        if prof is not None:
+            prof.disable()
+            _profiling.release()
+        elapsed = time.perf_counter() - start
+        timings.add(name, elapsed)
+        logger.debug("%s: %.1f ms", name, elapsed * 1000.0)
+        if prof is not None:
+            try:
+                _dump_profile(prof, name)
+            except OSError:
+                logger.exception("No se pudo guardar el perfil de %s", name)
+
+
+def timed(name: Optional[str] = None) -> Callable[[Callable], Callable]:
+    """Decorate a function so each call is recorded by :func:`measure`."""
+
+    def decorator(func: Callable) -> Callable:
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with measure(label):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,117 @@
+"""Staged application startup with per-stage timing.
+
+This module only needs PyQt5 so the splash can be shown before numpy,
+matplotlib and the windows are imported.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+
+logger = logging.getLogger(__name__)
+
+Stage = Tuple[str, Callable[[], object]]
+
+
+class _JobSignals(QObject):
+    done = pyqtSignal(str, float, str)
+
+
+class _Job(QRunnable):
+    """Run one background stage and report its duration and error, if any."""
+
+    def __init__(self, name: str, func: Callable[[], object]):
+        super().__init__()
+        self.name = name
+        self.func = func
+        self.signals = _JobSignals()
+
+    def run(self) -> None:
+        start = time.perf_counter()
+        error = ""
+        try:
+            self.func()
+        except Exception as exc:  # pragma: no cover - logged by the pipeline
+            error = str(exc) or type(exc).__name__
+        self.signals.done.emit(self.name, time.perf_counter() - start, error)
+
+
+class StartupPipeline(QObject):
+    """Run background jobs, then GUI stages, without blocking the event loop.
+
+    ``background`` jobs (imports, fingerprint) run together on the thread
+    pool. Once all have finished the ``stages`` run one per event-loop
+    turn on the GUI thread, so a splash keeps painting; a stage returning
+    ``False`` stops the pipeline. ``finished`` carries ``True`` when every
+    stage ran.
+    """
+
+    finished = pyqtSignal(bool)
+
+    def __init__(self, background: Sequence[Stage] = (), stages: Sequence[Stage] = (), parent=None):
+        super().__init__(parent)
+        self.background = list(background)
+        self.stages = list(stages)
+        self.durations: Dict[str, float] = {}
+        self.errors: Dict[str, str] = {}
+        self._queue: List[Stage] = []
+        self._jobs: Dict[str, _Job] = {}
+        self._start = 0.0
+
+    def start(self, pool: Optional[QThreadPool] = None) -> None:
+        """Start the background jobs; the GUI stages follow when they end."""
+        self._start = time.perf_counter()
+        self._queue = list(self.stages)
+        if not self.background:
+            QTimer.singleShot(0, self._next_stage)
+            return
+        pool = pool or QThreadPool.globalInstance()
+        for name, func in self.background:
+            job = _Job(name, func)
+            job.signals.done.connect(self._background_done)
+            self._jobs[name] = job
+        for job in list(self._jobs.values()):
+            pool.start(job)
+
+    def _background_done(self, name: str, seconds: float, error: str) -> None:
+        self.durations[name] = seconds
+        if error:
+            # A failed prefetch only loses time; the GUI stages redo the work
+            self.errors[name] = error
+            logger.warning("Etapa de inicio %s falló: %s", name, error)
+        self._jobs.pop(name, None)
+        if not self._jobs:
+            QTimer.singleShot(0, self._next_stage)
+
+    def _next_stage(self) -> None:
+        if not self._queue:
+            self._finish(True)
+            return
+        name, func = self._queue.pop(0)
+        start = time.perf_counter()
+        ok = func()
+        self.durations[name] = time.perf_counter() - start
+        if ok is False:
+            self._finish(False)
+            return
+        QTimer.singleShot(0, self._next_stage)
+
+    def _finish(self, ok: bool) -> None:
+        self.durations["total"] = time.perf_counter() - self._start
+        logger.info("Inicio: %s", self.report())
+        try:
+            from .sistema.instrumentation import timings
+        except ImportError:  # pragma: no cover - numpy missing
+            pass
+        else:
+            for name, seconds in self.durations.items():
+                timings.add(f"startup.{name}", seconds)
+        self.finished.emit(ok)
+
+    def report(self) -> str:
+        """Return the stage durations as one line."""
+        return ", ".join(f"{k} {v * 1000.0:.0f} ms" for k, v in self.durations.items())
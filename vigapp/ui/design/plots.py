@@ -39,20 +39,21 @@ def plot_required(ax: Axes, areas_n, areas_p) -> None:
     ax.axis("off")
 
 
-def plot_design(ax: Axes, areas, statuses) -> None:
-    """Plot selected reinforcement."""
+def plot_design(ax: Axes, areas, statuses, phi_mn=None) -> None:
+    """Plot selected reinforcement and, if given, its capacity φMn (T·m)."""
     x_ctrl = [0.0, 0.5, 1.0]
     areas_n = areas[:3]
     areas_p = areas[3:]
+    caps = [""] * 6 if phi_mn is None else [f"\nφMn {m:.2f}" for m in phi_mn]
     ax.clear()
     ax.plot([0, 1], [0, 0], "k-", lw=6)
     y_off = 0.1 * max(max(areas_n, default=0), max(areas_p, default=0), 1)
     label_off = 0.2 * y_off
     for idx, (x, a, st) in enumerate(zip(x_ctrl, areas_n, statuses[:3]), 1):
-        ax.text(x, y_off, f"Asd- {a:.2f} {st}", ha="center", va="bottom", color="g", fontsize=9)
+        ax.text(x, y_off, f"Asd- {a:.2f} {st}{caps[idx - 1]}", ha="center", va="bottom", color="g", fontsize=9)
         ax.text(x, label_off, f"M{idx}-", ha="center", va="bottom", fontsize=7)
     for idx, (x, a, st) in enumerate(zip(x_ctrl, areas_p, statuses[3:]), 1):
-        ax.text(x, -y_off, f"Asd+ {a:.2f} {st}", ha="center", va="top", color="g", fontsize=9)
+        ax.text(x, -y_off, f"Asd+ {a:.2f} {st}{caps[idx + 2]}", ha="center", va="top", color="g", fontsize=9)
         ax.text(x, -label_off, f"M{idx}+", ha="center", va="top", fontsize=7)
     ax.set_xlim(-0.05, 1.05)
     ax.set_ylim(-2 * y_off, 2 * y_off)
@@ -150,6 +150,15 @@ def build_ui(win) -> None:
     info_layout.addWidget(win.base_msg_label)
     layout.addLayout(info_layout, row_start, 2, 1, 6)
 
+    win.btn_optimize = QPushButton("Optimizar acero")
+    win.btn_optimize.setFont(small_font)
+    win.btn_sweep = QPushButton("Barrido b-h")
+    win.btn_sweep.setFont(small_font)
+    tools_layout = QHBoxLayout()
+    tools_layout.addWidget(win.btn_optimize)
+    tools_layout.addWidget(win.btn_sweep)
+    layout.addLayout(tools_layout, row_start, 0, 1, 2)
+
     win.fig_sec, win.ax_sec = plt.subplots(figsize=(3, 3), constrained_layout=True)
     win.canvas_sec = FigureCanvas(win.fig_sec)
     layout.addWidget(win.canvas_sec, 0, 2, len(labels) + 3, 4)
@@ -7,16 +7,24 @@ from PyQt5.QtWidgets import (
     QVBoxLayout,
     QWidget,
     QPushButton,
+    QShortcut,
 )
 import os
 
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QGuiApplication
+from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtGui import QGuiApplication, QKeySequence
 
+from .sweep_window import SweepWindow
 from .view3d_window import View3DWindow
+from .workers import start_export
 from reporte_flexion_html import generar_reporte_html
-from ..models.constants import DIAM_CM, BAR_DATA
+from ..models.constants import DIAM_CM, BAR_DATA, LONG_BAR_KEYS
+from ..models.bar_table import layer_base_width
+from ..models.history import History, make_state, with_orders
+from ..models.rebar_optimizer import optimize_sections
+from ..models.section_analysis import nominal_moment, section_bars
 from ..models.utils import capture_widget_temp
+from ..sistema.instrumentation import measure
 from .design import (
     build_ui,
     calc_as_limits,
@@ -30,9 +38,52 @@ from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 import numpy as np
 
 
+def memoria_report_args(data):
+    """Return the arguments of ``generar_reporte_html`` as immutable tuples."""
+    datos = tuple((k, v) for k, v in data.get("data_section", []))
+    calc_sections = data.get("calc_sections", [])
+    keys = ["peralte", "b1", "pbal", "pmax", "as_min", "as_max"]
+    resultados = []
+    for key, sec in zip(keys, calc_sections[:6]):
+        forms = [f.strip("$") for f in sec[1]]
+        resultados.append(
+            (
+                key,
+                (
+                    ("general", forms[0] if len(forms) > 0 else ""),
+                    ("reemplazo", forms[1] if len(forms) > 1 else ""),
+                    ("resultado", forms[2] if len(forms) > 2 else ""),
+                ),
+            )
+        )
+    tabla = tuple(tuple(row) for row in data.get("verif_table", []))
+    imagenes = tuple(data.get("images", []))
+    seccion = data.get("section_img")
+    dev_as = tuple((title, tuple(forms)) for title, forms in calc_sections[6:])
+    return datos, tuple(resultados), tabla, imagenes, seccion, dev_as
+
+
+def export_memoria_html(args, progress):
+    """Background job writing the flexure HTML report."""
+    datos, resultados, tabla, imagenes, seccion, dev_as = args
+    progress(10, "Generando memoria")
+    generar_reporte_html(
+        dict(datos),
+        {k: dict(v) for k, v in resultados},
+        [list(row) for row in tabla],
+        list(imagenes),
+        seccion,
+        [(title, list(forms)) for title, forms in dev_as],
+    )
+    progress(100, "Listo")
+
+
 class DesignWindow(QMainWindow):
     """Ventana para la etapa de diseño de acero (solo interfaz gráfica)."""
 
+    # Bar orders of a restored history step (neg_orders, pos_orders)
+    ordersRestored = pyqtSignal(object, object)
+
     def __init__(
         self,
         mn_corr,
@@ -44,6 +95,7 @@ class DesignWindow(QMainWindow):
         save_callback=None,
         menu_callback=None,
         back_callback=None,
+        change_callback=None,
     ):
         """Create the design window using corrected moments."""
         super().__init__(parent)
@@ -54,14 +106,30 @@ class DesignWindow(QMainWindow):
         self.menu_callback = menu_callback
         self.setWindowTitle("Parte 2 – Diseño de Acero")
         self.back_callback = back_callback
+        self.change_callback = change_callback
+        # Incremented on every design check so dependent pages know when to redraw
+        self.revision = 0
+        self.history = History()
+        # Bar orders shown by the development view; empty means input order
+        self.bar_orders = ((), ())
+        self._restoring = False
         self._build_ui()
+        for keys, slot in (
+            (("Ctrl+Z",), self.undo),
+            (("Ctrl+Y", "Ctrl+Shift+Z"), self.redo),
+        ):
+            for key in keys:
+                QShortcut(QKeySequence(key), self, activated=slot,
+                          context=Qt.WidgetWithChildrenShortcut)
         # Provide enough vertical space so scrolling is rarely needed
         self.resize(800, 1500)
         if show_window:
             self.show()
 
     def update_moments(self, mn_corr, mp_corr):
-        """Update the design moments and redraw plots."""
+        """Update the design moments and redraw plots if they changed."""
+        if np.array_equal(mn_corr, self.mn_corr) and np.array_equal(mp_corr, self.mp_corr):
+            return
         self.mn_corr = mn_corr
         self.mp_corr = mp_corr
         self._redraw()
@@ -187,6 +255,8 @@ class DesignWindow(QMainWindow):
         self.btn_view3d.clicked.connect(self.on_next)
         self.btn_menu.clicked.connect(self.on_menu)
         self.btn_back.clicked.connect(self.on_back)
+        self.btn_optimize.clicked.connect(self.optimize_rebar)
+        self.btn_sweep.clicked.connect(self.show_sweep)
 
         for ed in self.edits.values():
             ed.editingFinished.connect(self._redraw)
@@ -210,7 +280,7 @@ class DesignWindow(QMainWindow):
         if len(self.rebar_rows[idx]) >= 4:
             return
         qty_opts = [""] + [str(i) for i in range(1, 11)]
-        dia_opts = ["", '1/2"', '5/8"', '3/4"', '1"']
+        dia_opts = [""] + list(LONG_BAR_KEYS)
         row_layout = QHBoxLayout()
         row_layout.setSpacing(2)
         row_layout.setContentsMargins(0, 0, 0, 0)
@@ -259,6 +329,57 @@ class DesignWindow(QMainWindow):
         ]
         self.update_design_as()
 
+    def _apply_layout(self, idx, rows):
+        """Replace the combo rows of position ``idx`` with ``rows``."""
+        while len(self.rebar_rows[idx]) < len(rows):
+            self._add_rebar_row(idx)
+        for extra in self.rebar_rows[idx][len(rows):]:
+            extra["widget"].setParent(None)
+        self.rebar_rows[idx] = self.rebar_rows[idx][: len(rows)]
+        for row, (qty, key, layer) in zip(self.rebar_rows[idx], rows):
+            for box, text in (
+                (row["qty"], str(qty)),
+                (row["dia"], key),
+                (row["capa"], str(layer)),
+            ):
+                box.blockSignals(True)
+                box.setCurrentText(text)
+                box.blockSignals(False)
+
+    def optimize_rebar(self):
+        """Select the lightest bar layout for every design position."""
+        as_n, as_p = self._required_areas()
+        try:
+            b = float(self.edits["b (cm)"].text())
+            r = float(self.edits["r (cm)"].text())
+        except ValueError:
+            return
+        de = DIAM_CM.get(self.cb_estribo.currentText(), 0)
+
+        labels = ["M1-", "M2-", "M3-", "M1+", "M2+", "M3+"]
+        # Extra layers reduce d and raise As_req, so repeat until stable
+        for _ in range(3):
+            as_reqs = list(as_n) + list(as_p)
+            layouts = optimize_sections(as_reqs, self.as_max, b, r, de)
+            failed = []
+            for idx, (lab, layout) in enumerate(zip(labels, layouts)):
+                if layout is None:
+                    failed.append(lab)
+                    continue
+                self._apply_layout(idx, layout.rows)
+            as_n, as_p = self._required_areas()
+            totals = self._design_areas()
+            if all(t >= a for t, a in zip(totals, list(as_n) + list(as_p))):
+                break
+
+        self._redraw()
+        if failed:
+            QMessageBox.warning(
+                self,
+                "Optimizar acero",
+                "Sin combinación válida para: " + ", ".join(failed),
+            )
+
     def draw_section(self):
         """Draw the beam section based on current inputs."""
         try:
@@ -273,9 +394,10 @@ class DesignWindow(QMainWindow):
         self.canvas_sec.draw()
 
     def _redraw(self):
-        self.draw_section()
-        self.draw_required_distribution()
-        self.update_design_as()
+        with measure("DesignWindow._redraw"):
+            self.draw_section()
+            self.draw_required_distribution()
+            self.update_design_as()
 
     def draw_required_distribution(self):
         """Plot the required steel areas along the beam length."""
@@ -292,10 +414,7 @@ class DesignWindow(QMainWindow):
 
         for idx, rows in enumerate(self.rebar_rows):
             total = 0
-            layers = {
-                1: {"n": 0, "sum_d": 0.0},
-                2: {"n": 0, "sum_d": 0.0},
-            }
+            layers = {layer: {"n": 0, "sum_d": 0.0} for layer in range(1, 5)}
 
             for row in rows:
                 try:
@@ -320,12 +439,10 @@ class DesignWindow(QMainWindow):
             except ValueError:
                 continue
 
-            b_layers = []
-            for ldata in layers.values():
-                n_l = ldata["n"]
-                spacing = max(n_l - 1, 0) * 2.5
-                b_l = 2 * r + 2 * de + spacing + ldata["sum_d"]
-                b_layers.append(b_l)
+            b_layers = [
+                layer_base_width(ldata["n"], ldata["sum_d"], r, de)
+                for ldata in layers.values()
+            ]
             base_reqs.append(max(b_layers))
 
         self.as_total = sum(totals)
@@ -344,11 +461,150 @@ class DesignWindow(QMainWindow):
 
         statuses = ["OK" if t >= req else "NO OK" for t, req in zip(totals, as_reqs)]
 
+        self.phi_mn = self._capacities()
         self.draw_design_distribution(totals, statuses)
+        self.revision += 1
+        self._record()
+        if self.change_callback:
+            self.change_callback()
+
+    # ------------------------------------------------------------------
+    def rebar_snapshot(self):
+        """Return the rebar rows as ``(qty, diameter, layer)`` text tuples."""
+        return tuple(
+            tuple(
+                (r["qty"].currentText(), r["dia"].currentText(), r["capa"].currentText())
+                for r in rows
+            )
+            for rows in self.rebar_rows
+        )
+
+    def capture_state(self):
+        """Return the current editable values as a history snapshot."""
+        prev = self.history.current
+        inputs = [(k, ed.text()) for k, ed in self.edits.items() if k != "d (cm)"]
+        inputs += [
+            ("estribo", self.cb_estribo.currentText()),
+            ("varilla", self.cb_varilla.currentText()),
+            ("capas", self.layer_combo.currentText()),
+        ]
+        state = make_state(
+            prev, mn=self.mn_corr, mp=self.mp_corr, inputs=inputs, rebar=self.rebar_snapshot()
+        )
+        # The development view keeps its bar orders only while the bars are
+        # unchanged; new bars bring it back to the input order
+        if prev is not None and state.rebar is not prev.rebar:
+            self.bar_orders = ((), ())
+        return with_orders(state, *self.bar_orders)
+
+    def _record(self, label=""):
+        if not self._restoring:
+            self.history.push(self.capture_state(), label)
+
+    def record_orders(self, neg_orders, pos_orders):
+        """Record a bar order edit made in the sections view."""
+        base = self.history.current or self.capture_state()
+        self.bar_orders = (neg_orders, pos_orders)
+        self.history.push(with_orders(base, neg_orders, pos_orders), "orden")
+
+    def undo(self):
+        """Restore the previous design step."""
+        prev = self.history.current
+        state = self.history.undo()
+        if state is not None:
+            self._restore(state, prev)
+
+    def redo(self):
+        """Restore the design step undone last."""
+        prev = self.history.current
+        state = self.history.redo()
+        if state is not None:
+            self._restore(state, prev)
+
+    def _restore(self, state, prev):
+        """Apply ``state`` recomputing only what depends on the changed fields."""
+        changed = state.changed(prev)
+        self.bar_orders = (state.neg_orders, state.pos_orders)
+        self._restoring = True
+        try:
+            if "inputs" in changed:
+                values = dict(state.inputs)
+                for key, ed in self.edits.items():
+                    if key in values:
+                        ed.setText(values[key])
+                for key, cb in (
+                    ("estribo", self.cb_estribo),
+                    ("varilla", self.cb_varilla),
+                    ("capas", self.layer_combo),
+                ):
+                    cb.blockSignals(True)
+                    cb.setCurrentText(values.get(key, cb.currentText()))
+                    cb.blockSignals(False)
+            if "rebar" in changed:
+                for idx, rows in enumerate(state.rebar):
+                    if idx >= len(prev.rebar) or rows is not prev.rebar[idx]:
+                        self._apply_layout(idx, rows)
+            if "mn" in changed or "mp" in changed:
+                self.mn_corr = np.array(state.mn)
+                self.mp_corr = np.array(state.mp)
+
+            if "inputs" in changed or "rebar" in changed:
+                self._redraw()
+            elif "mn" in changed or "mp" in changed:
+                self.draw_required_distribution()
+                self.update_design_as()
+        finally:
+            self._restoring = False
+        if "neg_orders" in changed or "pos_orders" in changed:
+            self.ordersRestored.emit(state.neg_orders, state.pos_orders)
+
+    def _row_values(self, idx):
+        """Return ``(qty, diameter key, layer)`` of the rows of position ``idx``."""
+        values = []
+        for row in self.rebar_rows[idx]:
+            try:
+                n = int(row["qty"].currentText() or 0)
+                layer = int(row["capa"].currentText() or 1)
+            except ValueError:
+                continue
+            values.append((n, row["dia"].currentText(), layer))
+        return values
+
+    def placed_bars(self):
+        """Return the ``(qty, diameter key, layer)`` rows of the six positions."""
+        return [self._row_values(i) for i in range(6)]
+
+    def _capacities(self):
+        """Return φMn (T·m) of the placed bars at the six design positions.
+
+        The bars of the opposite face at the same section act as
+        compression steel.
+        """
+        try:
+            b = float(self.edits["b (cm)"].text())
+            h = float(self.edits["h (cm)"].text())
+            r = float(self.edits["r (cm)"].text())
+            fc = float(self.edits["f'c (kg/cm²)"].text())
+            fy = float(self.edits["fy (kg/cm²)"].text())
+            phi = float(self.edits["φ"].text())
+        except ValueError:
+            return None
+        if b <= 0 or h <= 0 or fc <= 0:
+            return None
+        de = DIAM_CM.get(self.cb_estribo.currentText(), 0)
+        rows = self.placed_bars()
+        bars = [section_bars(rows[i], rows[(i + 3) % 6], h, r, de) for i in range(6)]
+        k = max(len(y) for y, _ in bars) or 1
+        depth = np.zeros((6, k))
+        area = np.zeros((6, k))
+        for i, (y, a) in enumerate(bars):
+            depth[i, : len(y)] = y
+            area[i, : len(a)] = a
+        return nominal_moment(b, h, fc, fy, depth, area, phi=phi).phi_mn
 
     def draw_design_distribution(self, areas, statuses):
         """Plot chosen reinforcement distribution along the beam."""
-        plot_design(self.ax_des, areas, statuses)
+        plot_design(self.ax_des, areas, statuses, getattr(self, "phi_mn", None))
         self.canvas_dist.draw()
 
     def _capture_design(self):
@@ -379,27 +635,53 @@ class DesignWindow(QMainWindow):
         self.view3d = View3DWindow(self)
         self.view3d.show()
 
+    def show_sweep(self):
+        """Open the b × h sweep seeded with the current inputs."""
+        try:
+            vals = {
+                key: float(self.edits[name].text())
+                for key, name in (
+                    ("b", "b (cm)"),
+                    ("h", "h (cm)"),
+                    ("r", "r (cm)"),
+                    ("fc", "f'c (kg/cm²)"),
+                    ("fy", "fy (kg/cm²)"),
+                    ("phi", "φ"),
+                )
+            }
+        except ValueError:
+            QMessageBox.warning(self, "Barrido b-h", "Datos de sección no válidos")
+            return
+        self.sweep = SweepWindow(
+            self.mn_corr,
+            self.mp_corr,
+            self,
+            stirrup=self.cb_estribo.currentText(),
+            bar=self.cb_varilla.currentText(),
+            apply_callback=self.apply_dimensions,
+            **vals,
+        )
+        self.sweep.show()
+
+    def apply_dimensions(self, b, h):
+        """Set ``b`` and ``h`` (cm) and redesign."""
+        self.edits["b (cm)"].setText(f"{b:g}")
+        self.edits["h (cm)"].setText(f"{h:g}")
+        self._redraw()
+
     def show_memoria(self):
-        """Generate the HTML report directly."""
+        """Generate the HTML report in the background."""
         _, data = self._build_memoria()
         if data is None:
             return
-        datos = {k: v for k, v in data.get("data_section", [])}
-        calc_sections = data.get("calc_sections", [])
-        keys = ["peralte", "b1", "pbal", "pmax", "as_min", "as_max"]
-        resultados = {}
-        for key, sec in zip(keys, calc_sections[:6]):
-            forms = [f.strip("$") for f in sec[1]]
-            resultados[key] = {
-                "general": forms[0] if len(forms) > 0 else "",
-                "reemplazo": forms[1] if len(forms) > 1 else "",
-                "resultado": forms[2] if len(forms) > 2 else "",
-            }
-        tabla = data.get("verif_table", [])
-        imagenes = data.get("images", [])
-        seccion = data.get("section_img")
-        dev_as = calc_sections[6:]
-        generar_reporte_html(datos, resultados, tabla, imagenes, seccion, dev_as)
+        self.btn_memoria.setEnabled(False)
+        start_export(
+            self,
+            export_memoria_html,
+            memoria_report_args(data),
+            "Memoria de cálculo",
+            on_done=lambda: self.btn_memoria.setEnabled(True),
+        )
 
     def _build_memoria(self):
         """Return title and structured data for the calculation memory."""
@@ -546,14 +828,9 @@ class DesignWindow(QMainWindow):
         except Exception:
             pass
 
-        from ..models.utils import draw_beam_section_png
-        import tempfile
+        from ..models.utils import beam_section_png
 
-        tmp = tempfile.NamedTemporaryFile(
-            prefix="section_pdf_", suffix=".png", delete=False
-        )
-        tmp.close()
-        section_img = draw_beam_section_png(b, h, r, de, db, tmp.name)
+        section_img = beam_section_png(b, h, r, de, db)
 
         title = title_text
         data = {
@@ -1,7 +1,5 @@
 import os
-import re
-import tempfile
-from typing import Optional
+from io import BytesIO
 
 from PyQt5.QtWidgets import (
     QApplication,
@@ -13,11 +11,16 @@ from PyQt5.QtWidgets import (
     QPushButton,
     QFileDialog,
     QComboBox,
+    QLabel,
 )
-from PyQt5.QtGui import QGuiApplication, QIcon
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-import matplotlib.pyplot as plt
-import sympy as sp
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QGuiApplication, QIcon, QPixmap
+
+from ..graphics.formula_images import formula_images
+from ..models.formula_cache import formula_cache
+
+FONT_SIZE = 14
+EXPORT_DPI = 300
 
 
 class FormulaWindow(QMainWindow):
@@ -50,6 +53,8 @@ class FormulaWindow(QMainWindow):
             ),
         }
 
+        # Parse the catalogue once; later sessions read it from disk
+        formula_cache.warm(self._formulas.values())
         self._build_ui()
         self.setFixedSize(700, 900)
 
@@ -71,10 +76,12 @@ class FormulaWindow(QMainWindow):
         input_layout.addWidget(btn_show)
         layout.addLayout(input_layout)
 
-        self.fig, self.ax = plt.subplots(figsize=(4, 1.5))
-        self.ax.axis("off")
-        self.canvas = FigureCanvas(self.fig)
-        layout.addWidget(self.canvas)
+        self.image = QLabel()
+        self.image.setAlignment(Qt.AlignCenter)
+        self.image.setMinimumHeight(150)
+        self.image.setStyleSheet("background:white")
+        layout.addWidget(self.image)
+        self.latex = None
 
         btns = QHBoxLayout()
         icon_path = os.path.join(
@@ -98,35 +105,25 @@ class FormulaWindow(QMainWindow):
             self.show_formula()
 
     # ------------------------------------------------------------------
-    def _parse_formula(self, text: str) -> Optional[sp.Eq]:
+    def _parse_formula(self, text: str):
         """Return a SymPy equation from linear text."""
-        if "=" not in text:
-            return None
-        left, right = text.split("=", 1)
-        left, right = left.strip(), right.strip()
-        tokens = set(re.findall(r"[A-Za-z_][A-Za-z0-9_]*", text))
-        symbols = {t: sp.symbols(t) for t in tokens}
-        expr_l = symbols.get(left, sp.symbols(left))
-        expr_r = sp.sympify(right.replace("^", "**"), locals=symbols)
-        return sp.Eq(expr_l, expr_r)
+        return formula_cache.parse(text)
 
     def show_formula(self):
-        eq = self._parse_formula(self.edit.text())
-        if eq is None:
+        latex = formula_cache.latex(self.edit.text())
+        if latex is None:
             return
-        latex = sp.latex(eq)
-        self.ax.clear()
-        self.ax.axis("off")
-        self.ax.text(0.5, 0.5, f"${latex}$", ha="center", va="center", fontsize=10)
-        self.canvas.draw()
+        self.latex = latex
+        pix = QPixmap()
+        pix.loadFromData(formula_images.render(latex, FONT_SIZE, self.logicalDpiX()), "PNG")
+        self.image.setPixmap(pix)
 
     # ------------------------------------------------------------------
     def capture(self):
         """Copy the formula image to the clipboard."""
-        self.canvas.repaint()
-        QApplication.processEvents()
-        pix = self.canvas.grab()
-        QGuiApplication.clipboard().setPixmap(pix)
+        pix = self.image.pixmap()
+        if pix is not None and not pix.isNull():
+            QGuiApplication.clipboard().setPixmap(pix)
 
     def export(self):
         """Save the formula as PNG, PDF or DOCX."""
@@ -136,21 +133,19 @@ class FormulaWindow(QMainWindow):
             "",
             "PNG (*.png);;PDF (*.pdf);;Word (*.docx)",
         )
-        if not path:
+        if not path or self.latex is None:
             return
         ext = os.path.splitext(path)[1].lower()
         if ext == ".docx":
-            tmp = tempfile.NamedTemporaryFile(suffix=".png", delete=False)
-            tmp.close()
-            self.fig.savefig(tmp.name, bbox_inches="tight", dpi=300)
             from docx import Document
 
             doc = Document()
-            doc.add_picture(tmp.name)
+            doc.add_picture(BytesIO(formula_images.render(self.latex, FONT_SIZE, EXPORT_DPI)))
             doc.save(path)
-            os.unlink(tmp.name)
         else:
-            self.fig.savefig(path, bbox_inches="tight")
+            fmt = "pdf" if ext == ".pdf" else "png"
+            with open(path, "wb") as fh:
+                fh.write(formula_images.render(self.latex, FONT_SIZE, EXPORT_DPI, fmt))
 
 
 if __name__ == "__main__":
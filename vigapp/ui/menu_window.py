@@ -1,3 +1,4 @@
+import html
 import os
 from PyQt5.QtWidgets import (
     QMainWindow,
@@ -12,10 +13,13 @@ from PyQt5.QtWidgets import (
     QSpacerItem,
     QFrame,
     QGraphicsColorizeEffect,
+    QShortcut,
+    QFileDialog,
 )
-from PyQt5.QtCore import Qt, QSize
+from PyQt5.QtCore import Qt, QSize, QTimer
 from .shear_window import ShearDesignWindow
-from PyQt5.QtGui import QPixmap, QIcon
+from .torsion_window import TorsionDesignWindow
+from PyQt5.QtGui import QPixmap, QIcon, QKeySequence
 
 
 class HoverIcon(QLabel):
@@ -102,9 +106,13 @@ class BackgroundWidget(QWidget):
 
 
 from .moment_app import MomentApp
-from .design_window import DesignWindow
+from .design_window import DesignWindow, export_memoria_html, memoria_report_args
 from .view3d_window import View3DWindow
-from reporte_flexion_html import generar_reporte_html
+from .workers import start_export
+from ..sistema.instrumentation import measure, timings
+
+# Idle time (ms) after the last change before prebuilding the next page
+PREBUILD_DELAY_MS = 300
 
 
 class MenuWindow(QMainWindow):
@@ -137,9 +145,19 @@ class MenuWindow(QMainWindow):
         self.mn_corr = None
         self.mp_corr = None
         self.design_ready = False
+        self._pending_moments = None
+
+        # Debounced idle-time construction of the next workflow page
+        self._prebuild_timer = QTimer(self)
+        self._prebuild_timer.setSingleShot(True)
+        self._prebuild_timer.setInterval(PREBUILD_DELAY_MS)
+        self._prebuild_timer.timeout.connect(self._prebuild_next)
 
         self._build_menu()
 
+        # Hidden diagnostics: response times of the main actions
+        QShortcut(QKeySequence("Ctrl+Shift+T"), self, activated=self.show_timings)
+
     # ------------------------------------------------------------------
     def _update_logo(self):
         pix = QPixmap(self._logo_path)
@@ -245,7 +263,7 @@ class MenuWindow(QMainWindow):
         layout.addWidget(button_box)
 
         btn_flex.clicked.connect(self.open_diagrama)
-        btn_torsion.clicked.connect(self.show_cortante_msg)
+        btn_torsion.clicked.connect(self.open_torsion)
         btn_cort.clicked.connect(self.open_cortante)
         btn_mem.clicked.connect(self.open_memoria)
         btn_contact.clicked.connect(self.show_contact)
@@ -262,6 +280,7 @@ class MenuWindow(QMainWindow):
                 show_window=False,
                 next_callback=self._diagram_next,
                 menu_callback=self.show_menu,
+                calc_callback=self._diagram_calculated,
             )
             self.stacked.addWidget(self.diagram_page)
         self.stacked.setCurrentWidget(self.diagram_page)
@@ -272,24 +291,64 @@ class MenuWindow(QMainWindow):
         self.design_ready = False
         self.open_diseno()
 
+    def _diagram_calculated(self, mn, mp):
+        self._pending_moments = (mn, mp)
+        self._schedule_prebuild()
+
     # ------------------------------------------------------------------
-    def open_diseno(self):
-        if self.mn_corr is None or self.mp_corr is None:
-            QMessageBox.warning(self, "Advertencia", "Primero defina el diagrama")
-            return
+    def _schedule_prebuild(self):
+        """Prebuild the next page once the user stops editing."""
+        self._prebuild_timer.start()
+
+    def _prebuild_next(self):
+        """Build the page following the current one while the app is idle."""
+        current = self.stacked.currentWidget()
+        with measure("MenuWindow._prebuild_next"):
+            if current is getattr(self, "diagram_page", None):
+                if self._pending_moments is not None:
+                    self._ensure_design_page(*self._pending_moments)
+            elif current is getattr(self, "design_page", None):
+                self._ensure_desarrollo_page()
+
+    def _ensure_design_page(self, mn, mp):
         if not hasattr(self, "design_page"):
             self.design_page = DesignWindow(
-                self.mn_corr,
-                self.mp_corr,
+                mn,
+                mp,
                 show_window=False,
                 next_callback=self._design_next,
                 menu_callback=self.show_menu,
                 back_callback=self.show_diagram,
+                change_callback=self._schedule_prebuild,
             )
             self.stacked.addWidget(self.design_page)
         else:
-            self.design_page.update_moments(self.mn_corr, self.mp_corr)
+            self.design_page.update_moments(mn, mp)
+
+    def _ensure_desarrollo_page(self):
+        if not hasattr(self, "desarrollo_page"):
+            self.desarrollo_page = View3DWindow(
+                self.design_page,
+                show_window=False,
+                menu_callback=self.show_menu,
+                back_callback=self.show_design,
+            )
+            self.stacked.addWidget(self.desarrollo_page)
+        elif self.desarrollo_page.drawn_revision != self.design_page.revision:
+            # Refresh drawings only when the design changed since the last
+            # draw; hand-set bar orders survive unless the bars changed
+            page = self.desarrollo_page
+            rebar = self.design_page.rebar_snapshot()
+            page.draw_views(reset_orders=getattr(page, "drawn_rebar", None) != rebar)
+
+    # ------------------------------------------------------------------
+    def open_diseno(self):
+        if self.mn_corr is None or self.mp_corr is None:
+            QMessageBox.warning(self, "Advertencia", "Primero defina el diagrama")
+            return
+        self._ensure_design_page(self.mn_corr, self.mp_corr)
         self.stacked.setCurrentWidget(self.design_page)
+        self._schedule_prebuild()
 
     def _design_next(self):
         self.design_ready = True
@@ -299,17 +358,8 @@ class MenuWindow(QMainWindow):
         if not self.design_ready:
             QMessageBox.warning(self, "Advertencia", "Primero complete el diseño")
             return
-        if not hasattr(self, "desarrollo_page"):
-            self.desarrollo_page = View3DWindow(
-                self.design_page,
-                show_window=False,
-                menu_callback=self.show_menu,
-                back_callback=self.show_design,
-            )
-            self.stacked.addWidget(self.desarrollo_page)
-        else:
-            # Refresh drawings when returning to the sections page
-            self.desarrollo_page.draw_views(reset_orders=True)
+        self._prebuild_timer.stop()
+        self._ensure_desarrollo_page()
         self.stacked.setCurrentWidget(self.desarrollo_page)
 
     # ------------------------------------------------------------------
@@ -317,25 +367,39 @@ class MenuWindow(QMainWindow):
         if not self.design_ready:
             QMessageBox.warning(self, "Advertencia", "Debe completar el diseño")
             return
-        _, data = self.design_page._build_memoria()
+        box = QMessageBox(self)
+        box.setWindowTitle("Memoria de cálculo")
+        box.setText("Formato de la memoria:")
+        btn_html = box.addButton("HTML", QMessageBox.AcceptRole)
+        btn_word = box.addButton("Word", QMessageBox.AcceptRole)
+        box.addButton("Cancelar", QMessageBox.RejectRole)
+        box.exec_()
+        if box.clickedButton() not in (btn_html, btn_word):
+            return
+        path = None
+        if box.clickedButton() is btn_word:
+            path, _ = QFileDialog.getSaveFileName(
+                self, "Guardar memoria", "memoria_calculo.docx", "Word (*.docx)"
+            )
+            if not path:
+                return
+        title, data = self.design_page._build_memoria()
         if data is None:
             return
-        datos = {k: v for k, v in data.get("data_section", [])}
-        calc_sections = data.get("calc_sections", [])
-        keys = ["peralte", "b1", "pbal", "pmax", "as_min", "as_max"]
-        resultados = {}
-        for key, sec in zip(keys, calc_sections[:6]):
-            forms = [f.strip("$") for f in sec[1]]
-            resultados[key] = {
-                "general": forms[0] if len(forms) > 0 else "",
-                "reemplazo": forms[1] if len(forms) > 1 else "",
-                "resultado": forms[2] if len(forms) > 2 else "",
-            }
-        tabla = data.get("verif_table", [])
-        imagenes = data.get("images", [])
-        seccion = data.get("section_img")
-        dev_as = calc_sections[6:]
-        generar_reporte_html(datos, resultados, tabla, imagenes, seccion, dev_as)
+        if path is None:
+            start_export(
+                self,
+                export_memoria_html,
+                memoria_report_args(data),
+                "Memoria de cálculo",
+            )
+            return
+        from ..docx_report import BeamMemoria, export_memoria_docx
+
+        shear_page = getattr(self, "cortante_page", None)
+        shear = shear_page._export_snapshot() if shear_page is not None else None
+        beam = BeamMemoria(title.split("VIGA", 1)[-1].strip(), memoria_report_args(data), shear)
+        start_export(self, export_memoria_docx, (path, (beam,)), "Memoria de cálculo")
 
     def open_cortante(self):
         design_ref = getattr(self, "design_page", None)
@@ -348,6 +412,17 @@ class MenuWindow(QMainWindow):
         self.stacked.addWidget(self.cortante_page)
         self.stacked.setCurrentWidget(self.cortante_page)
 
+    def open_torsion(self):
+        design_ref = getattr(self, "design_page", None)
+        self.torsion_page = TorsionDesignWindow(
+            design_ref,
+            show_window=False,
+            menu_callback=self.show_menu,
+            back_callback=self.show_design if design_ref else self.show_menu,
+        )
+        self.stacked.addWidget(self.torsion_page)
+        self.stacked.setCurrentWidget(self.torsion_page)
+
     def show_design(self):
         if hasattr(self, "design_page"):
             self.stacked.setCurrentWidget(self.design_page)
@@ -356,9 +431,6 @@ class MenuWindow(QMainWindow):
         if hasattr(self, "diagram_page"):
             self.stacked.setCurrentWidget(self.diagram_page)
 
-    def show_cortante_msg(self):
-        QMessageBox.information(self, "En desarrollo", "Módulo en desarrollo")
-
     def show_contact(self):
         QMessageBox.information(
             self,
@@ -369,11 +441,20 @@ class MenuWindow(QMainWindow):
             ),
         )
 
+    def show_timings(self):
+        """Show and log the recent response times of the main actions."""
+        timings.dump()
+        box = QMessageBox(self)
+        box.setWindowTitle("Tiempos de respuesta")
+        box.setText(f"<pre>{html.escape(timings.report())}</pre>")
+        box.exec_()
+
     # ------------------------------------------------------------------
     def clear_data(self):
         self.mn_corr = None
         self.mp_corr = None
         self.design_ready = False
+        self._pending_moments = None
         QMessageBox.information(self, "Datos", "Datos limpiados")
 
     def show_menu(self):
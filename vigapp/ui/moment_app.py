@@ -10,6 +10,8 @@ from PyQt5.QtWidgets import (
     QRadioButton,
     QButtonGroup,
     QMessageBox,
+    QFileDialog,
+    QInputDialog,
 )
 from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QGuiApplication, QIcon
@@ -17,19 +19,31 @@ import os
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 import matplotlib.pyplot as plt
 import numpy as np
-from scipy.interpolate import CubicSpline
-import mplcursors
 
+from vigapp.graphics.hover import hover_for
 from vigapp.ui.design_window import DesignWindow
+from vigapp.models.envelope_import import read_envelopes
+from vigapp.models.moment_diagram import X_CTRL, diagram_for
+from vigapp.models.moments import correct_moments
+from vigapp.sistema.instrumentation import measure
+from vigapp.ui.workers import start_export
+
+
+def import_envelopes_job(path, progress):
+    """Background job reading the beam envelopes of the table at ``path``."""
+    env = read_envelopes(path, progress=progress)
+    progress(100, "Listo")
+    return env
 
 
 class MomentApp(QMainWindow):
     """Ventana principal para ingresar momentos y graficar diagramas."""
 
     def __init__(self, parent=None, *, show_window=True, next_callback=None,
-                 save_callback=None, menu_callback=None):
+                 save_callback=None, menu_callback=None, calc_callback=None):
         super().__init__(parent)
         self.next_callback = next_callback
+        self.calc_callback = calc_callback
         self.save_callback = save_callback
         self.menu_callback = menu_callback
         self.setWindowTitle("Parte 1 – Momentos y Diagramas (NTP E.060)")
@@ -82,12 +96,15 @@ class MomentApp(QMainWindow):
         btn_capture.setIcon(QIcon(icon_path))
         btn_capture.setFixedWidth(30)
         btn_menu = QPushButton("Menú")
+        self.btn_import = btn_import = QPushButton("Importar")
 
         btn_calc.clicked.connect(self.on_calculate)
         btn_next.clicked.connect(self.on_next)
         btn_capture.clicked.connect(self._capture_diagram)
         btn_menu.clicked.connect(self.on_menu)
+        btn_import.clicked.connect(self.on_import)
 
+        layout.addWidget(btn_import, 3, 0, 1, 2)
         layout.addWidget(btn_calc, 3, 2)
         layout.addWidget(btn_next, 3, 3)
         layout.addWidget(btn_capture, 3, 4)
@@ -115,77 +132,124 @@ class MomentApp(QMainWindow):
             QMessageBox.warning(self, "Error", "Ingrese valores numéricos válidos.")
             raise
 
+    def set_moments(self, mn, mp):
+        """Fill the moment inputs with the given values."""
+        for ed, val in zip(self.m_neg_edits, mn):
+            ed.setText(f"{abs(val):.2f}")
+        for ed, val in zip(self.m_pos_edits, mp):
+            ed.setText(f"{abs(val):.2f}")
+
+    def on_import(self):
+        """Load the moments of one beam from an analysis results table."""
+        path, _ = QFileDialog.getOpenFileName(
+            self,
+            "Importar fuerzas",
+            "",
+            "Tablas (*.csv *.txt);;Todos los archivos (*)",
+        )
+        if not path:
+            return
+        self.btn_import.setEnabled(False)
+        start_export(
+            self,
+            import_envelopes_job,
+            path,
+            "Importar fuerzas",
+            on_finished=self._on_envelopes,
+            on_done=lambda: self.btn_import.setEnabled(True),
+            error_text="No se pudo leer el archivo",
+        )
+
+    def _on_envelopes(self, env):
+        """Let the user pick a beam of ``env`` and load its moments."""
+        if not len(env):
+            QMessageBox.warning(self, "Importar", "El archivo no contiene vigas")
+            return
+        label = env.labels[0]
+        if len(env) > 1:
+            label, ok = QInputDialog.getItem(
+                self, "Importar", "Viga:", env.labels, 0, False
+            )
+            if not ok:
+                return
+        mn, mp, _ = env.for_beam(label)
+        self.set_moments(mn, mp)
+        self.on_calculate()
+
     def get_length(self):
         return 1.0
 
+    @staticmethod
+    def _diagram(mn, mp):
+        """Return the cached diagram of the plotted ``-mn``/``-mp`` curves."""
+        return diagram_for(np.vstack([-np.asarray(mn), -np.asarray(mp)]))
+
     def plot_original(self):
         mn, mp = self.get_moments()
         L = self.get_length()
-        x_ctrl = np.array([0, 0.5, 1.0])
-        xs = np.linspace(0, L, 200)
-        csn = CubicSpline(x_ctrl, -mn)
-        csp = CubicSpline(x_ctrl, -mp)
+        diag = self._diagram(mn, mp)
+        xi, (yn, yp) = diag.sample(200)
+        xs = xi * L
 
         self.ax1.clear()
         self.ax2.clear()
         for ax in (self.ax1, self.ax2):
             ax.plot([0, L], [0, 0], 'k-', lw=6)
 
-        self.ax1.plot(xs, csn(xs), 'b-', lw=1.5, label='Neg original')
-        self.ax1.fill_between(xs, csn(xs), 0, color='b', alpha=0.25, hatch='//', edgecolor='b')
-        self.ax1.plot(xs, csp(xs), 'r-', lw=1.5, label='Pos original')
-        self.ax1.fill_between(xs, csp(xs), 0, color='r', alpha=0.25, hatch='\\', edgecolor='r')
-        self._draw_verticals(self.ax1, csn, csp, x_ctrl)
-        self._label_points(self.ax1, csn, csp, x_ctrl)
-        self._enable_hover(self.ax1, csn, csp)
+        self.ax1.plot(xs, yn, 'b-', lw=1.5, label='Neg original')
+        self.ax1.fill_between(xs, yn, 0, color='b', alpha=0.25, hatch='//', edgecolor='b')
+        self.ax1.plot(xs, yp, 'r-', lw=1.5, label='Pos original')
+        self.ax1.fill_between(xs, yp, 0, color='r', alpha=0.25, hatch='\\', edgecolor='r')
+        self._draw_verticals(self.ax1, diag, L)
+        self._label_points(self.ax1, diag, L)
+        self._enable_hover(self.ax1, diag, L)
         self._format(self.ax1)
         self.canvas.draw()
 
     def plot_corrected(self, mn_corr, mp_corr, mn_orig=None, mp_orig=None):
         L = self.get_length()
-        x_ctrl = np.array([0, 0.5, 1.0])
-        xs = np.linspace(0, L, 200)
-        csn = CubicSpline(x_ctrl, -mn_corr)
-        csp = CubicSpline(x_ctrl, -mp_corr)
+        diag = self._diagram(mn_corr, mp_corr)
+        xi, (yn, yp) = diag.sample(200)
+        xs = xi * L
 
         self.ax2.clear()
-        self.ax2.plot(xs, csn(xs), 'b-', lw=1.5, label='Neg corregido')
-        self.ax2.fill_between(xs, csn(xs), 0, color='b', alpha=0.25, hatch='//', edgecolor='b')
-        self.ax2.plot(xs, csp(xs), 'r-', lw=1.5, label='Pos corregido')
-        self.ax2.fill_between(xs, csp(xs), 0, color='r', alpha=0.25, hatch='\\', edgecolor='r')
+        self.ax2.plot(xs, yn, 'b-', lw=1.5, label='Neg corregido')
+        self.ax2.fill_between(xs, yn, 0, color='b', alpha=0.25, hatch='//', edgecolor='b')
+        self.ax2.plot(xs, yp, 'r-', lw=1.5, label='Pos corregido')
+        self.ax2.fill_between(xs, yp, 0, color='r', alpha=0.25, hatch='\\', edgecolor='r')
 
         if mn_orig is not None and mp_orig is not None:
-            csn_o = CubicSpline(x_ctrl, -mn_orig)
-            csp_o = CubicSpline(x_ctrl, -mp_orig)
-            self.ax2.plot(xs, csn_o(xs), 'b--', alpha=0.5)
-            self.ax2.plot(xs, csp_o(xs), 'r--', alpha=0.5)
-            self._draw_verticals(self.ax2, csn_o, csp_o, x_ctrl, dashed=True)
-
-        self._draw_verticals(self.ax2, csn, csp, x_ctrl)
-        self._label_points(self.ax2, csn, csp, x_ctrl)
-        self._enable_hover(self.ax2, csn, csp)
+            diag_o = self._diagram(mn_orig, mp_orig)
+            _, (yn_o, yp_o) = diag_o.sample(200)
+            self.ax2.plot(xs, yn_o, 'b--', alpha=0.5)
+            self.ax2.plot(xs, yp_o, 'r--', alpha=0.5)
+            self._draw_verticals(self.ax2, diag_o, L, dashed=True)
+
+        self._draw_verticals(self.ax2, diag, L)
+        self._label_points(self.ax2, diag, L)
+        self._enable_hover(self.ax2, diag, L)
         self._format(self.ax2)
         self.canvas.draw()
 
-    def _draw_verticals(self, ax, csn, csp, x_ctrl, dashed=False):
+    def _draw_verticals(self, ax, diag, L, dashed=False):
         style = ':' if dashed else '-'
-        for x in x_ctrl:
-            ax.plot([x, x], [csn(x), 0], 'k' + style, lw=1)
-            ax.plot([x, x], [csp(x), 0], 'k' + style, lw=1)
+        # The diagram passes through the control values exactly
+        for x, yn, yp in zip(X_CTRL * L, *diag.values):
+            ax.plot([x, x], [yn, 0], 'k' + style, lw=1)
+            ax.plot([x, x], [yp, 0], 'k' + style, lw=1)
 
-    def _label_points(self, ax, csn, csp, x_ctrl):
-        for x in x_ctrl:
-            ax.annotate(f"{-csn(x):.2f}", (x, csn(x)), xytext=(5, 5), textcoords='offset points')
-            ax.annotate(f"{abs(csp(x)):.2f}", (x, csp(x)), xytext=(5, -15), textcoords='offset points')
+    def _label_points(self, ax, diag, L):
+        for x, yn, yp in zip(X_CTRL * L, *diag.values):
+            ax.annotate(f"{-yn:.2f}", (x, yn), xytext=(5, 5), textcoords='offset points')
+            ax.annotate(f"{abs(yp):.2f}", (x, yp), xytext=(5, -15), textcoords='offset points')
 
-    def _enable_hover(self, ax, csn, csp):
-        cursor = mplcursors.cursor(ax.lines[:2], hover=True)
+    def _enable_hover(self, ax, diag, L=1.0):
+        xi, ys = diag.sample(200)
+        hover_for(ax).set_curves(xi * L, ys, self._hover_text)
 
-        @cursor.connect("add")
-        def _(sel):
-            y = sel.target[1]
-            val = y if y < 0 else -y
-            sel.annotation.set(text=f"{val:.2f}")
+    @staticmethod
+    def _hover_text(curve, y):
+        return f"{-y:.2f}" if curve == 0 else f"{abs(y):.2f}"
 
     def _format(self, ax):
         ax.set_xlabel('Longitud (m)')
@@ -195,32 +259,8 @@ class MomentApp(QMainWindow):
 
     @staticmethod
     def correct_moments(mn, mp, sys_t):
-        """Return moments corrected by face and global rules.
-
-        The positive moments at the beam ends (M1+ and M3+) must be at
-        least a fraction of the negative moment at that face. Dual 1
-        uses 1/3 while Dual 2 uses 1/2. Additionally, all moments must
-        not fall below one quarter of the largest face moment.
-        """
-        mn = np.asarray(mn, dtype=float)
-        mp = np.asarray(mp, dtype=float)
-
-        f = 1 / 3 if sys_t.lower() == "dual1" else 1 / 2
-
-        min_face_pos = np.zeros(3)
-        min_face_pos[[0, 2]] = f * np.abs(mn[[0, 2]])
-        m_max = max(np.max(np.abs(mn)), np.max(np.abs(mp)))
-        min_global = m_max / 4.0
-
-        mp_corr = np.maximum.reduce([
-            np.abs(mp),
-            min_face_pos,
-            np.full(3, min_global),
-        ])
-
-        mn_corr = -np.maximum(np.abs(mn), min_global)
-
-        return mn_corr, mp_corr
+        """Return moments corrected by face and global rules."""
+        return correct_moments(mn, mp, sys_t)
 
     def on_calculate(self):
         try:
@@ -231,11 +271,14 @@ class MomentApp(QMainWindow):
             logging.exception("Unexpected error while obtaining moments")
             return
         sys_t = 'dual2' if self.rb_dual2.isChecked() else 'dual1'
-        mn_c, mp_c = MomentApp.correct_moments(mn, mp, sys_t)
-        self.plot_original()
-        self.plot_corrected(mn_c, mp_c, mn_orig=mn, mp_orig=mp)
+        with measure("MomentApp.on_calculate"):
+            mn_c, mp_c = MomentApp.correct_moments(mn, mp, sys_t)
+            self.plot_original()
+            self.plot_corrected(mn_c, mp_c, mn_orig=mn, mp_orig=mp)
         self.mn_corr = mn_c
         self.mp_corr = mp_c
+        if self.calc_callback:
+            self.calc_callback(mn_c, mp_c)
 
     def on_next(self):
         if self.mn_corr is None or self.mp_corr is None:
@@ -10,14 +10,87 @@ from PyQt5.QtWidgets import (
     QLineEdit,
     QPushButton,
     QComboBox,
+    QHBoxLayout,
+    QMessageBox,
 )
 from PyQt5.QtCore import Qt
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.figure import Figure
 import matplotlib.pyplot as plt
+from dataclasses import dataclass, replace
+from typing import Any, Tuple
 
 from ..graphics.shear_scheme import draw_shear_scheme
 from .design.plots import draw_section
+from .workers import start_export
+from ..models.capacity_shear import capacity_shear, end_bars
 from ..models.constants import DIAM_CM
+from ..sistema.artifacts import artifacts
+from ..sistema.instrumentation import measure
+
+
+@dataclass(frozen=True)
+class ShearExportData:
+    """Inputs and result of a shear design captured for a background export."""
+
+    Vu: float
+    Ln: float
+    d: float
+    h: float
+    beam_type: str
+    fields: Tuple[Tuple[str, str], ...]
+    result: Any
+
+
+def _save_scheme(snap: ShearExportData, path: str) -> str:
+    """Draw the shear scheme on a private Agg figure and save it."""
+    fig = Figure(figsize=(5, 3), constrained_layout=True)
+    ax = fig.add_subplot(111)
+    draw_shear_scheme(ax, snap.Vu, snap.Ln, snap.d / 100.0, snap.h / 100.0, snap.beam_type)
+    fig.savefig(path, dpi=150)
+    return path
+
+
+def shear_scheme_png(snap: ShearExportData) -> str:
+    """Return the stored shear scheme of ``snap``, drawn once per input."""
+    params = (snap.Vu, snap.Ln, snap.d, snap.h, snap.beam_type)
+    return artifacts.get("shear_scheme", params, lambda path: _save_scheme(snap, path))
+
+
+def export_shear_pdf(snap: ShearExportData, progress) -> str:
+    """Background job writing ``reporte_cortante.pdf``."""
+    from ..pdf_engine.shear_report import generate_shear_pdf
+
+    progress(10, "Dibujando diagrama")
+    # Stored images are written atomically, so concurrent exports are safe
+    fig_path = shear_scheme_png(snap)
+    progress(50, "Generando PDF")
+    out = generate_shear_pdf(dict(snap.fields), snap.result, fig_path, "reporte_cortante.pdf")
+    progress(100, "Listo")
+    return out
+
+
+def export_shear_html(snap: ShearExportData, progress) -> str:
+    """Background job writing the HTML shear report."""
+    from reporte_cortante_html import generar_reporte_cortante_html
+
+    progress(10, "Dibujando diagrama")
+    fig_path = shear_scheme_png(snap)
+    progress(50, "Generando HTML")
+    out = generar_reporte_cortante_html(dict(snap.fields), snap.result, fig_path)
+    progress(100, "Listo")
+    return out
+
+
+def export_shear_dxf_job(snap: ShearExportData, progress) -> str:
+    """Background job writing ``esquema_cortante.dxf``."""
+    from ..graphics.shear_dxf import export_shear_dxf
+
+    progress(10, "Generando DXF")
+    path = "esquema_cortante.dxf"
+    export_shear_dxf(path, snap.Vu, snap.Ln, snap.d / 100.0, snap.h / 100.0, snap.beam_type)
+    progress(100, "Listo")
+    return path
 
 
 class ShearDesignWindow(QMainWindow):
@@ -125,6 +198,20 @@ class ShearDesignWindow(QMainWindow):
         layout.addWidget(QLabel("Tipo"), 10, 0)
         layout.addWidget(self.cb_type, 10, 1)
 
+        self.ed_wu = QLineEdit("0.0")
+        self.ed_wu.setAlignment(Qt.AlignRight)
+        self.ed_wu.setFixedWidth(70)
+        self.btn_vu_cap = QPushButton("Vu capacidad")
+        self.btn_vu_cap.setToolTip(
+            "Vu = (Mpr1 + Mpr2)/Ln + wu·Ln/2 con el acero colocado y 1.25 fy"
+        )
+        self.btn_vu_cap.setEnabled(self.design_win is not None)
+        wu_layout = QHBoxLayout()
+        wu_layout.addWidget(self.ed_wu)
+        wu_layout.addWidget(self.btn_vu_cap)
+        layout.addWidget(QLabel("wu (T/m)"), 11, 0)
+        layout.addLayout(wu_layout, 11, 1)
+
         btn_menu = QPushButton("Men\u00fa")
         btn_back = QPushButton("Atr\u00e1s")
         self.btn_calc = QPushButton("Calcular dise\u00f1o por corte")
@@ -135,24 +222,24 @@ class ShearDesignWindow(QMainWindow):
         self.btn_html.setEnabled(False)
         self.btn_dxf.setEnabled(False)
 
-        layout.addWidget(btn_menu, 11, 0)
-        layout.addWidget(btn_back, 11, 1)
-        layout.addWidget(self.btn_calc, 12, 0, 1, 2)
-        layout.addWidget(self.btn_pdf, 13, 0, 1, 2)
-        layout.addWidget(self.btn_html, 14, 0, 1, 2)
-        layout.addWidget(self.btn_dxf, 15, 0, 1, 2)
+        layout.addWidget(btn_menu, 12, 0)
+        layout.addWidget(btn_back, 12, 1)
+        layout.addWidget(self.btn_calc, 13, 0, 1, 2)
+        layout.addWidget(self.btn_pdf, 14, 0, 1, 2)
+        layout.addWidget(self.btn_html, 15, 0, 1, 2)
+        layout.addWidget(self.btn_dxf, 16, 0, 1, 2)
 
         self.fig, self.ax = plt.subplots(figsize=(5, 3), constrained_layout=True)
         self.canvas = FigureCanvas(self.fig)
-        layout.addWidget(self.canvas, 15, 0, 1, 2)
+        layout.addWidget(self.canvas, 16, 0, 1, 2)
 
         # Section figure displayed on the right side
         self.fig_sec, self.ax_sec = plt.subplots(figsize=(3, 3), constrained_layout=True)
         self.canvas_sec = FigureCanvas(self.fig_sec)
-        layout.addWidget(self.canvas_sec, 0, 2, 15, 1)
+        layout.addWidget(self.canvas_sec, 0, 2, 16, 1)
         self.lbl_props = QLabel("")
         self.lbl_props.setAlignment(Qt.AlignTop | Qt.AlignHCenter)
-        layout.addWidget(self.lbl_props, 15, 2)
+        layout.addWidget(self.lbl_props, 16, 2)
 
         self.ed_vu.editingFinished.connect(self.draw_diagram)
         self.ed_ln.editingFinished.connect(self.draw_diagram)
@@ -164,6 +251,7 @@ class ShearDesignWindow(QMainWindow):
         btn_back.clicked.connect(self.on_back)
         self.cb_type.currentIndexChanged.connect(self.draw_diagram)
         self.btn_calc.clicked.connect(self.calculate)
+        self.btn_vu_cap.clicked.connect(self.use_capacity_shear)
         self.btn_pdf.clicked.connect(self.export_pdf)
         self.btn_html.clicked.connect(self.export_html)
         self.btn_dxf.clicked.connect(self.export_dxf)
@@ -184,9 +272,10 @@ class ShearDesignWindow(QMainWindow):
         beam_type = "volado" if self.cb_type.currentText().lower() == "volado" else "apoyada"
 
         h = float(self.ed_h.text()) / 100.0
-        draw_shear_scheme(self.ax, Vu, L, d, h, beam_type)
-        self.canvas.draw()
-        self.update_section()
+        with measure("ShearDesignWindow.draw_diagram"):
+            draw_shear_scheme(self.ax, Vu, L, d, h, beam_type)
+            self.canvas.draw()
+            self.update_section()
 
     # ------------------------------------------------------------------
     def calculate(self):
@@ -204,18 +293,19 @@ class ShearDesignWindow(QMainWindow):
 
         from ..models.shear_design import shear_design
 
-        self.result = shear_design(
-            Vu=Vu,
-            Ln=Ln,
-            d=d,
-            b=b,
-            h=h,
-            fc=fc,
-            fy=fy,
-            stirrup_diam=self.cb_estribo.currentText(),
-            phi_long=DIAM_CM.get(self.cb_varilla.currentText(), 0),
-            beam_type=self.cb_type.currentText().lower(),
-        )
+        with measure("ShearDesignWindow.calculate"):
+            self.result = shear_design(
+                Vu=Vu,
+                Ln=Ln,
+                d=d,
+                b=b,
+                h=h,
+                fc=fc,
+                fy=fy,
+                stirrup_diam=self.cb_estribo.currentText(),
+                phi_long=DIAM_CM.get(self.cb_varilla.currentText(), 0),
+                beam_type=self.cb_type.currentText().lower(),
+            )
 
         self.draw_diagram()
         self.btn_pdf.setEnabled(True)
@@ -223,54 +313,93 @@ class ShearDesignWindow(QMainWindow):
         self.btn_dxf.setEnabled(True)
 
     # ------------------------------------------------------------------
-    def export_pdf(self):
-        from ..pdf_engine.shear_report import generate_shear_pdf
-        if not hasattr(self, "result"):
+    def use_capacity_shear(self):
+        """Set Vu from the probable moments of the bars placed in the design."""
+        if self.design_win is None:
+            return
+        try:
+            b = float(self.ed_b.text())
+            h = float(self.ed_h.text())
+            fc = float(self.ed_fc.text())
+            fy = float(self.ed_fy.text())
+            Ln = float(self.ed_ln.text())
+            wu = float(self.ed_wu.text())
+        except ValueError:
             return
-        fig_path = "shear_plot.png"
-        self.fig.savefig(fig_path, dpi=150)
-        data = {
-            "Vu": self.ed_vu.text(),
-            "Ln": self.ed_ln.text(),
-            "d": self.ed_d.text(),
-            "b": self.ed_b.text(),
-            "h": self.ed_h.text(),
-            "f'c": self.ed_fc.text(),
-            "fy": self.ed_fy.text(),
-        }
-        generate_shear_pdf(data, self.result, fig_path, "reporte_cortante.pdf")
+        de = DIAM_CM.get(self.cb_estribo.currentText(), 0)
+        rows = self.design_win.placed_bars()
+        depth, area = end_bars(rows, h, self.r_cover, de)
+        try:
+            cap = capacity_shear(b, h, fc, fy, depth, area, Ln, wu)
+        except ValueError as exc:
+            QMessageBox.warning(self, "Vu capacidad", str(exc))
+            return
+        self.capacity = cap
+        self.ed_vu.setText(f"{cap.vu:.2f}")
+        self.draw_diagram()
+        m1n, m3n, m1p, m3p = cap.mpr
+        self.statusBar().showMessage(
+            f"Mpr1- {m1n:.2f}  Mpr3- {m3n:.2f}  Mpr1+ {m1p:.2f}  Mpr3+ {m3p:.2f} T·m"
+            f"  Vg {cap.vg:.2f} T"
+        )
 
     # ------------------------------------------------------------------
-    def export_html(self):
-        from ..reporte_cortante_html import generar_reporte_cortante_html
+    def _export_snapshot(self):
+        """Return an immutable copy of the data needed by the exports."""
         if not hasattr(self, "result"):
+            return None
+        try:
+            vu = float(self.ed_vu.text())
+            ln = float(self.ed_ln.text())
+            d = float(self.ed_d.text())
+            h = float(self.ed_h.text())
+        except ValueError:
+            return None
+        fields = (
+            ("Vu", self.ed_vu),
+            ("Ln", self.ed_ln),
+            ("d", self.ed_d),
+            ("b", self.ed_b),
+            ("h", self.ed_h),
+            ("f'c", self.ed_fc),
+            ("fy", self.ed_fy),
+        )
+        return ShearExportData(
+            Vu=vu,
+            Ln=ln,
+            d=d,
+            h=h,
+            beam_type="volado" if self.cb_type.currentText().lower() == "volado" else "apoyada",
+            fields=tuple((k, ed.text()) for k, ed in fields),
+            result=replace(self.result),
+        )
+
+    def _start_export(self, job, title, button):
+        snap = self._export_snapshot()
+        if snap is None:
             return
-        fig_path = "shear_plot.png"
-        self.fig.savefig(fig_path, dpi=150)
-        data = {
-            "Vu": self.ed_vu.text(),
-            "Ln": self.ed_ln.text(),
-            "d": self.ed_d.text(),
-            "b": self.ed_b.text(),
-            "h": self.ed_h.text(),
-            "f'c": self.ed_fc.text(),
-            "fy": self.ed_fy.text(),
-        }
-        generar_reporte_cortante_html(data, self.result, fig_path)
+        button.setEnabled(False)
+        start_export(
+            self,
+            job,
+            snap,
+            title,
+            on_finished=lambda path: self.statusBar().showMessage(
+                f"Archivo generado: {path}", 5000
+            ),
+            on_done=lambda: button.setEnabled(True),
+        )
+
+    def export_pdf(self):
+        self._start_export(export_shear_pdf, "Exportar reporte PDF", self.btn_pdf)
+
+    # ------------------------------------------------------------------
+    def export_html(self):
+        self._start_export(export_shear_html, "Exportar reporte HTML", self.btn_html)
 
     # ------------------------------------------------------------------
     def export_dxf(self):
-        from ..graphics.shear_dxf import export_shear_dxf
-        if not hasattr(self, "result"):
-            return
-        export_shear_dxf(
-            "esquema_cortante.dxf",
-            float(self.ed_vu.text()),
-            float(self.ed_ln.text()),
-            float(self.ed_d.text()) / 100.0,
-            float(self.ed_h.text()) / 100.0,
-            "volado" if self.cb_type.currentText().lower() == "volado" else "apoyada",
-        )
+        self._start_export(export_shear_dxf_job, "Exportar archivo DXF", self.btn_dxf)
 
     # ------------------------------------------------------------------
     def on_menu(self):
@@ -0,0 +1,205 @@
+"""Window exploring section checks over a grid of b, h, f'c and bars."""
+
+import time
+
+import numpy as np
+from PyQt5.QtWidgets import (
+    QComboBox,
+    QGridLayout,
+    QLabel,
+    QLineEdit,
+    QMainWindow,
+    QMessageBox,
+    QPushButton,
+    QVBoxLayout,
+    QWidget,
+)
+from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.figure import Figure
+
+from ..models.constants import LONG_BAR_KEYS
+from ..models.sweep import sweep_sections
+from ..sistema.instrumentation import measure
+
+# Quantities that can be mapped: (label, result field, colormap)
+FIELDS = (
+    ("As- requerido (cm²)", "as_neg", "viridis"),
+    ("As+ requerido (cm²)", "as_pos", "viridis"),
+    ("N° barras (máx.)", "n_bars", "viridis"),
+    ("Base requerida (cm)", "base_req", "viridis"),
+    ("s confinamiento (cm)", "s_sc", "viridis_r"),
+)
+
+DEFAULT_FC = "175, 210, 280, 350, 420"
+
+
+def _grid(lo: str, hi: str, step: str) -> np.ndarray:
+    """Return the values from ``lo`` to ``hi`` (inclusive) every ``step``."""
+    lo, hi, step = float(lo), float(hi), float(step)
+    if step <= 0 or hi < lo:
+        raise ValueError("Rango no válido")
+    return np.arange(lo, hi + 0.5 * step, step)
+
+
+class SweepWindow(QMainWindow):
+    """Heatmap of one check over ``b × h`` with the feasible region marked."""
+
+    def __init__(
+        self,
+        mn,
+        mp,
+        parent=None,
+        *,
+        b=30.0,
+        h=50.0,
+        r=4.0,
+        fc=210.0,
+        fy=4200.0,
+        phi=0.9,
+        stirrup='3/8"',
+        bar='5/8"',
+        apply_callback=None,
+    ):
+        super().__init__(parent)
+        self.setWindowTitle("Barrido de dimensiones")
+        self.mn = np.asarray(mn, dtype=float)
+        self.mp = np.asarray(mp, dtype=float)
+        self.params = dict(r=r, fy=fy, phi=phi, stirrup=stirrup)
+        self.current = (b, h)
+        self.apply_callback = apply_callback
+        self.result = None
+        self._build_ui(fc, bar)
+        self.resize(800, 700)
+        self.run_sweep()
+
+    def _build_ui(self, fc, bar):
+        central = QWidget()
+        self.setCentralWidget(central)
+        layout = QVBoxLayout(central)
+        form = QGridLayout()
+        layout.addLayout(form)
+
+        self.edits = {}
+        rows = (
+            ("b (cm)", ("15", "65", "0.5")),
+            ("h (cm)", ("30", "100", "0.7")),
+        )
+        for row, (name, vals) in enumerate(rows):
+            form.addWidget(QLabel(name), row, 0)
+            for col, (tag, val) in enumerate(zip(("mín", "máx", "paso"), vals)):
+                form.addWidget(QLabel(tag), row, 1 + 2 * col)
+                ed = QLineEdit(val)
+                ed.setFixedWidth(60)
+                form.addWidget(ed, row, 2 + 2 * col)
+                self.edits[(name, tag)] = ed
+        form.addWidget(QLabel("f'c (kg/cm²)"), 2, 0)
+        self.edit_fc = QLineEdit(DEFAULT_FC)
+        form.addWidget(self.edit_fc, 2, 1, 1, 4)
+        form.addWidget(QLabel("Vu (T)"), 2, 5)
+        self.edit_vu = QLineEdit("0")
+        self.edit_vu.setFixedWidth(60)
+        form.addWidget(self.edit_vu, 2, 6)
+        self.btn_run = QPushButton("Calcular")
+        self.btn_run.clicked.connect(self.run_sweep)
+        form.addWidget(self.btn_run, 2, 7)
+
+        self.cb_field = QComboBox()
+        self.cb_field.addItems([f[0] for f in FIELDS])
+        self.cb_fc = QComboBox()
+        self.cb_bar = QComboBox()
+        self.cb_bar.addItems(LONG_BAR_KEYS)
+        self.cb_bar.setCurrentText(bar)
+        self._fc_default = f"{fc:g}"
+        for col, (name, cb) in enumerate(
+            (("Mostrar", self.cb_field), ("f'c", self.cb_fc), ("ϕ varilla", self.cb_bar))
+        ):
+            form.addWidget(QLabel(name), 3, 2 * col)
+            form.addWidget(cb, 3, 2 * col + 1)
+            cb.currentIndexChanged.connect(self.draw_map)
+
+        self.fig = Figure(figsize=(6, 5), constrained_layout=True)
+        self.ax = self.fig.add_subplot(111)
+        self.canvas = FigureCanvas(self.fig)
+        self.canvas.mpl_connect("button_press_event", self._on_click)
+        layout.addWidget(self.canvas)
+        self.info = QLabel("")
+        layout.addWidget(self.info)
+        self._cbar = None
+
+    def run_sweep(self):
+        """Evaluate the whole grid and redraw the map."""
+        try:
+            b = _grid(*(self.edits[("b (cm)", t)].text() for t in ("mín", "máx", "paso")))
+            h = _grid(*(self.edits[("h (cm)", t)].text() for t in ("mín", "máx", "paso")))
+            fc = [float(v) for v in self.edit_fc.text().replace(";", ",").split(",") if v.strip()]
+            vu = float(self.edit_vu.text())
+            if not fc:
+                raise ValueError("Ingrese al menos un f'c")
+        except ValueError as exc:
+            QMessageBox.warning(self, "Barrido", f"Datos no válidos: {exc}")
+            return
+        start = time.perf_counter()
+        with measure("SweepWindow.run_sweep"):
+            self.result = sweep_sections(
+                self.mn, self.mp, b, h, fc, LONG_BAR_KEYS, Vu=vu, **self.params
+            )
+        self._elapsed = time.perf_counter() - start
+
+        selected = self.cb_fc.currentText() or self._fc_default
+        self.cb_fc.blockSignals(True)
+        self.cb_fc.clear()
+        self.cb_fc.addItems([f"{v:g}" for v in fc])
+        idx = self.cb_fc.findText(selected)
+        self.cb_fc.setCurrentIndex(max(idx, 0))
+        self.cb_fc.blockSignals(False)
+        self.draw_map()
+
+    def draw_map(self):
+        """Plot the selected quantity for the selected f'c and bar."""
+        res = self.result
+        if res is None:
+            return
+        label, field, cmap = FIELDS[self.cb_field.currentIndex()]
+        i_fc = max(self.cb_fc.currentIndex(), 0)
+        i_bar = self.cb_bar.currentIndex()
+        if field == "n_bars":
+            z = np.maximum(res.plane("n_neg", i_fc, i_bar), res.plane("n_pos", i_fc, i_bar))
+        else:
+            z = res.plane(field, i_fc, i_bar)
+        ok = res.plane("ok", i_fc, i_bar)
+        z = np.where(np.isfinite(z), z, np.nan)
+
+        ax = self.ax
+        if self._cbar is not None:
+            self._cbar.remove()
+        ax.clear()
+        mesh = ax.pcolormesh(res.b, res.h, z.T, cmap=cmap, shading="nearest")
+        self._cbar = self.fig.colorbar(mesh, ax=ax, label=label)
+        # Hatch the combinations failing any check and outline the feasible region
+        ax.contourf(res.b, res.h, (~ok).T.astype(float), levels=[0.5, 1.5],
+                    colors="none", hatches=["//"])
+        if ok.any() and not ok.all():
+            ax.contour(res.b, res.h, ok.T.astype(float), levels=[0.5], colors="k", linewidths=1.5)
+        ax.plot(*self.current, "r+", ms=12, mew=2)
+        ax.set_xlabel("b (cm)")
+        ax.set_ylabel("h (cm)")
+        ax.set_title(f"f'c = {self.cb_fc.currentText()}  ϕ {res.bars[i_bar]}")
+        self.canvas.draw_idle()
+
+        n = res.ok.size
+        self.info.setText(
+            f"{n} combinaciones en {self._elapsed * 1000:.0f} ms — "
+            f"factibles en el plano: {100.0 * ok.mean():.0f} %. "
+            "Clic en el mapa para aplicar b y h."
+        )
+
+    def _on_click(self, event):
+        if event.inaxes is not self.ax or event.xdata is None or self.result is None:
+            return
+        res = self.result
+        b = float(res.b[np.abs(res.b - event.xdata).argmin()])
+        h = float(res.h[np.abs(res.h - event.ydata).argmin()])
+        self.current = (b, h)
+        self.draw_map()
+        if self.apply_callback:
+            self.apply_callback(b, h)
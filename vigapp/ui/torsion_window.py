@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+"""Window for combined shear and torsion design."""
+
+from PyQt5.QtWidgets import (
+    QMainWindow,
+    QWidget,
+    QGridLayout,
+    QLabel,
+    QLineEdit,
+    QPushButton,
+    QComboBox,
+    QCheckBox,
+    QMessageBox,
+)
+from PyQt5.QtCore import Qt
+
+from ..models.constants import DIAM_CM
+from ..models.shear_design import BAR_AREAS
+from ..models.torsion_design import torsion_design
+from ..sistema.instrumentation import measure
+
+
+def _spacing(value: float) -> str:
+    return "-" if value == float("inf") else f"{value:.1f} cm"
+
+
+class TorsionDesignWindow(QMainWindow):
+    """UI to check torsion and size closed stirrups with the shear design."""
+
+    def __init__(self, design_win=None, parent=None, *, show_window=True,
+                 menu_callback=None, back_callback=None):
+        super().__init__(parent)
+        self.design_win = design_win
+        self.menu_callback = menu_callback
+        self.back_callback = back_callback
+        self.setWindowTitle("Diseño por Torsión")
+        self._build_ui()
+        self.resize(700, 500)
+        if show_window:
+            self.show()
+
+    # ------------------------------------------------------------------
+    def _build_ui(self):
+        central = QWidget()
+        self.setCentralWidget(central)
+        layout = QGridLayout(central)
+        layout.setContentsMargins(10, 10, 10, 10)
+        layout.setHorizontalSpacing(10)
+
+        defaults = {"b": "30", "h": "50", "r": "4", "fc": "210", "fy": "4200"}
+        stirrup_def = '3/8"'
+        bar_def = '5/8"'
+        if self.design_win is not None:
+            edits = self.design_win.edits
+            defaults.update(
+                b=edits["b (cm)"].text(),
+                h=edits["h (cm)"].text(),
+                r=edits["r (cm)"].text(),
+                fc=edits["f'c (kg/cm²)"].text(),
+                fy=edits["fy (kg/cm²)"].text(),
+            )
+            stirrup_def = self.design_win.cb_estribo.currentText()
+            bar_def = self.design_win.cb_varilla.currentText()
+
+        def line(text):
+            ed = QLineEdit(text)
+            ed.setAlignment(Qt.AlignRight)
+            ed.setFixedWidth(70)
+            return ed
+
+        self.ed_tu = line("0.0")
+        self.ed_vu = line("0.0")
+        self.ed_ln = line("5.0")
+        self.ed_b = line(defaults["b"])
+        self.ed_h = line(defaults["h"])
+        self.ed_r = line(defaults["r"])
+        self.ed_d = line("")
+        self.ed_fc = line(defaults["fc"])
+        self.ed_fy = line(defaults["fy"])
+
+        self.cb_varilla = QComboBox()
+        self.cb_varilla.addItems(['1/2"', '5/8"', '3/4"', '1"'])
+        self.cb_varilla.setCurrentText(bar_def)
+        self.cb_estribo = QComboBox()
+        self.cb_estribo.addItems(list(BAR_AREAS))
+        self.cb_estribo.setCurrentText(stirrup_def)
+        self.chk_compat = QCheckBox("Torsión de compatibilidad")
+        self.chk_compat.setToolTip("Limita Tu al momento de fisuración φTcr")
+
+        rows = [
+            ("Tu (T·m)", self.ed_tu),
+            ("Vu (T)", self.ed_vu),
+            ("Ln (m)", self.ed_ln),
+            ("b (cm)", self.ed_b),
+            ("h (cm)", self.ed_h),
+            ("r (cm)", self.ed_r),
+            ("d (cm)", self.ed_d),
+            ("f'c (kg/cm²)", self.ed_fc),
+            ("fy (kg/cm²)", self.ed_fy),
+            ("φ varilla", self.cb_varilla),
+            ("φ estribo", self.cb_estribo),
+        ]
+        for i, (label, widget) in enumerate(rows):
+            layout.addWidget(QLabel(label), i, 0)
+            layout.addWidget(widget, i, 1)
+        n = len(rows)
+        layout.addWidget(self.chk_compat, n, 0, 1, 2)
+
+        btn_menu = QPushButton("Menú")
+        btn_back = QPushButton("Atrás")
+        self.btn_calc = QPushButton("Calcular diseño por torsión")
+        layout.addWidget(btn_menu, n + 1, 0)
+        layout.addWidget(btn_back, n + 1, 1)
+        layout.addWidget(self.btn_calc, n + 2, 0, 1, 2)
+
+        self.lbl_result = QLabel("")
+        self.lbl_result.setAlignment(Qt.AlignTop | Qt.AlignLeft)
+        self.lbl_result.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        layout.addWidget(self.lbl_result, 0, 2, n + 3, 1)
+        layout.setColumnStretch(2, 1)
+
+        self.ed_h.editingFinished.connect(self.update_depth)
+        self.ed_r.editingFinished.connect(self.update_depth)
+        self.cb_varilla.currentIndexChanged.connect(self.update_depth)
+        self.cb_estribo.currentIndexChanged.connect(self.update_depth)
+        btn_menu.clicked.connect(self.on_menu)
+        btn_back.clicked.connect(self.on_back)
+        self.btn_calc.clicked.connect(self.calculate)
+
+        self.update_depth()
+
+    # ------------------------------------------------------------------
+    def update_depth(self):
+        """Set ``d`` for one layer of longitudinal bars."""
+        try:
+            h = float(self.ed_h.text())
+            r = float(self.ed_r.text())
+        except ValueError:
+            return
+        de = DIAM_CM.get(self.cb_estribo.currentText(), 0)
+        db = DIAM_CM.get(self.cb_varilla.currentText(), 0)
+        self.ed_d.setText(f"{h - r - de - 0.5 * db:.2f}")
+
+    # ------------------------------------------------------------------
+    def calculate(self):
+        """Run the torsion design and show the results."""
+        try:
+            values = [
+                float(ed.text())
+                for ed in (self.ed_tu, self.ed_vu, self.ed_ln, self.ed_d,
+                           self.ed_b, self.ed_h, self.ed_fc, self.ed_r, self.ed_fy)
+            ]
+        except ValueError:
+            QMessageBox.warning(self, "Error", "Ingrese valores numéricos válidos.")
+            return
+        Tu, Vu, Ln, d, b, h, fc, r, fy = values
+
+        try:
+            with measure("TorsionDesignWindow.calculate"):
+                self.result = torsion_design(
+                    Tu, Vu, Ln, d, b, h, fc,
+                    r=r,
+                    fy=fy,
+                    stirrup_diam=self.cb_estribo.currentText(),
+                    phi_long=DIAM_CM.get(self.cb_varilla.currentText(), 0),
+                    compatibility=self.chk_compat.isChecked(),
+                )
+        except ValueError as exc:
+            QMessageBox.warning(self, "Torsión", str(exc))
+            return
+        self.lbl_result.setText(self.summary())
+
+    def summary(self) -> str:
+        """Return the result as plain text lines."""
+        res = self.result
+        lines = [
+            f"Acp = {res.Acp:.0f} cm²    pcp = {res.pcp:.0f} cm",
+            f"Aoh = {res.Aoh:.0f} cm²    ph = {res.ph:.1f} cm    Ao = {res.Ao:.0f} cm²",
+            f"φTth = {res.phi_Tth:.2f} T·m    φTcr = {res.phi_Tcr:.2f} T·m",
+            f"Tu diseño = {res.Tu:.2f} T·m",
+        ]
+        if not res.required:
+            lines.append("Tu < φTth: se desprecia la torsión")
+        lines += [
+            f"Sección: {'CUMPLE' if res.section_ok else 'NO CUMPLE (aumentar sección)'}",
+            f"Av/s = {res.Av_s:.4f}  At/s = {res.At_s:.4f}  (Av+2At)/s = {res.Avt_s:.4f} cm²/cm",
+            f"s torsión = {_spacing(res.s_torsion)}",
+            f"Estribo cerrado: SC {_spacing(res.S_sc)}  SR {_spacing(res.S_sr)}",
+            f"Al torsión = {res.Al:.2f} cm²",
+            f"Cumple: {'SI' if res.ok else 'NO'}",
+        ]
+        return "\n".join(lines)
+
+    # ------------------------------------------------------------------
+    def on_menu(self):
+        if self.menu_callback:
+            self.menu_callback()
+
+    def on_back(self):
+        if self.back_callback:
+            self.back_callback()
+        else:
+            self.close()
+            parent = self.parent()
+            if parent:
+                parent.show()
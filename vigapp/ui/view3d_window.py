@@ -11,17 +11,20 @@ from PyQt5.QtWidgets import (
     QLabel,
     QMessageBox,
     QFileDialog,
+    QShortcut,
+    QInputDialog,
 )
 import os
 
 from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QGuiApplication, QIcon
+from PyQt5.QtGui import QGuiApplication, QIcon, QKeySequence
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 import matplotlib.pyplot as plt
 from matplotlib import patches
 import numpy as np
 
 from ..models.constants import DIAM_CM
+from ..sistema.instrumentation import timed
 from ..graphics.utilities import (
     CLEARANCE,
     distribute_x,
@@ -102,12 +105,15 @@ class View3DWindow(QMainWindow):
         self.btn_capture.clicked.connect(self._capture_view)
         self.btn_exportar = QPushButton("Exportar CAD")
         self.btn_exportar.clicked.connect(self._on_exportar_cad)
+        self.btn_3d = QPushButton("Ver 3D")
+        self.btn_3d.clicked.connect(self.show_3d)
         self.btn_back = QPushButton("Atrás")
         self.btn_back.clicked.connect(self.on_back)
         self.btn_menu = QPushButton("Menú")
         self.btn_menu.clicked.connect(self.on_menu)
         btn_layout.addWidget(self.btn_capture)
         btn_layout.addWidget(self.btn_exportar)
+        btn_layout.addWidget(self.btn_3d)
         btn_layout.addWidget(self.btn_back)
         btn_layout.addWidget(self.btn_menu)
         layout.addLayout(btn_layout)
@@ -117,6 +123,16 @@ class View3DWindow(QMainWindow):
         self.canvas.mpl_connect("motion_notify_event", self._on_motion)
         self.canvas.mpl_connect("button_release_event", self._on_release)
 
+        if hasattr(self.design, "ordersRestored"):
+            self.design.ordersRestored.connect(self._on_orders_restored)
+            for keys, slot in (
+                (("Ctrl+Z",), self.design.undo),
+                (("Ctrl+Y", "Ctrl+Shift+Z"), self.design.redo),
+            ):
+                for key in keys:
+                    QShortcut(QKeySequence(key), self, activated=slot,
+                              context=Qt.WidgetWithChildrenShortcut)
+
         self.draw_views()
 
         if show_window:
@@ -129,6 +145,7 @@ class View3DWindow(QMainWindow):
         self.fig.suptitle(text.upper(), fontweight="bold")
         self.canvas.draw_idle()
 
+    @timed("View3DWindow.draw_views")
     def draw_views(self, *, reset_orders: bool = False):
         """Redraw the three section cuts.
 
@@ -139,6 +156,9 @@ class View3DWindow(QMainWindow):
             design inputs. This ensures that changes made in the design window
             are reflected when returning to this view.
         """
+        self.drawn_revision = getattr(self.design, "revision", 0)
+        if hasattr(self.design, "rebar_snapshot"):
+            self.drawn_rebar = self.design.rebar_snapshot()
         try:
             b = float(self.design.edits["b (cm)"].text())
             h = float(self.design.edits["h (cm)"].text())
@@ -220,6 +240,16 @@ class View3DWindow(QMainWindow):
             order.extend([dia_key] * qty)
         return order
 
+    def _record_orders(self):
+        if hasattr(self.design, "record_orders"):
+            self.design.record_orders(self.neg_orders, self.pos_orders)
+
+    def _on_orders_restored(self, neg_orders, pos_orders):
+        """Show bar orders restored by undo/redo; empty means input order."""
+        self.neg_orders = [list(o) for o in neg_orders]
+        self.pos_orders = [list(o) for o in pos_orders]
+        self.draw_views()
+
     def change_order(self, sign, section, new_order):
         """Set a new bar order for a given section and redraw."""
         if sign not in ("pos", "neg"):
@@ -232,6 +262,7 @@ class View3DWindow(QMainWindow):
         else:
             self.neg_orders = self.neg_orders or [self._collect_order(i) for i in range(3)]
             self.neg_orders[section] = list(new_order)
+        self._record_orders()
         self.draw_views()
 
     def swap_bars(self, sign, section, i, j):
@@ -247,6 +278,7 @@ class View3DWindow(QMainWindow):
         if not (0 <= i < len(lst) and 0 <= j < len(lst)):
             return
         lst[i], lst[j] = lst[j], lst[i]
+        self._record_orders()
         self.draw_views()
 
     def move_bar(self, sign, section, idx, new_idx):
@@ -266,6 +298,7 @@ class View3DWindow(QMainWindow):
             return
         val = lst.pop(idx)
         lst.insert(new_idx, val)
+        self._record_orders()
         self.draw_views()
 
 
@@ -433,6 +466,46 @@ class View3DWindow(QMainWindow):
         if self.menu_callback:
             self.menu_callback()
 
+    def rebar_model(self, L):
+        """Return the 3D reinforcement model for a clear span ``L`` (cm).
+
+        Stirrups use E.060 seismic spacings: ``h/4`` (max 15 cm) over
+        ``2h`` at each end and ``h/2`` elsewhere.
+        """
+        from ..graphics.rebar_mesh import beam_model, stirrup_positions
+
+        b = float(self.design.edits["b (cm)"].text())
+        h = float(self.design.edits["h (cm)"].text())
+        r = float(self.design.edits["r (cm)"].text())
+        key = self.design.cb_estribo.currentText()
+        stirrups = stirrup_positions(L, 2 * h, min(h / 4, 15.0), h / 2)
+        return beam_model(
+            b, h, L, r, key,
+            [self._collect_bars(i) for i in range(3)],
+            [self._collect_bars(i + 3) for i in range(3)],
+            stirrups,
+        )
+
+    def show_3d(self):
+        """Open the 3D reinforcement view."""
+        try:
+            from ..graphics.section3d_view import Section3DView
+        except Exception:  # pyqtgraph.opengl needs PyOpenGL
+            QMessageBox.warning(self, "Vista 3D", "La vista 3D requiere PyOpenGL")
+            return
+        L, ok = QInputDialog.getDouble(self, "Vista 3D", "Luz libre (m):", 5.0, 0.5, 30.0, 2)
+        if not ok:
+            return
+        try:
+            model = self.rebar_model(L * 100)
+        except ValueError:
+            QMessageBox.warning(self, "Vista 3D", "Datos de sección no válidos")
+            return
+        if getattr(self, "view_3d", None) is None:
+            self.view_3d = Section3DView(self)
+        self.view_3d.set_rebar(model)
+        self.view_3d.show()
+
     def _on_exportar_cad(self):
         """Handle export button click."""
         from ..graphics.utilities import exportar_cad
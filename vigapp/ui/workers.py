@@ -0,0 +1,128 @@
+"""Background execution of exports on the Qt thread pool."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Any, Callable, Optional, Set
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, Qt, pyqtSignal
+from PyQt5.QtWidgets import QMessageBox, QProgressDialog, QWidget
+
+# Signature of a job: job(snapshot, progress) -> result
+Job = Callable[[Any, Callable[[int, str], None]], Any]
+
+# Tasks kept alive until their completion signal has been delivered
+_ACTIVE: Set["ExportTask"] = set()
+
+
+class ExportCancelled(Exception):
+    """Raised inside a job when the user cancels it."""
+
+
+class WorkerSignals(QObject):
+    """Signals emitted by :class:`ExportTask` from the worker thread."""
+
+    progress = pyqtSignal(int, str)
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+    cancelled = pyqtSignal()
+
+
+class ExportTask(QRunnable):
+    """Run ``job(snapshot, progress)`` on a pool thread.
+
+    The job must only touch ``snapshot`` (plain immutable data) and never
+    Qt widgets or the figures of a window. ``progress(percent, text)``
+    reports advance and raises :class:`ExportCancelled` once
+    :meth:`cancel` has been called.
+    """
+
+    def __init__(self, job: Job, snapshot: Any):
+        super().__init__()
+        self.job = job
+        self.snapshot = snapshot
+        self.signals = WorkerSignals()
+        self._cancel = threading.Event()
+
+    def cancel(self) -> None:
+        """Ask the job to stop at its next progress report."""
+        self._cancel.set()
+
+    def is_cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    def _progress(self, percent: int, text: str = "") -> None:
+        if self._cancel.is_set():
+            raise ExportCancelled()
+        self.signals.progress.emit(int(percent), text)
+
+    def run(self) -> None:
+        try:
+            result = self.job(self.snapshot, self._progress)
+        except ExportCancelled:
+            self.signals.cancelled.emit()
+        except Exception as exc:  # pragma: no cover - reported to the user
+            logging.exception("Export failed")
+            self.signals.failed.emit(str(exc))
+        else:
+            self.signals.finished.emit(result)
+
+
+def start_export(
+    parent: Optional[QWidget],
+    job: Job,
+    snapshot: Any,
+    title: str,
+    *,
+    on_finished: Optional[Callable[[Any], None]] = None,
+    on_done: Optional[Callable[[], None]] = None,
+    pool: Optional[QThreadPool] = None,
+    error_text: str = "No se pudo exportar",
+) -> ExportTask:
+    """Start ``job`` in the background with a non-modal progress dialog.
+
+    ``on_finished`` receives the job result; ``on_done`` runs after any
+    outcome (finished, failed or cancelled), e.g. to enable buttons again.
+    ``error_text`` prefixes the message shown when the job fails.
+    """
+    task = ExportTask(job, snapshot)
+    dialog = QProgressDialog(title, "Cancelar", 0, 100, parent)
+    dialog.setWindowTitle(title)
+    dialog.setWindowModality(Qt.NonModal)
+    dialog.setMinimumDuration(400)
+    dialog.setAutoClose(False)
+    dialog.setAutoReset(False)
+    dialog.setValue(0)
+    dialog.canceled.connect(task.cancel)
+
+    def _progress(percent: int, text: str) -> None:
+        dialog.setValue(percent)
+        if text:
+            dialog.setLabelText(text)
+
+    def _close() -> None:
+        _ACTIVE.discard(task)
+        dialog.canceled.disconnect(task.cancel)
+        dialog.close()
+        dialog.deleteLater()
+        if on_done is not None:
+            on_done()
+
+    def _finished(result: Any) -> None:
+        _close()
+        if on_finished is not None:
+            on_finished(result)
+
+    def _failed(message: str) -> None:
+        _close()
+        QMessageBox.warning(parent, title, f"{error_text}: {message}")
+
+    task.signals.progress.connect(_progress)
+    task.signals.finished.connect(_finished)
+    task.signals.failed.connect(_failed)
+    task.signals.cancelled.connect(_close)
+
+    _ACTIVE.add(task)
+    (pool or QThreadPool.globalInstance()).start(task)
+    return task